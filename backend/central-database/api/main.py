@@ -7,9 +7,12 @@ REST API endpoints for managing timestamped synthetic data across all dashboards
 import os
 import json
 import logging
-from datetime import datetime, timedelta
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
-from flask import Flask, request, jsonify, g
+from flask import Flask, Response, request, jsonify, g
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from functools import wraps
 import jwt
@@ -21,16 +24,43 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.database_manager import DatabaseManager
 from utils.synthetic_data_generator import SyntheticDataGenerator, SyntheticDataConfig
+from utils.series_pool import SeriesPool
+from utils.template_compiler import TemplateCompiler
+from utils.cache import TTLCache
+from utils.leaderboard import LEADERBOARD_SCOPES
+from utils.sse_scoring import score_responses
+from utils.request_timing import RouteLatency, end_request, server_timing_header, start_request, timed
+from utils.unit_of_work import ConnectionUsage, end_unit_of_work
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class TimedJSONProvider(DefaultJSONProvider):
+    """JSON provider whose encoding counts as the request's serialize time"""
+
+    def dumps(self, obj, **kwargs):
+        with timed('serialize'):
+            return super().dumps(obj, **kwargs)
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'auxeira-dev-secret-key-2025')
+app.json = TimedJSONProvider(app)
 CORS(app)
 
+# Per-route latency histograms (GET /api/admin/metrics) and Server-Timing headers
+route_latency = RouteLatency()
+
+# Connection uses and pool checkouts per request (GET /api/admin/metrics)
+connection_usage = ConnectionUsage()
+
+# One connection and transaction per request, committed after the handler (unless it answered 5xx)
+REQUEST_TRANSACTIONS = os.environ.get('REQUEST_TRANSACTIONS', 'true').lower() == 'true'
+
+# Static bearer token accepted by the metrics endpoint, for Prometheus scrapers
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
 # Initialize database manager
 db_manager = DatabaseManager(
     host=os.environ.get('DB_HOST', 'localhost'),
@@ -43,6 +73,33 @@ db_manager = DatabaseManager(
 # Initialize synthetic data generator
 synthetic_generator = SyntheticDataGenerator()
 
+# Pre-generated series for small unseeded requests, refilled in the background
+series_pool = SeriesPool(synthetic_generator)
+
+# Compiled synthetic_data_templates plans, keyed by template id and updated_at
+template_compiler = TemplateCompiler(synthetic_generator.metric_ranges)
+
+# Cache for precomputed portfolio summaries (refreshed by handlers.portfolio_summaries)
+portfolio_summary_cache = TTLCache(ttl_seconds=int(os.environ.get('PORTFOLIO_SUMMARY_CACHE_TTL', 300)))
+
+PORTFOLIO_DIMENSIONS = ('all', 'region', 'industry')
+
+# Maximum entries returned by leaderboard endpoints
+LEADERBOARD_MAX_LIMIT = 100
+
+# Generation requests above this many rows (or with "async": true) are queued as jobs
+SYNTHETIC_ASYNC_THRESHOLD = int(os.environ.get('SYNTHETIC_ASYNC_THRESHOLD', 100000))
+
+# Maximum preview rows returned by a dry run
+SYNTHETIC_PREVIEW_LIMIT = 100
+
+# Maximum actions per batch action request
+ACTION_BATCH_LIMIT = int(os.environ.get('ACTION_BATCH_LIMIT', 1000))
+
+# Maximum startups per SSE batch lookup
+SSE_BATCH_GET_LIMIT = int(os.environ.get('SSE_BATCH_GET_LIMIT', 1000))
+INVESTOR_USER_TYPES = ('venture_capital', 'angel_investor', 'esg_funder', 'impact_investor')
+
 # JWT Configuration
 JWT_EXPIRATION_HOURS = 24
 JWT_ALGORITHM = 'HS256'
@@ -71,12 +128,13 @@ def require_auth(f):
     """Decorator to require authentication for API endpoints"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        auth_header = request.headers.get('Authorization')
-        if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({'error': 'Missing or invalid authorization header'}), 401
-        
-        token = auth_header.split(' ')[1]
-        payload = verify_jwt_token(token)
+        with timed('auth'):
+            auth_header = request.headers.get('Authorization')
+            if not auth_header or not auth_header.startswith('Bearer '):
+                return jsonify({'error': 'Missing or invalid authorization header'}), 401
+            
+            token = auth_header.split(' ')[1]
+            payload = verify_jwt_token(token)
         
         if not payload:
             return jsonify({'error': 'Invalid or expired token'}), 401
@@ -261,19 +319,54 @@ def generate_synthetic_data():
     try:
         data = request.get_json()
         
+        # Optional template: its compiled rules replace the built-in series
+        plan = None
+        defaults = {}
+        template_id = data.get('templateId')
+        if template_id:
+            try:
+                template_id = str(uuid.UUID(str(template_id)))
+            except ValueError:
+                return jsonify({'error': 'templateId must be a UUID'}), 400
+            
+            template = db_manager.get_synthetic_template(template_id)
+            if not template:
+                return jsonify({'error': 'Template not found'}), 404
+            
+            try:
+                plan = template_compiler.get_plan(template)
+            except ValueError as e:
+                return jsonify({'error': f'Invalid template: {e}'}), 400
+            defaults = plan.default_parameters
+        
         # Create configuration
         config = SyntheticDataConfig(
-            user_type=data.get('userType', g.current_user_type),
-            data_type=data.get('dataType', 'metrics'),
-            count=data.get('count', 30),
-            time_range_days=data.get('timeRangeDays', 30),
-            variance=data.get('variance', 0.2),
-            trend=data.get('trend', 'stable'),
+            user_type=plan.user_type if plan else data.get('userType', g.current_user_type),
+            data_type=data.get('dataType', defaults.get('dataType', 'metrics')),
+            count=data.get('count', defaults.get('count', 30)),
+            time_range_days=data.get('timeRangeDays', defaults.get('timeRangeDays', 30)),
+            variance=data.get('variance', defaults.get('variance', 0.2)),
+            trend=data.get('trend', defaults.get('trend', 'stable')),
             seed=data.get('seed')
         )
         
-        # Generate synthetic data
-        synthetic_data = synthetic_generator.generate_data(config)
+        # Dry run: only the preview rows are generated, nothing is stored
+        if data.get('dryRun'):
+            preview_count = data.get('previewCount', 3)
+            if not isinstance(preview_count, int) or not 0 <= preview_count <= SYNTHETIC_PREVIEW_LIMIT:
+                return jsonify({'error': f'previewCount must be an integer between 0 and {SYNTHETIC_PREVIEW_LIMIT}'}), 400
+            
+            preview = synthetic_generator.generate_series(config, 0, preview_count, plan=plan).to_records()
+            return jsonify({
+                'success': True,
+                'data': {
+                    'dryRun': True,
+                    'count': max(0, config.count),
+                    'config': config.__dict__,
+                    'templateId': plan.template_id if plan else None,
+                    'preview': preview
+                }
+            })
         
         # Get user's organization
         org_query = """
@@ -286,22 +379,63 @@ def generate_synthetic_data():
         if org_result:
             org_id = org_result[0]['org_id']
             
-            # Insert generated data
-            success = db_manager.insert_synthetic_data(
-                data=synthetic_data,
-                user_id=g.current_user_id,
-                org_id=org_id
-            )
-            
-            if success:
+            # Large requests run as a job; fixing the seed and time axis now makes the preview match the stored rows
+            if data.get('async') or config.count > SYNTHETIC_ASYNC_THRESHOLD:
+                if config.seed is None:
+                    config.seed = secrets.randbits(53)  # exact in JavaScript numbers
+                series_end = datetime.now(timezone.utc)
+                
+                job_id = db_manager.enqueue_synthetic_job(
+                    g.current_user_id, org_id, config.__dict__, plan.template_id if plan else None, series_end
+                )
+                if not job_id:
+                    return jsonify({'error': 'Failed to queue synthetic data generation'}), 500
+                
+                preview = synthetic_generator.generate_series(config, 0, 3, plan=plan, end=series_end, ids=False).to_records()
+                for record in preview:
+                    record.pop('metric_id')
+                
                 return jsonify({
                     'success': True,
                     'data': {
-                        'generated': len(synthetic_data),
+                        'jobId': job_id,
+                        'status': 'queued',
+                        'statusUrl': f'/api/synthetic/jobs/{job_id}',
                         'config': config.__dict__,
-                        'preview': synthetic_data[:3] if synthetic_data else []
+                        'templateId': plan.template_id if plan else None,
+                        'preview': preview
                     }
-                }), 201
+                }), 202
+            
+            pooled = series_pool.take(config, ids=False) if plan is None else None
+            if pooled is not None:
+                # Small unseeded request: one pre-generated series, one COPY
+                generated = db_manager.copy_synthetic_series([pooled], user_id=g.current_user_id, org_id=org_id)
+                preview = pooled.to_records()[:3]
+            else:
+                # Stream generated chunks straight into the database (bounded memory at any count)
+                seed_sequence = synthetic_generator.series_seed(config)
+                generated = db_manager.copy_synthetic_series(
+                    synthetic_generator.iter_series(config, seed_sequence=seed_sequence, plan=plan, ids=False),
+                    user_id=g.current_user_id,
+                    org_id=org_id
+                )
+                preview = synthetic_generator.generate_series(config, 0, 3, seed_sequence, plan, ids=False).to_records()
+            for record in preview:
+                record.pop('metric_id')  # ids of the stored rows are assigned by the database
+            
+            if plan:
+                db_manager.record_template_usage(plan.template_id)
+            
+            return jsonify({
+                'success': True,
+                'data': {
+                    'generated': generated,
+                    'config': config.__dict__,
+                    'templateId': plan.template_id if plan else None,
+                    'preview': preview
+                }
+            }), 201
         
         return jsonify({'error': 'Failed to generate synthetic data'}), 500
         
@@ -309,6 +443,42 @@ def generate_synthetic_data():
         logger.error(f"Generate synthetic data error: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/synthetic/jobs/<job_id>', methods=['GET'])
+@require_auth
+def get_synthetic_job(job_id):
+    """Get the status and progress of a queued synthetic generation job"""
+    try:
+        try:
+            job_id = str(uuid.UUID(job_id))
+        except ValueError:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        job = db_manager.get_synthetic_job(job_id, g.current_user_id)
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'jobId': str(job['job_id']),
+                'status': job['status'],
+                'templateId': str(job['template_id']) if job['template_id'] else None,
+                'config': job['config'],
+                'rowsTotal': job['rows_total'],
+                'rowsGenerated': job['rows_generated'],
+                'progress': round(job['rows_generated'] / job['rows_total'], 4) if job['rows_total'] else 1.0,
+                'attempts': job['attempts'],
+                'error': job['error'],
+                'createdAt': job['created_at'].isoformat() if job['created_at'] else None,
+                'startedAt': job['started_at'].isoformat() if job['started_at'] else None,
+                'completedAt': job['completed_at'].isoformat() if job['completed_at'] else None
+            }
+        })
+        
+    except Exception as e:
+        logger.error(f"Get synthetic job error: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/api/synthetic/templates', methods=['GET'])
 @require_auth
 def get_synthetic_templates():
@@ -316,9 +486,9 @@ def get_synthetic_templates():
     try:
         query = """
             SELECT template_id, template_name, template_type, user_type, 
-                   description, sample_data, usage_count
+                   description, sample_data, default_parameters, usage_count
             FROM synthetic_data_templates 
-            WHERE is_active = TRUE AND (user_type = %s OR user_type = 'all')
+            WHERE is_active = TRUE AND (user_type::text = %s OR user_type::text = 'all')
             ORDER BY usage_count DESC, template_name
         """
         
@@ -351,30 +521,11 @@ def calculate_sse_score():
             return jsonify({'error': 'Missing startupId or responses'}), 400
         
         # Calculate score (simplified version)
-        total_score = 0
-        component_scores = {}
-        
-        # SSE component weights
-        weights = {
-            'team': 0.25,
-            'market': 0.20,
-            'product': 0.20,
-            'business': 0.15,
-            'financial': 0.10,
-            'traction': 0.10
-        }
-        
-        for component, weight in weights.items():
-            if component in data['responses']:
-                component_responses = data['responses'][component]
-                component_score = sum(component_responses.values()) / len(component_responses) * 100 * weight
-                component_scores[component] = round(component_score, 1)
-                total_score += component_score
-        
+        total_score, component_scores = score_responses(data['responses'])
         total_score = round(total_score, 0)
         
         # Insert SSE score
-        score_id = db_manager.insert_sse_score(
+        score = db_manager.insert_sse_score(
             startup_id=data['startupId'],
             total_score=int(total_score),
             component_scores=component_scores,
@@ -383,14 +534,14 @@ def calculate_sse_score():
             is_synthetic=data.get('isSynthetic', False)
         )
         
-        if score_id:
+        if score:
             return jsonify({
                 'success': True,
                 'data': {
-                    'scoreId': score_id,
+                    'scoreId': score['score_id'],
                     'totalScore': int(total_score),
                     'breakdown': component_scores,
-                    'percentile': min(95, max(5, int(total_score * 1.2))),  # Simplified percentile
+                    'percentile': score['percentile'],
                     'successProbability': round(total_score / 100 * 0.8, 3),
                     'timestamp': datetime.utcnow().isoformat()
                 }
@@ -402,35 +553,155 @@ def calculate_sse_score():
         logger.error(f"Calculate SSE error: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+def format_sse_score(score: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an SSE score row into the API response shape"""
+    return {
+        'currentScore': score['total_score'],
+        'breakdown': score['component_scores'],
+        'version': score['version'],
+        'percentile': score['percentile'],
+        'createdAt': score['created_at'].isoformat() if score['created_at'] else None,
+        'isSynthetic': score['is_synthetic']
+    }
+
 @app.route('/api/sse/score/<startup_id>', methods=['GET'])
 @require_auth
 def get_sse_score(startup_id):
     """Get latest SSE score for a startup"""
     try:
         score = db_manager.get_latest_sse_score(startup_id)
-        
+
         if score:
             return jsonify({
                 'success': True,
-                'data': {
-                    'currentScore': score['total_score'],
-                    'breakdown': score['component_scores'],
-                    'version': score['version'],
-                    'createdAt': score['created_at'].isoformat() if score['created_at'] else None,
-                    'isSynthetic': score['is_synthetic']
-                }
+                'data': format_sse_score(score)
             })
         else:
             return jsonify({'error': 'SSE score not found'}), 404
-            
+
     except Exception as e:
         logger.error(f"Get SSE score error: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/sse/scores:batchGet', methods=['POST'])
+@require_auth
+def batch_get_sse_scores():
+    """Get latest SSE scores for many startups in one request"""
+    try:
+        data = request.get_json() or {}
+        startup_ids = data.get('startupIds')
+
+        if not isinstance(startup_ids, list) or not startup_ids:
+            return jsonify({'error': 'startupIds must be a non-empty list'}), 400
+
+        if len(startup_ids) > SSE_BATCH_GET_LIMIT:
+            return jsonify({'error': f'At most {SSE_BATCH_GET_LIMIT} startupIds per request'}), 400
+
+        try:
+            startup_ids = list(dict.fromkeys(str(uuid.UUID(str(startup_id))) for startup_id in startup_ids))
+        except ValueError:
+            return jsonify({'error': 'startupIds must be UUIDs'}), 400
+
+        scores = db_manager.get_latest_sse_scores(startup_ids)
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'scores': {startup_id: format_sse_score(score) for startup_id, score in scores.items()},
+                'missing': [startup_id for startup_id in startup_ids if startup_id not in scores],
+                'count': len(scores)
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Batch get SSE scores error: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+# =============================================
+# PORTFOLIO AGGREGATE ENDPOINTS
+# =============================================
+
+def _to_float(value):
+    return float(value) if value is not None else None
+
+def format_portfolio_summary(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a portfolio_summaries row into the API response shape"""
+    return {
+        'dimension': row['dimension'],
+        'value': row['dimension_value'] or None,
+        'startupCount': row['startup_count'],
+        'scoredCount': row['scored_count'],
+        'syntheticCount': row['synthetic_count'],
+        'sseScore': {
+            'average': _to_float(row['avg_sse_score']),
+            'min': row['min_sse_score'],
+            'max': row['max_sse_score'],
+            'p25': _to_float(row['p25_sse_score']),
+            'median': _to_float(row['median_sse_score']),
+            'p75': _to_float(row['p75_sse_score']),
+            'distribution': row['score_distribution']
+        },
+        'totalInvested': _to_float(row['total_invested']),
+        'refreshedAt': row['refreshed_at'].isoformat() if row['refreshed_at'] else None
+    }
+
+@app.route('/api/portfolio/summary', methods=['GET'])
+@require_auth
+def get_portfolio_summary():
+    """Get precomputed portfolio statistics by region and industry"""
+    try:
+        scope = request.args.get('scope')
+        if not scope:
+            scope = 'portfolio' if g.current_user_type in INVESTOR_USER_TYPES else 'ecosystem'
+
+        dimension = request.args.get('dimension')
+        if dimension and dimension not in PORTFOLIO_DIMENSIONS:
+            return jsonify({'error': f'Invalid dimension: {dimension}'}), 400
+
+        if scope == 'ecosystem':
+            scope_type, scope_id = 'ecosystem', None
+        elif scope == 'portfolio':
+            scope_id = db_manager.get_primary_org_id(g.current_user_id)
+            if not scope_id:
+                return jsonify({'error': 'User organization not found'}), 400
+            scope_type = 'investor'
+        else:
+            return jsonify({'error': f'Invalid scope: {scope}'}), 400
+
+        cache_key = (scope_type, scope_id, dimension)
+        groups = portfolio_summary_cache.get_or_load(
+            cache_key,
+            lambda: [
+                format_portfolio_summary(row)
+                for row in db_manager.get_portfolio_summaries(scope_type, scope_id, dimension)
+            ]
+        )
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'scope': scope,
+                'groups': groups,
+                'count': len(groups),
+                'refreshedAt': groups[0]['refreshedAt'] if groups else None
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Get portfolio summary error: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 # =============================================
 # GAMIFICATION ENDPOINTS
 # =============================================
 
+def calculate_actual_tokens(base_tokens: int, multipliers: Dict[str, float]) -> int:
+    """Apply token multipliers to the base award (simplified multiplier logic)"""
+    actual_tokens = base_tokens
+    for multiplier_type, value in multipliers.items():
+        actual_tokens = int(actual_tokens * value)
+    return actual_tokens
+
 @app.route('/api/gamification/action', methods=['POST'])
 @require_auth
 def complete_action():
@@ -443,50 +714,34 @@ def complete_action():
             if field not in data:
                 return jsonify({'error': f'Missing required field: {field}'}), 400
         
-        # Calculate actual tokens (simplified multiplier logic)
         base_tokens = data['baseTokens']
         multipliers = data.get('multipliers', {})
-        actual_tokens = base_tokens
-        
-        for multiplier_type, value in multipliers.items():
-            actual_tokens = int(actual_tokens * value)
+        actual_tokens = calculate_actual_tokens(base_tokens, multipliers)
         
-        # Get user's organization
-        org_query = """
-            SELECT org_id FROM user_organizations 
-            WHERE user_id = %s AND is_primary = TRUE
-            LIMIT 1
-        """
-        org_result = db_manager.execute_query(org_query, (g.current_user_id,), fetch=True)
-        
-        if not org_result:
+        # Organization lookup, action insert and profile update share one transaction
+        try:
+            result = db_manager.record_action(
+                user_id=g.current_user_id,
+                action_type=data['actionType'],
+                domain=data['domain'],
+                base_tokens=base_tokens,
+                actual_tokens=actual_tokens,
+                multipliers=multipliers,
+                metadata=data.get('metadata', {}),
+                is_synthetic=data.get('isSynthetic', False)
+            )
+        except ValueError:
             return jsonify({'error': 'User organization not found'}), 400
         
-        startup_id = org_result[0]['org_id']
-        
-        # Insert action
-        action_id = db_manager.insert_action(
-            user_id=g.current_user_id,
-            startup_id=startup_id,
-            action_type=data['actionType'],
-            domain=data['domain'],
-            base_tokens=base_tokens,
-            actual_tokens=actual_tokens,
-            metadata=data.get('metadata', {}),
-            is_synthetic=data.get('isSynthetic', False)
-        )
-        
-        if action_id:
-            # Update gamification profile
-            db_manager.update_gamification_profile(g.current_user_id, actual_tokens)
-            
+        if result:
             return jsonify({
                 'success': True,
                 'data': {
-                    'actionId': action_id,
+                    'actionId': result['action_id'],
                     'tokensAwarded': actual_tokens,
                     'multipliers': multipliers,
-                    'baseTokens': base_tokens
+                    'baseTokens': base_tokens,
+                    'totalTokens': result['total_tokens']
                 }
             }), 201
         else:
@@ -496,6 +751,76 @@ def complete_action():
         logger.error(f"Complete action error: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/gamification/actions:batch', methods=['POST'])
+@require_auth
+def complete_actions_batch():
+    """Record many completed actions (e.g. historical imports) in one transaction"""
+    try:
+        data = request.get_json() or {}
+        items = data.get('actions')
+
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'actions must be a non-empty list'}), 400
+
+        if len(items) > ACTION_BATCH_LIMIT:
+            return jsonify({'error': f'At most {ACTION_BATCH_LIMIT} actions per request'}), 400
+
+        now = datetime.now(timezone.utc)
+        actions = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                return jsonify({'error': f'actions[{index}] must be an object'}), 400
+
+            for field in ['actionType', 'domain', 'baseTokens']:
+                if field not in item:
+                    return jsonify({'error': f'actions[{index}]: missing required field: {field}'}), 400
+
+            completed_at = None
+            if item.get('completedAt'):
+                try:
+                    completed_at = datetime.fromisoformat(str(item['completedAt']))
+                except ValueError:
+                    return jsonify({'error': f'actions[{index}]: completedAt must be an ISO 8601 timestamp'}), 400
+                if completed_at.tzinfo is None:
+                    completed_at = completed_at.replace(tzinfo=timezone.utc)
+                if completed_at > now:
+                    return jsonify({'error': f'actions[{index}]: completedAt cannot be in the future'}), 400
+
+            multipliers = item.get('multipliers', {})
+            actions.append({
+                'user_id': g.current_user_id,
+                'action_type': item['actionType'],
+                'domain': item['domain'],
+                'base_tokens': item['baseTokens'],
+                'actual_tokens': calculate_actual_tokens(item['baseTokens'], multipliers),
+                'multipliers': multipliers,
+                'metadata': item.get('metadata', {}),
+                'is_synthetic': item.get('isSynthetic', False),
+                'completed_at': completed_at
+            })
+
+        try:
+            result = db_manager.record_actions(actions)
+        except ValueError:
+            return jsonify({'error': 'User organization not found'}), 400
+
+        if not result:
+            return jsonify({'error': 'Failed to record actions'}), 500
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'actionIds': result['action_ids'],
+                'count': len(result['action_ids']),
+                'tokensAwarded': sum(action['actual_tokens'] for action in actions),
+                'totalTokens': result['profiles'].get(str(g.current_user_id))
+            }
+        }), 201
+
+    except Exception as e:
+        logger.error(f"Batch complete actions error: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/api/gamification/profile', methods=['GET'])
 @require_auth
 def get_gamification_profile():
@@ -535,6 +860,74 @@ def get_gamification_profile():
         logger.error(f"Get gamification profile error: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/gamification/leaderboard', methods=['GET'])
+@require_auth
+def get_leaderboard():
+    """Get the top of a token leaderboard (global, org or week)"""
+    try:
+        scope = request.args.get('scope', 'global')
+        if scope not in LEADERBOARD_SCOPES:
+            return jsonify({'error': f'Invalid scope: {scope}'}), 400
+
+        limit = max(1, min(int(request.args.get('limit', 10)), LEADERBOARD_MAX_LIMIT))
+
+        db_manager.refresh_leaderboards(wait=False)
+        org_id = db_manager.get_primary_org_id(g.current_user_id) if scope == 'org' else None
+        if scope == 'org' and not org_id:
+            return jsonify({'error': 'User organization not found'}), 400
+
+        board_key = db_manager.leaderboards.board_key(scope, g.current_user_id, org_id)
+        entries = db_manager.leaderboards.top(scope, board_key, limit)
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'scope': scope,
+                'board': board_key or None,
+                'entries': entries,
+                'count': len(entries)
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Get leaderboard error: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/gamification/leaderboard/me', methods=['GET'])
+@require_auth
+def get_my_leaderboard_rank():
+    """Get the authenticated user's rank and neighbours on a leaderboard"""
+    try:
+        scope = request.args.get('scope', 'global')
+        if scope not in LEADERBOARD_SCOPES:
+            return jsonify({'error': f'Invalid scope: {scope}'}), 400
+
+        radius = max(0, min(int(request.args.get('radius', 5)), LEADERBOARD_MAX_LIMIT))
+
+        db_manager.refresh_leaderboards(wait=False)
+        org_id = db_manager.get_primary_org_id(g.current_user_id) if scope == 'org' else None
+        if scope == 'org' and not org_id:
+            return jsonify({'error': 'User organization not found'}), 400
+
+        board_key = db_manager.leaderboards.board_key(scope, g.current_user_id, org_id)
+        standing = db_manager.leaderboards.around(scope, board_key, g.current_user_id, radius)
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'scope': scope,
+                'board': board_key or None,
+                'rank': standing['rank'] if standing else None,
+                'tokens': standing['tokens'] if standing else 0,
+                'totalEntries': standing['totalEntries'] if standing else None,
+                'neighbours': standing['neighbours'] if standing else []
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Get leaderboard rank error: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 # =============================================
 # ADMIN AND UTILITY ENDPOINTS
 # =============================================
@@ -555,6 +948,45 @@ def get_database_stats():
         logger.error(f"Get stats error: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/admin/query-stats', methods=['GET'])
+@require_auth
+def get_query_stats():
+    """Per-statement latency, rows and pool wait from the query profiler (admin only)"""
+    try:
+        limit = min(int(request.args.get('limit', 50)), 1000)
+        report = db_manager.get_query_report(limit)
+        if report is None:
+            return jsonify({'error': 'Query profiling is disabled (set QUERY_PROFILING=true)'}), 404
+        
+        if request.args.get('reset', 'false').lower() == 'true':
+            db_manager.profiler.reset()
+        
+        return jsonify({
+            'success': True,
+            'data': report
+        })
+        
+    except Exception as e:
+        logger.error(f"Get query stats error: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/admin/metrics', methods=['GET'])
+def get_request_metrics():
+    """Per-route latency histograms and connection use in Prometheus text format, or summaries with ?format=json (admin only)"""
+    auth_header = request.headers.get('Authorization', '')
+    token = auth_header[len('Bearer '):] if auth_header.startswith('Bearer ') else None
+    if not token or not ((METRICS_TOKEN and secrets.compare_digest(token, METRICS_TOKEN)) or verify_jwt_token(token)):
+        return jsonify({'error': 'Missing or invalid authorization header'}), 401
+    
+    if request.args.get('format') == 'json':
+        return jsonify({
+            'success': True,
+            'data': route_latency.summary(),
+            'connections': connection_usage.summary()
+        })
+    
+    return Response(route_latency.prometheus() + connection_usage.prometheus(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/admin/cleanup', methods=['POST'])
 @require_auth
 def cleanup_old_data():
@@ -617,7 +1049,57 @@ def internal_error(error):
 # APPLICATION STARTUP
 # =============================================
 
-@app.before_first_request
+_initialized = False
+
+@app.before_request
+def start_request_timing():
+    """Initialize the application on the first request and start timing this one"""
+    global _initialized
+    if not _initialized:
+        _initialized = True
+        initialize_app()
+    start_request()
+
+@app.after_request
+def record_request_timing(response):
+    """Record the request's phase timings and report them in a Server-Timing header"""
+    timings = end_request()
+    if timings is not None:
+        phases = timings.finish()
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        route_latency.observe(route, request.method, phases)
+        response.headers['Server-Timing'] = server_timing_header(phases)
+    return response
+
+@app.before_request
+def begin_unit_of_work():
+    """Bind the request's unit of work: its connection is checked out on the first query"""
+    g.unit_of_work = db_manager.begin_unit_of_work(shared=REQUEST_TRANSACTIONS)
+
+@app.after_request
+def finish_unit_of_work(response):
+    """Commit the request's database work, or roll it back on a server error (runs before timing is recorded)"""
+    unit = g.pop('unit_of_work', None)
+    if unit is not None:
+        try:
+            with timed('db'):
+                unit.finish(commit=response.status_code < 500)
+        finally:
+            end_unit_of_work()
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            connection_usage.observe(route, request.method, unit)
+    return response
+
+@app.teardown_request
+def release_unit_of_work(error):
+    """Roll back a unit of work that after_request did not finish"""
+    unit = g.pop('unit_of_work', None)
+    if unit is not None:
+        try:
+            unit.finish(commit=False)
+        finally:
+            end_unit_of_work()
+
 def initialize_app():
     """Initialize application on first request"""
     logger.info("Initializing Auxeira Central Database API")
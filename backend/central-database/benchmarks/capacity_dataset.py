@@ -0,0 +1,739 @@
+#!/usr/bin/env python3
+"""
+Capacity test dataset builder
+Loads a production-shaped dataset at a chosen scale: users, organizations, memberships, versioned SSE scores,
+actions, gamification profiles, investments, partnerships and synthetic dashboard metrics, with power-law
+activity per user and referential integrity throughout. Shards load in parallel worker processes with COPY.
+
+Usage: DB_HOST=... DB_NAME=... python benchmarks/capacity_dataset.py [--users 100000] [--metric-rows 10000000]
+           [--workers 8] [--skew 1.16] [--dry-run]
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import psycopg2
+from werkzeug.security import generate_password_hash
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), 'load'))
+
+from seed import ORG_TYPES, USER_TYPE_MIX
+from sessions import FOUNDER_ACTIONS
+from utils.ids import uuid7_batch_bytes, uuid7_from_timestamps, uuid_strings
+from utils.sse_scoring import COMPONENT_WEIGHTS, score_responses
+from utils.synthetic_data_generator import SyntheticDataGenerator, SyntheticDataConfig, SyntheticSeries
+
+EMAIL_DOMAIN = 'capacity.auxeira.test'
+PASSWORD = 'capacity-dataset'
+ALGORITHM = 'capacity_dataset_v1'
+
+FOUNDER = 'startup_founder'
+INVESTOR_TYPES = ('venture_capital', 'angel_investor', 'esg_funder', 'impact_investor')
+PARTNER_TYPES = ('corporate_partner', 'government')
+
+# Entity kinds encoded in index-derived ids
+USER_KIND = 1
+ORG_KIND = 2
+
+# Loaded in this order; foreign keys and secondary indexes of these tables can be deferred
+LOADED_TABLES = (
+    'users', 'organizations', 'user_organizations', 'sse_scores', 'sse_current_scores',
+    'actions', 'gamification_profiles', 'investments', 'partnerships', 'dashboard_metrics'
+)
+
+# Users with at most this many metric rows are generated together, one vectorized block per (type, rows)
+METRIC_BLOCK_MAX_ROWS = 5000
+METRIC_CHUNK_ROWS = 250_000
+
+TRENDS = ('improving', 'stable', 'volatile', 'declining')
+TREND_SHARES = (0.4, 0.3, 0.2, 0.1)
+INDUSTRIES = ('fintech', 'healthtech', 'edtech', 'cleantech', 'agritech', 'saas', 'marketplace', 'deeptech')
+REGIONS = ('africa', 'europe', 'north_america', 'asia', 'latin_america', 'middle_east')
+ROUNDS = ('pre_seed', 'seed', 'series_a', 'series_b')
+ROUND_SHARES = (0.35, 0.4, 0.18, 0.07)
+INVESTMENT_TYPES = ('equity', 'safe', 'convertible_note')
+# Median check size per investor type (USD); amounts are log-normal around it
+CHECK_SIZES = {'venture_capital': 1_500_000, 'angel_investor': 50_000, 'esg_funder': 400_000, 'impact_investor': 250_000}
+PARTNERSHIP_TYPES = {
+    'corporate_partner': ('pilot', 'perk', 'procurement', 'co_development'),
+    'government': ('grant', 'accelerator', 'procurement')
+}
+
+NULL = '\\N'
+
+
+def allocate(total: int, weights: np.ndarray) -> np.ndarray:
+    """Split total into integers proportional to weights (largest remainder)"""
+    exact = weights / weights.sum() * total
+    parts = np.floor(exact).astype(np.int64)
+    remainder = int(total - parts.sum())
+    if remainder:
+        parts[np.argsort(exact - parts)[-remainder:]] += 1
+    return parts
+
+
+def timestamp_text(values: np.ndarray) -> List[str]:
+    return np.datetime_as_string(values.astype('datetime64[us]'), unit='us', timezone='UTC').tolist()
+
+
+def line(*values: Any) -> str:
+    """One COPY text row (values never contain tabs, newlines or backslashes)"""
+    return '\t'.join(NULL if value is None else str(value) for value in values) + '\n'
+
+
+def copy_lines(cursor, table: str, columns: Tuple[str, ...], lines: List[str]) -> int:
+    if lines:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", io.StringIO(''.join(lines)))
+    return len(lines)
+
+
+class DatasetPlan:
+    """Deterministic layout of the dataset: user types, activity weights, metric rows per user and shards
+
+    Every worker rebuilds the plan from the same settings, so a shard can reference users and
+    organizations of other shards through their index-derived ids without shared state.
+    """
+
+    def __init__(self, settings: Dict[str, Any]):
+        self.settings = settings
+        self.seed = settings['seed']
+        self.users = settings['users']
+        rng = np.random.default_rng(np.random.SeedSequence([self.seed, 0]))
+
+        self.type_names = [user_type for user_type, _ in USER_TYPE_MIX]
+        shares = np.array([share for _, share in USER_TYPE_MIX])
+        self.types = rng.choice(len(self.type_names), self.users, p=shares / shares.sum()).astype(np.int8)
+
+        # Pareto activity weights: shape 1.16 gives the most active 20% of users about 80% of the activity
+        self.weights = rng.pareto(settings['skew'], self.users) + 1
+        self.relative_weights = self.weights / self.weights.mean()
+        self.metric_rows = allocate(settings['metric_rows'], self.weights)
+
+        self.startups = np.flatnonzero(self.types == self.type_names.index(FOUNDER))
+        startup_weights = self.weights[self.startups]
+        self.startup_cdf = np.cumsum(startup_weights) / startup_weights.sum() if len(self.startups) else None
+
+        self.end = np.datetime64(settings['end'], 'us')
+        self.start = self.end - np.timedelta64(settings['days'], 'D')
+        # Signups spread over the first 90% of the history
+        self.created = self.start + (rng.random(self.users) * settings['days'] * 0.9 * 86400e6).astype('timedelta64[us]')
+
+        self.id_prefix = np.random.SeedSequence([self.seed, 1]).generate_state(2, np.uint32).view(np.uint8)[:6]
+
+    def type_of(self, index: int) -> str:
+        return self.type_names[self.types[index]]
+
+    def entity_ids(self, kind: int, indices: np.ndarray) -> List[str]:
+        """Ids of users or organizations by index: a seed-derived prefix, the kind and the index (UUID version 4 layout)"""
+        raw = np.zeros((len(indices), 16), dtype=np.uint8)
+        raw[:, :6] = self.id_prefix
+        raw[:, 6] = 0x40 | kind
+        raw[:, 8:] = np.asarray(indices, dtype='>u8').view(np.uint8).reshape(-1, 8)
+        raw[:, 8] |= 0x80
+        return uuid_strings(raw)
+
+    def pick_startups(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Startup user indices drawn in proportion to their activity (preferential attachment)"""
+        if self.startup_cdf is None or count == 0:
+            return np.empty(0, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self.startup_cdf, rng.random(count), side='right'), len(self.startups) - 1)
+        return self.startups[positions]
+
+    def activity_counts(self, rng: np.random.Generator, indices: np.ndarray, mean: float, cap: int) -> np.ndarray:
+        """Poisson counts per user with mean proportional to the user's activity weight"""
+        return np.minimum(rng.poisson(mean * self.relative_weights[indices]), cap)
+
+    def times_after(self, rng: np.random.Generator, owners: np.ndarray, recency: float = 0.5) -> np.ndarray:
+        """One timestamp per owner between its signup and the end, leaning recent"""
+        created = self.created[owners]
+        span = (self.end - created).astype(np.int64)
+        return created + (span * rng.random(len(owners)) ** recency).astype('timedelta64[us]')
+
+    def shards(self, shard_rows: int, shard_users: int) -> List[Tuple[int, int]]:
+        """Contiguous user ranges holding about shard_rows metric rows and at most shard_users users"""
+        cumulative = np.cumsum(self.metric_rows)
+        bounds = set(np.searchsorted(cumulative, np.arange(shard_rows, cumulative[-1], shard_rows), side='right').tolist())
+        bounds.update(range(shard_users, self.users, shard_users))
+        bounds = sorted(bound for bound in bounds if 0 < bound < self.users)
+        edges = [0] + bounds + [self.users]
+        return [(lo, hi) for lo, hi in zip(edges, edges[1:]) if hi > lo]
+
+    def describe(self) -> List[str]:
+        counts = np.bincount(self.types, minlength=len(self.type_names))
+        ordered = np.sort(self.metric_rows)[::-1]
+        top = max(1, self.users // 100)
+        return [
+            f"Users: {self.users:,} (" + ', '.join(f"{name} {count:,}" for name, count in zip(self.type_names, counts)) + ')',
+            f"Metric rows: {int(self.metric_rows.sum()):,}; most active user {int(ordered[0]):,}, "
+            f"median {int(np.median(self.metric_rows)):,}, top 1% hold {ordered[:top].sum() / max(ordered.sum(), 1):.0%}"
+        ]
+
+
+def connect(settings: Dict[str, Any]):
+    conn = psycopg2.connect(**settings['db'])
+    with conn.cursor() as cursor:
+        cursor.execute("SET synchronous_commit = off")
+        cursor.execute("SET TIME ZONE 'UTC'")
+    conn.commit()
+    return conn
+
+
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(settings: Dict[str, Any]) -> None:
+    plan = DatasetPlan(settings)
+    generator = SyntheticDataGenerator()
+    generator.timestamp = plan.end.astype(datetime)
+    _worker.update(plan=plan, generator=generator, conn=connect(settings),
+                   password_hash=generate_password_hash(PASSWORD))
+
+
+def _run_shard(phase: str, shard: Tuple[int, int]) -> Dict[str, int]:
+    conn = _worker['conn']
+    try:
+        with conn.cursor() as cursor:
+            loader = load_entities if phase == 'entities' else load_activity
+            counts = loader(cursor, _worker['plan'], shard)
+        conn.commit()
+        return counts
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def _run_entities(shard: Tuple[int, int]) -> Dict[str, int]:
+    return _run_shard('entities', shard)
+
+
+def _run_activity(shard: Tuple[int, int]) -> Dict[str, int]:
+    return _run_shard('activity', shard)
+
+
+def shard_rng(plan: DatasetPlan, phase: int, lo: int) -> np.random.Generator:
+    return np.random.default_rng(np.random.SeedSequence([plan.seed, 2, phase, lo]))
+
+
+def load_entities(cursor, plan: DatasetPlan, shard: Tuple[int, int]) -> Dict[str, int]:
+    """Users and their primary organizations"""
+    lo, hi = shard
+    rng = shard_rng(plan, 0, lo)
+    indices = np.arange(lo, hi)
+    user_ids = plan.entity_ids(USER_KIND, indices)
+    org_ids = plan.entity_ids(ORG_KIND, indices)
+    created = timestamp_text(plan.created[lo:hi])
+    last_login = timestamp_text(plan.times_after(rng, indices, recency=0.2))
+    logins = rng.poisson(5 * plan.relative_weights[lo:hi]) + 1
+    industries = rng.integers(0, len(INDUSTRIES), hi - lo)
+    regions = rng.integers(0, len(REGIONS), hi - lo)
+    password_hash = _worker['password_hash']
+
+    users, organizations = [], []
+    for offset, index in enumerate(indices.tolist()):
+        user_type = plan.type_of(index)
+        weight = plan.relative_weights[index]
+        users.append(line(
+            user_ids[offset], f"capacity-{plan.seed}-{index}@{EMAIL_DOMAIN}", password_hash, user_type,
+            json.dumps({'first_name': 'Capacity', 'last_name': f"User {index}"}), 't', 't',
+            last_login[offset], logins[offset], created[offset], created[offset]
+        ))
+        organizations.append(line(
+            org_ids[offset], f"Capacity Org {plan.seed}-{index}", ORG_TYPES[user_type],
+            INDUSTRIES[industries[offset]], REGIONS[regions[offset]],
+            'large' if weight > 10 else 'medium' if weight > 2 else 'small', created[offset], created[offset]
+        ))
+
+    return {
+        'users': copy_lines(cursor, 'users', (
+            'user_id', 'email', 'password_hash', 'user_type', 'profile', 'is_active', 'email_verified',
+            'last_login', 'login_count', 'created_at', 'updated_at'
+        ), users),
+        'organizations': copy_lines(cursor, 'organizations', (
+            'org_id', 'name', 'org_type', 'industry', 'region', 'size_category', 'created_at', 'updated_at'
+        ), organizations)
+    }
+
+
+def load_activity(cursor, plan: DatasetPlan, shard: Tuple[int, int]) -> Dict[str, int]:
+    """Everything that references users and organizations, for the users of one shard"""
+    lo, hi = shard
+    rng = shard_rng(plan, 1, lo)
+    indices = np.arange(lo, hi)
+    types = plan.types[lo:hi]
+    founders = indices[types == plan.type_names.index(FOUNDER)]
+    investors = indices[np.isin(types, [plan.type_names.index(name) for name in INVESTOR_TYPES])]
+    partners = indices[np.isin(types, [plan.type_names.index(name) for name in PARTNER_TYPES])]
+
+    counts = {'user_organizations': load_memberships(cursor, plan, rng, indices)}
+    counts.update(load_scores(cursor, plan, rng, founders))
+    counts.update(load_actions(cursor, plan, rng, founders))
+    counts['investments'] = load_investments(cursor, plan, rng, investors)
+    counts['partnerships'] = load_partnerships(cursor, plan, rng, partners)
+    counts['dashboard_metrics'] = load_metrics(cursor, plan, rng, lo, hi)
+    return counts
+
+
+def load_memberships(cursor, plan: DatasetPlan, rng: np.random.Generator, indices: np.ndarray) -> int:
+    """Primary organization of every user, plus advisor seats at other (mostly active) startups"""
+    user_ids = plan.entity_ids(USER_KIND, indices)
+    created = timestamp_text(plan.created[indices])
+    lines = [
+        line(user_id, org_id, 'owner', 't', joined)
+        for user_id, org_id, joined in zip(user_ids, plan.entity_ids(ORG_KIND, indices), created)
+    ]
+
+    members = indices[rng.random(len(indices)) < plan.settings['membership_share']]
+    startups = plan.pick_startups(rng, len(members))
+    keep = startups != members
+    members, startups = members[keep], startups[keep]
+    joined = timestamp_text(plan.times_after(rng, np.maximum(members, startups)))
+    lines.extend(
+        line(user_id, org_id, 'advisor', 'f', joined_at)
+        for user_id, org_id, joined_at in zip(plan.entity_ids(USER_KIND, members), plan.entity_ids(ORG_KIND, startups), joined)
+    )
+    return copy_lines(cursor, 'user_organizations', ('user_id', 'org_id', 'role', 'is_primary', 'joined_at'), lines)
+
+
+def load_scores(cursor, plan: DatasetPlan, rng: np.random.Generator, founders: np.ndarray) -> Dict[str, int]:
+    """Versioned SSE scores of each founder's startup, from a drifting latent quality, and the current score"""
+    versions = plan.activity_counts(rng, founders, plan.settings['score_versions'] - 1, 500) + 1
+    owners = np.repeat(founders, versions)
+    # Versions of a startup in time order (owners are already grouped)
+    times = plan.times_after(rng, owners, recency=1.0)
+    times = times[np.lexsort((times, owners))]
+    score_ids = uuid_strings(uuid7_from_timestamps(times, rng.integers(0, 256, (len(owners), 16), dtype=np.uint8)))
+    created = timestamp_text(times)
+    startup_ids = plan.entity_ids(ORG_KIND, founders)
+    user_ids = plan.entity_ids(USER_KIND, founders)
+    components = list(COMPONENT_WEIGHTS)
+
+    scores, current = [], []
+    position = 0
+    for offset, count in enumerate(versions.tolist()):
+        quality = rng.uniform(0.35, 0.85)
+        for version in range(1, count + 1):
+            quality = min(max(quality + rng.normal(0.01, 0.05), 0.05), 0.98)
+            answers = np.clip(quality + rng.normal(0, 0.12, (len(components), 3)), 0, 1).round(2)
+            responses = {
+                component: {f"q{i + 1}": float(value) for i, value in enumerate(row)}
+                for component, row in zip(components, answers)
+            }
+            total, component_scores = score_responses(responses)
+            total = int(round(total))
+            row = (
+                score_ids[position], startup_ids[offset], version, total, json.dumps(component_scores),
+                f"{total / 100 * 0.8:.4f}", 't', created[position], user_ids[offset]
+            )
+            scores.append(line(*row[:5], json.dumps(responses), *row[5:7], ALGORITHM, *row[7:]))
+            if version == count:
+                current.append(line(row[1], row[0], version, total, row[4], *row[5:], created[position]))
+            position += 1
+
+    return {
+        'sse_scores': copy_lines(cursor, 'sse_scores', (
+            'score_id', 'startup_id', 'version', 'total_score', 'component_scores', 'responses',
+            'success_probability', 'is_synthetic', 'synthetic_algorithm', 'created_at', 'created_by'
+        ), scores),
+        'sse_current_scores': copy_lines(cursor, 'sse_current_scores', (
+            'startup_id', 'score_id', 'version', 'total_score', 'component_scores',
+            'success_probability', 'is_synthetic', 'created_at', 'created_by', 'updated_at'
+        ), current)
+    }
+
+
+def load_actions(cursor, plan: DatasetPlan, rng: np.random.Generator, founders: np.ndarray) -> Dict[str, int]:
+    """Founders' completed actions and the gamification profiles that total them"""
+    counts = plan.activity_counts(rng, founders, plan.settings['actions_per_founder'], 100_000)
+    owners = np.repeat(np.arange(len(founders)), counts)
+    times = plan.times_after(rng, founders[owners])
+    kinds = rng.integers(0, len(FOUNDER_ACTIONS), len(owners))
+    multipliers = rng.uniform(1.0, 1.5, len(owners)).round(2)
+    base_tokens = np.array([tokens for _, _, tokens in FOUNDER_ACTIONS])[kinds]
+    actual_tokens = (base_tokens * multipliers).astype(np.int64)
+    verified = rng.random(len(owners)) < 0.8
+
+    action_ids = uuid_strings(uuid7_from_timestamps(times, rng.integers(0, 256, (len(owners), 16), dtype=np.uint8)))
+    completed = timestamp_text(times)
+    user_ids = plan.entity_ids(USER_KIND, founders)
+    startup_ids = plan.entity_ids(ORG_KIND, founders)
+
+    actions = [
+        line(
+            action_id, user_ids[owner], startup_ids[owner], FOUNDER_ACTIONS[kind][0], FOUNDER_ACTIONS[kind][1],
+            FOUNDER_ACTIONS[kind][2], tokens, json.dumps({'streak': multiplier}),
+            'verified' if is_verified else 'pending', 'completed', 't', completed_at, completed_at
+        )
+        for action_id, owner, kind, multiplier, tokens, is_verified, completed_at in zip(
+            action_ids, owners.tolist(), kinds.tolist(), multipliers.tolist(), actual_tokens.tolist(),
+            verified.tolist(), completed
+        )
+    ]
+
+    # Profiles: token totals, this week's actions and the last active day per founder
+    # (numpy weeks start on Thursdays, so Monday is 4 days later)
+    week_start = plan.end.astype('datetime64[W]').astype('datetime64[us]') + np.timedelta64(4, 'D')
+    if week_start > plan.end:
+        week_start -= np.timedelta64(7, 'D')
+    tokens = np.bincount(owners, weights=actual_tokens, minlength=len(founders)).astype(np.int64)
+    this_week = np.bincount(owners[times >= week_start], minlength=len(founders))
+    last_action = np.full(len(founders), np.iinfo(np.int64).min)
+    np.maximum.at(last_action, owners, times.astype(np.int64))
+    streaks = np.minimum(rng.poisson(3 * plan.relative_weights[founders]), 52)
+    created = timestamp_text(plan.created[founders])
+    now = timestamp_text(np.array([plan.end]))[0]
+
+    profiles = []
+    for offset in range(len(founders)):
+        last = str(np.datetime64(int(last_action[offset]), 'us').astype('datetime64[D]')) if counts[offset] else None
+        profiles.append(line(
+            user_ids[offset], startup_ids[offset], tokens[offset], tokens[offset], 0,
+            streaks[offset], max(streaks[offset], int(streaks[offset] * 1.5)), last, this_week[offset], last,
+            f"{min(100.0, 12 * np.log1p(counts[offset])):.2f}", 't', 'power_law', created[offset], now
+        ))
+
+    return {
+        'actions': copy_lines(cursor, 'actions', (
+            'action_id', 'user_id', 'startup_id', 'action_type', 'domain', 'base_tokens', 'actual_tokens',
+            'multipliers', 'verification_status', 'status', 'is_synthetic', 'completed_at', 'created_at'
+        ), actions),
+        'gamification_profiles': copy_lines(cursor, 'gamification_profiles', (
+            'user_id', 'startup_id', 'total_tokens', 'lifetime_tokens', 'tokens_spent', 'current_streak',
+            'longest_streak', 'last_action_date', 'actions_this_week', 'last_active_date', 'activity_score',
+            'is_synthetic', 'synthetic_behavior_pattern', 'created_at', 'updated_at'
+        ), profiles)
+    }
+
+
+def load_investments(cursor, plan: DatasetPlan, rng: np.random.Generator, investors: np.ndarray) -> int:
+    """Investments of investor organizations, concentrated on the most active startups"""
+    counts = plan.activity_counts(rng, investors, plan.settings['investments_per_investor'], 5000)
+    owners = np.repeat(investors, counts)
+    startups = plan.pick_startups(rng, len(owners))
+    dates = timestamp_text(plan.times_after(rng, np.maximum(owners, startups)))
+    medians = np.array([CHECK_SIZES[plan.type_of(owner)] for owner in owners.tolist()], dtype=np.float64)
+    amounts = np.minimum(medians * rng.lognormal(0, 0.8, len(owners)), 5e8).round(2)
+    equity = rng.uniform(0.02, 0.25, len(owners)).round(4)
+    rounds = rng.choice(len(ROUNDS), len(owners), p=ROUND_SHARES)
+    kinds = rng.integers(0, len(INVESTMENT_TYPES), len(owners))
+    exited = rng.random(len(owners)) < 0.1
+
+    lines = [
+        line(investor_id, startup_id, INVESTMENT_TYPES[kind], ROUNDS[round_index], f"{amount:.2f}",
+             f"{amount / share:.2f}", f"{share:.4f}", date[:10], 'exited' if is_exited else 'active', 't', date, date)
+        for investor_id, startup_id, kind, round_index, amount, share, date, is_exited in zip(
+            plan.entity_ids(ORG_KIND, owners), plan.entity_ids(ORG_KIND, startups), kinds.tolist(), rounds.tolist(),
+            amounts.tolist(), equity.tolist(), dates, exited.tolist()
+        )
+    ]
+    return copy_lines(cursor, 'investments', (
+        'investor_id', 'startup_id', 'investment_type', 'round_name', 'amount', 'valuation', 'equity_percentage',
+        'investment_date', 'status', 'is_synthetic', 'created_at', 'updated_at'
+    ), lines)
+
+
+def load_partnerships(cursor, plan: DatasetPlan, rng: np.random.Generator, partners: np.ndarray) -> int:
+    """Corporate and government partnerships with startups"""
+    counts = plan.activity_counts(rng, partners, plan.settings['partnerships_per_partner'], 5000)
+    owners = np.repeat(partners, counts)
+    startups = plan.pick_startups(rng, len(owners))
+    starts = plan.times_after(rng, np.maximum(owners, startups))
+    ends = starts + rng.integers(180, 730, len(owners)).astype('timedelta64[D]')
+    ended = (ends < plan.end).tolist()
+    priorities = rng.choice(3, len(owners), p=(0.2, 0.6, 0.2))
+    kinds = rng.random(len(owners))
+
+    lines = []
+    for partner_id, startup_id, owner, start, end, is_ended, priority, kind in zip(
+            plan.entity_ids(ORG_KIND, owners), plan.entity_ids(ORG_KIND, startups), owners.tolist(),
+            timestamp_text(starts), timestamp_text(ends), ended, priorities.tolist(), kinds.tolist()):
+        partnership_types = PARTNERSHIP_TYPES[plan.type_of(owner)]
+        partnership_type = partnership_types[int(kind * len(partnership_types))]
+        lines.append(line(
+            partner_id, startup_id, partnership_type, f"{partnership_type.replace('_', ' ').title()} {owner}",
+            'completed' if is_ended else 'active', ('high', 'medium', 'low')[priority],
+            start[:10], end[:10], 't', start, start
+        ))
+    return copy_lines(cursor, 'partnerships', (
+        'partner_id', 'startup_id', 'partnership_type', 'partnership_name', 'status', 'priority',
+        'start_date', 'end_date', 'is_synthetic', 'created_at', 'updated_at'
+    ), lines)
+
+
+METRIC_COLUMNS = (
+    'metric_id', 'user_id', 'org_id', 'dashboard_type', 'metric_name', 'metric_value',
+    'metric_timestamp', 'is_synthetic', 'synthetic_algorithm', 'synthetic_trend', 'created_at'
+)
+
+
+def metric_lines(series: SyntheticSeries, owners: List[Tuple[str, str]], trend: str, created_at: str) -> List[str]:
+    """COPY rows of series, whose consecutive rows belong to owners[i] (user_id, org_id), one per row"""
+    suffix = f"\tt\t{series.synthetic_algorithm}\t{trend}\t{created_at}\n"
+    dashboard_type = series.dashboard_type
+    return [
+        f"{metric_id}\t{user_id}\t{org_id}\t{dashboard_type}\tsynthetic_metrics\t{metrics}\t{timestamp}{suffix}"
+        for metric_id, (user_id, org_id), metrics, timestamp in zip(
+            series.metric_id_strings(), owners, series.metrics_json(), series.timestamp_strings()
+        )
+    ]
+
+
+def load_metrics(cursor, plan: DatasetPlan, rng: np.random.Generator, lo: int, hi: int) -> int:
+    """Synthetic dashboard series of the shard's users, copied in chunks of about METRIC_CHUNK_ROWS rows
+
+    Users with few rows are generated together with generate_block, one pass per (type, rows);
+    larger series are generated in slices with generate_series.
+    """
+    generator = _worker['generator']
+    settings = plan.settings
+    created_at = timestamp_text(np.array([plan.end]))[0]
+    user_ids = plan.entity_ids(USER_KIND, np.arange(lo, hi))
+    org_ids = plan.entity_ids(ORG_KIND, np.arange(lo, hi))
+    rows = plan.metric_rows[lo:hi]
+    trends = rng.choice(len(TRENDS), hi - lo, p=TREND_SHARES)
+
+    pending: List[str] = []
+    loaded = 0
+
+    def flush(force: bool = False) -> None:
+        nonlocal pending, loaded
+        if pending and (force or len(pending) >= METRIC_CHUNK_ROWS):
+            loaded += copy_lines(cursor, 'dashboard_metrics', METRIC_COLUMNS, pending)
+            pending = []
+
+    # Small series: one block per (type, rows, trend)
+    small = np.flatnonzero((rows > 0) & (rows <= METRIC_BLOCK_MAX_ROWS))
+    groups: Dict[Tuple[int, int, int], List[int]] = {}
+    for offset in small.tolist():
+        groups.setdefault((int(plan.types[lo + offset]), int(rows[offset]), int(trends[offset])), []).append(offset)
+
+    for number, ((type_index, count, trend_index), offsets) in enumerate(sorted(groups.items())):
+        config = SyntheticDataConfig(plan.type_names[type_index], 'metrics', count, settings['days'], 0.2, TRENDS[trend_index])
+        algorithm, metrics = generator.generate_block(
+            config, len(offsets), np.random.SeedSequence([plan.seed, 3, lo, number])
+        )
+        timestamps = np.tile(generator.timestamp_array(count, settings['days']), len(offsets))
+        series = SyntheticSeries(
+            dashboard_type=config.user_type,
+            synthetic_algorithm=algorithm,
+            metric_ids=uuid7_batch_bytes(len(timestamps)),
+            timestamps=timestamps,
+            metrics={name: values.reshape(-1) for name, values in metrics.items()}
+        )
+        owners = [(user_ids[offset], org_ids[offset]) for offset in offsets for _ in range(count)]
+        pending.extend(metric_lines(series, owners, config.trend, created_at))
+        flush()
+
+    # Large series: sliced, each slice its own COPY
+    for offset in np.flatnonzero(rows > METRIC_BLOCK_MAX_ROWS).tolist():
+        count = int(rows[offset])
+        config = SyntheticDataConfig(plan.type_of(lo + offset), 'metrics', count, settings['days'], 0.2,
+                                     TRENDS[trends[offset]])
+        seed_sequence = np.random.SeedSequence([plan.seed, 4, lo + offset])
+        for start in range(0, count, METRIC_CHUNK_ROWS):
+            series = generator.generate_series(config, start, start + METRIC_CHUNK_ROWS, seed_sequence)
+            pending.extend(metric_lines(series, [(user_ids[offset], org_ids[offset])] * len(series),
+                                        config.trend, created_at))
+            flush()
+
+    flush(force=True)
+    return loaded
+
+
+def deferred_ddl(cursor) -> Tuple[List[str], List[str], List[Tuple[str, str]]]:
+    """(drop statements, index definitions, (table, foreign key constraint)) for the loaded tables
+
+    Primary keys and unique constraints stay: they guard the load and serve foreign key validation.
+    """
+    cursor.execute("""
+        SELECT conrelid::regclass::text AS table_name, quote_ident(conname) AS name, pg_get_constraintdef(oid) AS definition
+        FROM pg_constraint
+        WHERE contype = 'f' AND conrelid = ANY(%s::regclass[])
+        ORDER BY 1, 2
+    """, (list(LOADED_TABLES),))
+    foreign_keys = cursor.fetchall()
+    cursor.execute("""
+        SELECT i.indexrelid::regclass::text AS name, pg_get_indexdef(i.indexrelid) AS definition
+        FROM pg_index i
+        WHERE i.indrelid = ANY(%s::regclass[])
+          AND NOT i.indisprimary AND NOT i.indisunique
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid AND c.contype <> 'f')
+        ORDER BY 1
+    """, (list(LOADED_TABLES),))
+    indexes = cursor.fetchall()
+
+    drops = [f"ALTER TABLE {table} DROP CONSTRAINT {name}" for table, name, _ in foreign_keys]
+    drops += [f"DROP INDEX {name}" for name, _ in indexes]
+    constraints = [(table, f"ADD CONSTRAINT {name} {definition}") for table, name, definition in foreign_keys]
+    return drops, [definition for _, definition in indexes], constraints
+
+
+def restore_ddl(settings: Dict[str, Any], indexes: List[str], constraints: List[Tuple[str, str]], workers: int) -> None:
+    """Rebuild indexes in parallel, then add foreign keys NOT VALID and validate them in parallel"""
+    def execute(statement: str) -> None:
+        conn = psycopg2.connect(**settings['db'])
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SET maintenance_work_mem = '512MB'")
+                cursor.execute(statement)
+        finally:
+            conn.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(execute, indexes))
+    print(f"Rebuilt {len(indexes)} indexes in {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    for table, constraint in constraints:
+        execute(f"ALTER TABLE {table} {constraint} NOT VALID")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(execute, [
+            f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint.split()[2]}" for table, constraint in constraints
+        ]))
+    print(f"Validated {len(constraints)} foreign keys in {time.perf_counter() - started:.1f}s")
+
+
+def run_phase(label: str, pool, function, shards: List[Tuple[int, int]], totals: Dict[str, int]) -> None:
+    started = time.perf_counter()
+    done = 0
+    for counts in pool.imap_unordered(function, shards):
+        for table, count in counts.items():
+            totals[table] = totals.get(table, 0) + count
+        done += 1
+        if done % max(1, len(shards) // 20) == 0 or done == len(shards):
+            print(f"  {label}: {done}/{len(shards)} shards, {time.perf_counter() - started:.0f}s", flush=True)
+
+
+def finish(conn) -> None:
+    """Rank current SSE scores (mid-rank percentile, as utils.score_distribution) and refresh statistics"""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            WITH ranked AS (
+                SELECT startup_id, score_id, ROUND(
+                    (RANK() OVER (ORDER BY total_score) - 1 + 0.5 * COUNT(*) OVER (PARTITION BY total_score))
+                    / COUNT(*) OVER () * 100
+                )::int AS percentile
+                FROM sse_current_scores
+            ),
+            current AS (
+                UPDATE sse_current_scores c SET percentile = r.percentile
+                FROM ranked r WHERE c.startup_id = r.startup_id
+            )
+            UPDATE sse_scores s SET percentile = r.percentile
+            FROM ranked r WHERE s.score_id = r.score_id
+        """)
+    conn.commit()
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        for table in LOADED_TABLES:
+            cursor.execute(f"VACUUM ANALYZE {table}")
+    conn.autocommit = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=100_000, help='users (each with a primary organization)')
+    parser.add_argument('--metric-rows', type=int, default=10_000_000, help='dashboard_metrics rows in total')
+    parser.add_argument('--actions-per-founder', type=float, default=20, help='mean actions per founder')
+    parser.add_argument('--score-versions', type=float, default=6, help='mean SSE score versions per startup')
+    parser.add_argument('--investments-per-investor', type=float, default=8, help='mean investments per investor')
+    parser.add_argument('--partnerships-per-partner', type=float, default=5, help='mean partnerships per partner')
+    parser.add_argument('--membership-share', type=float, default=0.1, help='share of users advising another startup')
+    parser.add_argument('--skew', type=float, default=1.16, help='Pareto shape of per-user activity (lower is more skewed)')
+    parser.add_argument('--days', type=int, default=365, help='days of history')
+    parser.add_argument('--seed', type=int, default=42, help='dataset seed (ids and emails are unique per seed)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='loader processes')
+    parser.add_argument('--shard-rows', type=int, default=1_000_000, help='target metric rows per shard')
+    parser.add_argument('--shard-users', type=int, default=20_000, help='maximum users per shard')
+    parser.add_argument('--keep-indexes', action='store_true',
+                        help='load with secondary indexes and foreign keys in place (slower)')
+    parser.add_argument('--dry-run', action='store_true', help='print the dataset plan without loading')
+    args = parser.parse_args()
+
+    settings = {
+        'users': args.users,
+        'metric_rows': args.metric_rows,
+        'actions_per_founder': args.actions_per_founder,
+        'score_versions': max(args.score_versions, 1),
+        'investments_per_investor': args.investments_per_investor,
+        'partnerships_per_partner': args.partnerships_per_partner,
+        'membership_share': args.membership_share,
+        'skew': args.skew,
+        'days': args.days,
+        'seed': args.seed,
+        'end': datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0).isoformat(),
+        'db': {
+            'host': os.environ.get('DB_HOST', 'localhost'),
+            'port': int(os.environ.get('DB_PORT', 5432)),
+            'database': os.environ.get('DB_NAME', 'auxeira_central'),
+            'user': os.environ.get('DB_USER', 'postgres'),
+            'password': os.environ.get('DB_PASSWORD', 'postgres')
+        }
+    }
+
+    plan = DatasetPlan(settings)
+    shards = plan.shards(args.shard_rows, args.shard_users)
+    for description in plan.describe():
+        print(description)
+    print(f"Shards: {len(shards)} on {args.workers} workers")
+    if args.dry_run:
+        return
+
+    conn = connect(settings)
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM users WHERE email = %s", (f"capacity-{args.seed}-0@{EMAIL_DOMAIN}",))
+        if cursor.fetchone():
+            sys.exit(f"A dataset with seed {args.seed} is already loaded; use another --seed")
+
+        indexes, constraints = [], []
+        if not args.keep_indexes:
+            drops, indexes, constraints = deferred_ddl(cursor)
+            restore_path = os.path.join(tempfile.gettempdir(), f"auxeira-capacity-restore-{args.seed}.sql")
+            with open(restore_path, 'w') as f:
+                f.writelines(f"{definition};\n" for definition in indexes)
+                f.writelines(f"ALTER TABLE {table} {constraint};\n" for table, constraint in constraints)
+            print(f"Dropping {len(indexes)} indexes and {len(constraints)} foreign keys until the load completes "
+                  f"(restore script: {restore_path})")
+            for statement in drops:
+                cursor.execute(statement)
+    conn.commit()
+
+    started = time.perf_counter()
+    totals: Dict[str, int] = {}
+    context = multiprocessing.get_context('spawn')
+    loaded = None
+    try:
+        with context.Pool(args.workers, initializer=_init_worker, initargs=(settings,)) as pool:
+            run_phase('users and organizations', pool, _run_entities, shards, totals)
+            run_phase('activity and metrics', pool, _run_activity, shards, totals)
+        loaded = time.perf_counter() - started
+    finally:
+        # A failed or interrupted load gets its indexes and foreign keys back too
+        if not args.keep_indexes:
+            if loaded is None:
+                print("Load failed; restoring the dropped indexes and foreign keys")
+            restore_ddl(settings, indexes, constraints, args.workers)
+    finish(conn)
+    conn.close()
+
+    elapsed = time.perf_counter() - started
+    for table in LOADED_TABLES:
+        print(f"{table:<24}{totals.get(table, 0):>16,}")
+    rows = sum(totals.values())
+    print(f"Loaded {rows:,} rows in {loaded:.1f}s ({rows / loaded:,.0f} rows/s); {elapsed:.1f}s including indexes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Primary key ingest benchmark
+Compares random UUIDv4 and time-ordered UUIDv7 keys: insert throughput and primary key index size
+on a scratch table, with ids from the column default (server) and from utils.ids (client, COPY)
+
+Usage: DB_HOST=... DB_NAME=... python benchmarks/id_ingest.py [--rows 1000000] [--batch 10000]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+import uuid
+
+import psycopg2
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.ids import uuid7_batch
+
+# (label, column default, client-side batch id generator)
+KEY_KINDS = [
+    ('uuid4', 'gen_random_uuid()', lambda count: [str(uuid.uuid4()) for _ in range(count)]),
+    ('uuid7', 'uuid_generate_v7()', uuid7_batch)
+]
+
+PAYLOAD = '{"sse_score": 72, "revenue": 315487, "customers": 132}'
+
+
+def create_table(cursor, table: str, default: str) -> None:
+    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute(f"""
+        CREATE TABLE {table} (
+            id UUID PRIMARY KEY DEFAULT {default},
+            payload JSONB NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+        )
+    """)
+
+
+def load_server(cursor, table: str, rows: int, batch: int) -> None:
+    """Ids from the column default"""
+    for start in range(0, rows, batch):
+        cursor.execute(
+            f"INSERT INTO {table} (payload) SELECT %s::jsonb FROM generate_series(1, %s)",
+            (PAYLOAD, min(batch, rows - start))
+        )
+        cursor.connection.commit()
+
+
+def client_ids(rows: int, batch: int, make_ids) -> list:
+    """Id batches for load_client, generated before the load is timed"""
+    return [make_ids(min(batch, rows - start)) for start in range(0, rows, batch)]
+
+
+def load_client(cursor, table: str, id_batches: list) -> None:
+    """Ids generated in Python and loaded with COPY"""
+    for ids in id_batches:
+        buffer = io.StringIO(''.join(f"{key}\t{PAYLOAD}\n" for key in ids))
+        cursor.copy_expert(f"COPY {table} (id, payload) FROM STDIN", buffer)
+        cursor.connection.commit()
+
+
+def index_stats(cursor, table: str):
+    cursor.execute(f"ANALYZE {table}")
+    cursor.execute("SELECT pg_relation_size(%s), pg_relation_size(%s)", (f"{table}_pkey", table))
+    return cursor.fetchone()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='rows inserted per run')
+    parser.add_argument('--batch', type=int, default=10_000, help='rows per transaction')
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(
+        host=os.environ.get('DB_HOST', 'localhost'),
+        port=int(os.environ.get('DB_PORT', 5432)),
+        database=os.environ.get('DB_NAME', 'auxeira_central'),
+        user=os.environ.get('DB_USER', 'postgres'),
+        password=os.environ.get('DB_PASSWORD', 'postgres')
+    )
+
+    print(f"{'keys':<8}{'ids from':<10}{'rows/s':>12}{'pkey MB':>10}{'table MB':>10}{'pkey/table':>12}")
+    try:
+        with conn.cursor() as cursor:
+            for label, default, make_ids in KEY_KINDS:
+                for source in ('server', 'client'):
+                    table = f"bench_ids_{label}_{source}"
+                    create_table(cursor, table, default)
+                    conn.commit()
+
+                    # Client ids are made up front, so only the load itself is timed for either kind
+                    id_batches = client_ids(args.rows, args.batch, make_ids) if source == 'client' else None
+                    started = time.perf_counter()
+                    if source == 'server':
+                        load_server(cursor, table, args.rows, args.batch)
+                    else:
+                        load_client(cursor, table, id_batches)
+                    elapsed = time.perf_counter() - started
+
+                    index_size, table_size = index_stats(cursor, table)
+                    print(f"{label:<8}{source:<10}{args.rows / elapsed:>12,.0f}"
+                          f"{index_size / 2**20:>10.1f}{table_size / 2**20:>10.1f}{index_size / table_size:>12.2f}")
+
+                    cursor.execute(f"DROP TABLE {table}")
+                    conn.commit()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+ASGI entry point for the load benchmark
+Serves the Flask app through asgiref's WsgiToAsgi, e.g. uvicorn asgi_app:application --app-dir benchmarks/load
+"""
+
+import os
+import sys
+
+from asgiref.wsgi import WsgiToAsgi
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'api'))
+
+from main import app
+
+application = WsgiToAsgi(app)
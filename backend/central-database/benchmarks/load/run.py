@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Central API load benchmark
+Seeds a local Postgres, starts the API (Flask dev server, gunicorn or ASGI via uvicorn) and replays
+dashboard sessions from concurrent virtual users; reports throughput and latency percentiles per endpoint
+
+Usage: DB_HOST=... DB_NAME=... python benchmarks/load/run.py [--users 1000] [--concurrency 20] [--duration 60]
+           [--server flask|gunicorn|asgi | --url http://host:port] [--output result.json] [--baseline previous.json]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.append(os.path.dirname(__file__))
+
+from seed import create_db_manager, init_schema, seed
+from sessions import ApiClient, DashboardSession, Recorder
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def server_command(server: str, port: int, workers: int) -> List[str]:
+    if server == 'flask':
+        return [sys.executable, os.path.join(ROOT, 'api', 'main.py')]
+    if server == 'gunicorn':
+        return [sys.executable, '-m', 'gunicorn', '--chdir', os.path.join(ROOT, 'api'), '--bind', f"127.0.0.1:{port}",
+                '--workers', str(workers), '--threads', '8', 'main:app']
+    if server == 'asgi':
+        return [sys.executable, '-m', 'uvicorn', '--app-dir', os.path.join(ROOT, 'benchmarks', 'load'),
+                '--host', '127.0.0.1', '--port', str(port), '--workers', str(workers), '--log-level', 'warning',
+                'asgi_app:application']
+    raise ValueError(f"Unknown server: {server}")
+
+
+def wait_for_health(base_url: str, timeout: float = 30.0) -> bool:
+    client = ApiClient(base_url, Recorder(), timeout=2.0)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        body = client.request('GET', '/api/health', '/api/health')
+        if body and body.get('status') == 'healthy':
+            client.close()
+            return True
+        client.close()
+        time.sleep(0.2)
+    return False
+
+
+def start_server(server: str, port: int, workers: int, log_path: str) -> subprocess.Popen:
+    env = dict(os.environ, PORT=str(port), DEBUG='false')
+    log = open(log_path, 'w')
+    process = subprocess.Popen(server_command(server, port, workers), cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+    if not wait_for_health(f"http://127.0.0.1:{port}"):
+        process.terminate()
+        raise RuntimeError(f"{server} server did not become healthy, see {log_path}")
+    return process
+
+
+def run_sessions(base_url: str, accounts: List[Dict[str, str]], args, recorder: Recorder,
+                 sessions: Optional[int], duration: Optional[float]) -> float:
+    """Replay sessions from args.concurrency virtual users; returns the elapsed seconds"""
+    next_account = itertools.cycle(accounts).__next__
+    remaining = itertools.count() if sessions is None else iter(range(sessions))
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration if duration else None
+
+    def virtual_user(number: int) -> None:
+        rng = random.Random(args.seed + number)
+        while deadline is None or time.monotonic() < deadline:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+                account = next_account()
+            client = ApiClient(base_url, recorder)
+            try:
+                DashboardSession(client, account, args.polls, args.action_probability, args.think_ms, rng).run()
+            finally:
+                client.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=virtual_user, args=(number,), daemon=True) for number in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Linear interpolation between closest ranks"""
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples: List[tuple], elapsed: float) -> Dict[str, Dict[str, Any]]:
+    """Per endpoint (and in total): requests, rps, error counts, latency and server db-phase percentiles"""
+    groups: Dict[str, List[tuple]] = {}
+    for sample in samples:
+        groups.setdefault(sample[0], []).append(sample)
+    groups['total'] = samples
+
+    summary = {}
+    for endpoint, group in sorted(groups.items()):
+        latencies = sorted(sample[2] for sample in group)
+        db_times = sorted(sample[3]['db'] for sample in group if 'db' in sample[3])
+        summary[endpoint] = {
+            'requests': len(group),
+            'rps': round(len(group) / elapsed, 2),
+            'client_errors': sum(1 for sample in group if 400 <= sample[1] < 500),
+            'server_errors': sum(1 for sample in group if sample[1] == 0 or sample[1] >= 500),
+            'mean_ms': round(sum(latencies) / len(latencies), 2),
+            **{f"p{p}_ms": round(percentile(latencies, p), 2) for p in PERCENTILES},
+            'db_p50_ms': round(percentile(db_times, 50), 2) if db_times else None,
+            'db_p95_ms': round(percentile(db_times, 95), 2) if db_times else None
+        }
+    return summary
+
+
+def git_revision() -> Optional[str]:
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True)
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                               capture_output=True, text=True)
+        return revision.stdout.strip() + ('-dirty' if dirty.stdout.strip() else '') if revision.returncode == 0 else None
+    except OSError:
+        return None
+
+
+def print_summary(summary: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+    columns = ['requests', 'rps', 'p50_ms', 'p90_ms', 'p95_ms', 'p99_ms', 'db_p50_ms', 'server_errors']
+    print(f"{'endpoint':<34}" + ''.join(f"{column:>14}" for column in columns))
+    for endpoint, row in summary.items():
+        print(f"{endpoint:<34}" + ''.join(f"{'-' if row[column] is None else row[column]:>14}" for column in columns))
+        previous = (baseline or {}).get(endpoint)
+        if previous:
+            deltas = []
+            for column in ('rps', 'p50_ms', 'p95_ms', 'p99_ms'):
+                if previous.get(column):
+                    deltas.append(f"{column} {(row[column] / previous[column] - 1) * 100:+.1f}%")
+            print(f"{'  vs baseline':<34}{', '.join(deltas)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=1000, help='benchmark users seeded and replayed')
+    parser.add_argument('--points', type=int, default=90, help='synthetic metrics per seeded user')
+    parser.add_argument('--init-schema', action='store_true', help='load database/init.sql before seeding')
+    parser.add_argument('--concurrency', type=int, default=20, help='concurrent virtual users')
+    parser.add_argument('--duration', type=float, default=60.0, help='seconds to run (ignored with --sessions)')
+    parser.add_argument('--sessions', type=int, help='run exactly this many sessions instead of --duration')
+    parser.add_argument('--warmup', type=int, default=20, help='sessions replayed (and discarded) before measuring')
+    parser.add_argument('--polls', type=int, default=5, help='metric polls per session after initializeDashboard')
+    parser.add_argument('--action-probability', type=float, default=0.3, help='chance of a gamification action per poll')
+    parser.add_argument('--think-ms', type=float, default=0.0, help='mean think time between polls')
+    parser.add_argument('--server', choices=['flask', 'gunicorn', 'asgi'], default='flask', help='server to start')
+    parser.add_argument('--workers', type=int, default=2, help='server worker processes (gunicorn, asgi)')
+    parser.add_argument('--port', type=int, default=5055, help='port of the started server')
+    parser.add_argument('--url', help='benchmark an already running API instead of starting one')
+    parser.add_argument('--seed', type=int, default=42, help='random seed of the virtual users')
+    parser.add_argument('--output', help='write the results as JSON')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    args = parser.parse_args()
+
+    db_manager = create_db_manager()
+    try:
+        if args.init_schema:
+            init_schema(db_manager)
+        accounts = seed(db_manager, args.users, args.points)
+    finally:
+        db_manager.close()
+    if not accounts:
+        sys.exit("No benchmark accounts could be seeded")
+
+    process = None
+    base_url = args.url
+    if not base_url:
+        base_url = f"http://127.0.0.1:{args.port}"
+        log_path = os.path.join(tempfile.gettempdir(), f"auxeira-load-{args.server}.log")
+        process = start_server(args.server, args.port, args.workers, log_path)
+
+    try:
+        if args.warmup:
+            run_sessions(base_url, accounts, args, Recorder(), args.warmup, None)
+        recorder = Recorder()
+        duration = None if args.sessions else args.duration
+        elapsed = run_sessions(base_url, accounts, args, recorder, args.sessions, duration)
+    finally:
+        if process:
+            process.terminate()
+            process.wait(timeout=10)
+
+    summary = summarize(recorder.samples, elapsed)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['endpoints']
+    print(f"{len(recorder.samples)} requests in {elapsed:.1f}s against {args.url or args.server}")
+    print_summary(summary, baseline)
+
+    if args.output:
+        result = {
+            'meta': {
+                'git_revision': git_revision(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'server': 'external' if args.url else args.server,
+                'elapsed_s': round(elapsed, 2),
+                'params': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')}
+            },
+            'endpoints': summary
+        }
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Load benchmark seed data
+Creates benchmark users (all with one password), their primary organizations and synthetic dashboard history
+
+Usage: DB_HOST=... DB_NAME=... python benchmarks/load/seed.py [--users 1000] [--points 90] [--init-schema]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from typing import Dict, List, Set
+
+from werkzeug.security import generate_password_hash
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from utils.database_manager import DatabaseManager
+from utils.synthetic_data_generator import SyntheticDataGenerator, SyntheticDataConfig
+
+EMAIL_DOMAIN = 'load.auxeira.test'
+PASSWORD = 'load-benchmark'
+SEED_JOB_NAME = 'load_benchmark_seed'
+SEED_SHARD_SIZE = 200
+
+# Dashboard population: founders dominate, as in production
+USER_TYPE_MIX = [
+    ('startup_founder', 0.6),
+    ('venture_capital', 0.1),
+    ('angel_investor', 0.1),
+    ('corporate_partner', 0.05),
+    ('government', 0.05),
+    ('esg_funder', 0.05),
+    ('impact_investor', 0.05)
+]
+
+ORG_TYPES = {
+    'startup_founder': 'startup',
+    'venture_capital': 'venture_capital',
+    'angel_investor': 'angel_investor',
+    'corporate_partner': 'corporate',
+    'government': 'government',
+    'esg_funder': 'non_profit',
+    'impact_investor': 'non_profit'
+}
+
+
+def create_db_manager() -> DatabaseManager:
+    return DatabaseManager(
+        host=os.environ.get('DB_HOST', 'localhost'),
+        port=int(os.environ.get('DB_PORT', 5432)),
+        database=os.environ.get('DB_NAME', 'auxeira_central'),
+        username=os.environ.get('DB_USER', 'postgres'),
+        password=os.environ.get('DB_PASSWORD', 'postgres')
+    )
+
+
+def user_types(count: int) -> List[str]:
+    """count user types in USER_TYPE_MIX proportions, interleaved"""
+    types = []
+    for user_type, share in USER_TYPE_MIX:
+        types.extend([user_type] * round(count * share))
+    types = (types + ['startup_founder'] * count)[:count]
+    random.Random(0).shuffle(types)
+    return types
+
+
+def seed_users(db_manager: DatabaseManager, count: int) -> Set[str]:
+    """Create missing benchmark users 0..count-1, each with a primary organization; returns the new user ids"""
+    types = user_types(count)
+    password_hash = generate_password_hash(PASSWORD)
+    result = db_manager.execute_query("""
+        WITH wanted AS (
+            SELECT i, (%s::text[])[i + 1]::user_type_enum AS user_type, 'load-' || i || '@' || %s AS email
+            FROM generate_series(0, %s - 1) i
+        ),
+        new_users AS (
+            INSERT INTO users (email, password_hash, user_type, profile, email_verified)
+            SELECT w.email, %s, w.user_type, jsonb_build_object('first_name', 'Load', 'last_name', 'User ' || w.i), TRUE
+            FROM wanted w
+            WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.email = w.email)
+            RETURNING user_id, user_type, email
+        ),
+        new_orgs AS (
+            INSERT INTO organizations (name, org_type, industry, region)
+            SELECT 'Load Org ' || n.email, (%s::jsonb ->> n.user_type::text)::organization_type_enum,
+                   (ARRAY['fintech', 'healthtech', 'edtech', 'cleantech'])[1 + abs(hashtext(n.email)) %% 4],
+                   (ARRAY['africa', 'europe', 'north_america', 'asia'])[1 + abs(hashtext(n.email || 'r')) %% 4]
+            FROM new_users n
+            RETURNING org_id, name
+        )
+        INSERT INTO user_organizations (user_id, org_id, role, is_primary)
+        SELECT n.user_id, o.org_id, 'owner', TRUE
+        FROM new_users n
+        JOIN new_orgs o ON o.name = 'Load Org ' || n.email
+        RETURNING user_id
+    """, (types, EMAIL_DOMAIN, count, password_hash, json.dumps(ORG_TYPES)), fetch=True)
+    return {str(row['user_id']) for row in result or []}
+
+
+def load_accounts(db_manager: DatabaseManager, count: int) -> List[Dict[str, str]]:
+    """Benchmark accounts: email, password, user type and primary organization"""
+    rows = db_manager.execute_query("""
+        SELECT u.user_id, u.email, u.user_type, uo.org_id
+        FROM users u
+        JOIN user_organizations uo ON uo.user_id = u.user_id AND uo.is_primary = TRUE
+        WHERE u.email LIKE %s
+        ORDER BY u.email
+        LIMIT %s
+    """, (f"load-%@{EMAIL_DOMAIN}", count), fetch=True) or []
+    return [
+        {
+            'user_id': str(row['user_id']),
+            'email': row['email'],
+            'password': PASSWORD,
+            'user_type': row['user_type'],
+            'org_id': str(row['org_id'])
+        }
+        for row in rows
+    ]
+
+
+def seed_metrics(db_manager: DatabaseManager, accounts: List[Dict[str, str]], points: int) -> int:
+    """points synthetic dashboard metrics over the last 30 days for every account, loaded shard by shard"""
+    generator = SyntheticDataGenerator()
+    db_manager.execute_query("DELETE FROM job_checkpoints WHERE job_name = %s", (SEED_JOB_NAME,))
+    db_manager.start_job_checkpoint(SEED_JOB_NAME)
+
+    rows = 0
+    cursor_value = None
+    for start in range(0, len(accounts), SEED_SHARD_SIZE):
+        shard = accounts[start:start + SEED_SHARD_SIZE]
+        configs = [
+            SyntheticDataConfig(account['user_type'], 'metrics', points, 30, 0.2, 'improving', seed=start + i)
+            for i, account in enumerate(shard)
+        ]
+        series_list = generator.generate_series_list(configs, ids=False)
+        next_cursor = shard[-1]['user_id']
+        rows += db_manager.copy_synthetic_shard(
+            [(account['user_id'], account['org_id'], series) for account, series in zip(shard, series_list)],
+            SEED_JOB_NAME,
+            expected_cursor=cursor_value,
+            cursor_value=next_cursor
+        ) or 0
+        cursor_value = next_cursor
+    return rows
+
+
+def init_schema(db_manager: DatabaseManager) -> None:
+    schema = os.path.join(os.path.dirname(__file__), '..', '..', 'database', 'init.sql')
+    with open(schema) as f:
+        db_manager.execute_query(f.read())
+
+
+def seed(db_manager: DatabaseManager, users: int, points: int) -> List[Dict[str, str]]:
+    """Seed the database to the given scale and return the benchmark accounts"""
+    created = seed_users(db_manager, users)
+    accounts = load_accounts(db_manager, users)
+    new_accounts = [account for account in accounts if account['user_id'] in created]
+    rows = seed_metrics(db_manager, new_accounts, points) if new_accounts and points else 0
+    db_manager.execute_query("ANALYZE")
+    print(f"Seeded {len(created)} new users ({len(accounts)} total) and {rows} dashboard metrics")
+    return accounts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=1000, help='benchmark users')
+    parser.add_argument('--points', type=int, default=90, help='synthetic metrics per new user')
+    parser.add_argument('--init-schema', action='store_true', help='load database/init.sql first')
+    args = parser.parse_args()
+
+    db_manager = create_db_manager()
+    try:
+        if args.init_schema:
+            init_schema(db_manager)
+        seed(db_manager, args.users, args.points)
+    finally:
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
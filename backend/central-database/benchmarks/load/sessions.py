@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Load benchmark dashboard sessions
+Virtual dashboard users replaying the AuxeiraCentralClient flow over keep-alive HTTP connections
+"""
+
+import http.client
+import json
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode, urlsplit
+
+# Actions a founder records from the dashboard (action type, domain, base tokens)
+FOUNDER_ACTIONS = [
+    ('update_metrics', 'growth', 10),
+    ('customer_interview', 'product', 25),
+    ('investor_update', 'fundraising', 20),
+    ('hire_completed', 'team', 30),
+    ('pitch_practice', 'fundraising', 15)
+]
+
+SSE_COMPONENTS = ('team', 'market', 'product', 'business', 'financial', 'traction')
+
+
+class Recorder:
+    """Thread-safe log of (endpoint, status, latency ms, Server-Timing phases) per request"""
+
+    def __init__(self):
+        self.samples: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, status: int, latency_ms: float, phases: Dict[str, float]) -> None:
+        with self._lock:
+            self.samples.append((endpoint, status, latency_ms, phases))
+
+
+def parse_server_timing(header: Optional[str]) -> Dict[str, float]:
+    phases = {}
+    for entry in (header or '').split(','):
+        name, _, duration = entry.strip().partition(';dur=')
+        if duration:
+            phases[name] = float(duration)
+    return phases
+
+
+class ApiClient:
+    """Minimal JSON client over one persistent connection, like one browser tab"""
+
+    def __init__(self, base_url: str, recorder: Recorder, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.https = parts.scheme == 'https'
+        self.prefix = parts.path.rstrip('/')
+        self.timeout = timeout
+        self.recorder = recorder
+        self.token: Optional[str] = None
+        self.connection: Optional[http.client.HTTPConnection] = None
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.connection is None:
+            connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            self.connection = connection_class(self.host, self.port, timeout=self.timeout)
+        return self.connection
+
+    def request(self, method: str, endpoint: str, path: str, body: Any = None) -> Optional[Dict[str, Any]]:
+        """Send a request; endpoint is the route template it is reported under"""
+        headers = {'Content-Type': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        payload = json.dumps(body) if body is not None else None
+
+        started = time.perf_counter()
+        try:
+            connection = self._connect()
+            connection.request(method, self.prefix + path, body=payload, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+            status = response.status
+            phases = parse_server_timing(response.getheader('Server-Timing'))
+        except (OSError, http.client.HTTPException):
+            self.close()
+            data, status, phases = b'', 0, {}
+        self.recorder.record(f"{method} {endpoint}", status, (time.perf_counter() - started) * 1000, phases)
+
+        try:
+            return json.loads(data) if data else None
+        except ValueError:
+            return None
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class DashboardSession:
+    """One dashboard visit: login, initializeDashboard, periodic metric polls, actions and an SSE update"""
+
+    def __init__(self, client: ApiClient, account: Dict[str, str], polls: int = 5,
+                 action_probability: float = 0.3, think_ms: float = 0.0, rng: Optional[random.Random] = None):
+        self.client = client
+        self.account = account
+        self.polls = polls
+        self.action_probability = action_probability
+        self.think_ms = think_ms
+        self.rng = rng or random.Random()
+
+    def think(self) -> None:
+        if self.think_ms:
+            time.sleep(self.rng.expovariate(1 / self.think_ms) / 1000)
+
+    def run(self) -> None:
+        login = self.client.request('POST', '/api/auth/login', '/api/auth/login', {
+            'email': self.account['email'],
+            'password': self.account['password']
+        })
+        if not login or not login.get('success'):
+            return
+        self.client.token = login['data']['token']
+        founder = self.account['user_type'] == 'startup_founder'
+
+        # initializeDashboard: metrics, plus the gamification profile on founder dashboards
+        self.initialize_dashboard(founder)
+
+        for _ in range(self.polls):
+            self.think()
+            self.poll_metrics()
+            if founder and self.rng.random() < self.action_probability:
+                self.complete_action()
+
+        if founder:
+            self.calculate_sse()
+
+    def initialize_dashboard(self, founder: bool) -> None:
+        self.poll_metrics()
+        if founder:
+            self.client.request('GET', '/api/gamification/profile', '/api/gamification/profile')
+
+    def poll_metrics(self) -> None:
+        query = urlencode({'type': self.account['user_type'], 'days': 30, 'includeSynthetic': 'true'})
+        self.client.request('GET', '/api/dashboard/metrics', f"/api/dashboard/metrics?{query}")
+
+    def complete_action(self) -> None:
+        action_type, domain, base_tokens = self.rng.choice(FOUNDER_ACTIONS)
+        self.client.request('POST', '/api/gamification/action', '/api/gamification/action', {
+            'actionType': action_type,
+            'domain': domain,
+            'baseTokens': base_tokens,
+            'multipliers': {'streak': 1.1},
+            'metadata': {'source': 'load_benchmark'}
+        })
+
+    def calculate_sse(self) -> None:
+        responses = {
+            component: {f"q{i}": round(self.rng.uniform(0.3, 1.0), 2) for i in range(1, 4)}
+            for component in SSE_COMPONENTS
+        }
+        self.client.request('POST', '/api/sse/calculate', '/api/sse/calculate', {
+            'startupId': self.account['org_id'],
+            'responses': responses,
+            'isSynthetic': True
+        })
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Hot path microbenchmarks
+Times the per-type series generators, trend_array (apply_trend cases), the token calculator (EconomicsCalc) and SSE scoring
+at several input sizes, measures their peak traced memory, and compares against a saved baseline
+
+Usage: python benchmarks/micro.py [--filter generator] [--save baseline.json] [--baseline baseline.json]
+           [--tolerance 0.05] [--noise-factor 3] [--memory-tolerance 0.1]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.sse_scoring import COMPONENT_WEIGHTS, score_responses
+from utils.synthetic_data_generator import SyntheticDataGenerator, SyntheticDataConfig
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# EconomicsCalc.py (the FastAPI token calculator) lives outside this package
+ECONOMICS_CALC_DIR = os.path.join(ROOT, '..', '..', 'backup_latest_work')
+
+GENERATOR_SIZES = (100, 10_000, 100_000)
+RECORD_SIZES = (100, 10_000)
+TREND_SIZES = (1_000, 1_000_000)
+ACTIVITY_SIZES = (1, 25, 250)
+WEEK_SIZES = (100, 10_000)
+QUESTION_SIZES = (3, 30, 300)
+
+
+@dataclass
+class Case:
+    """One benchmark: fn is called with no arguments, size is its input size"""
+    group: str
+    name: str
+    size: int
+    fn: Callable[[], Any]
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.name}[{self.size}]"
+
+
+def generator_cases() -> List[Case]:
+    generator = SyntheticDataGenerator(seed=42)
+    cases = []
+    for user_type in generator.series_builders:
+        for size in GENERATOR_SIZES:
+            config = SyntheticDataConfig(user_type, 'metrics', size, 30, 0.2, 'volatile', seed=42)
+            cases.append(Case('generator', user_type, size, lambda config=config: generator.generate_series(config)))
+    for size in RECORD_SIZES:
+        config = SyntheticDataConfig('startup_founder', 'metrics', size, 30, 0.2, 'volatile', seed=42)
+        cases.append(Case('generator', 'generate_data', size, lambda config=config: generator.generate_data(config)))
+    return cases
+
+
+def trend_cases() -> List[Case]:
+    cases = []
+    for trend in ('improving', 'declining', 'volatile', 'stable'):
+        for size in TREND_SIZES:
+            rng = np.random.default_rng(42)
+            progress = np.linspace(0, 1, size)
+            trend_noise, variance_noise = rng.random(size), rng.random(size)
+            cases.append(Case('apply_trend', trend, size, lambda trend=trend, progress=progress, t=trend_noise,
+                               v=variance_noise: SyntheticDataGenerator.trend_array(100.0, progress, trend, 0.2, t, v)))
+    return cases
+
+
+def economics_cases() -> List[Case]:
+    """Token calculator cases; empty when EconomicsCalc's dependencies (fastapi, pydantic) are missing"""
+    sys.path.append(ECONOMICS_CALC_DIR)
+    try:
+        import EconomicsCalc
+    except ImportError as e:
+        print(f"Skipping token calculator benchmarks: {e}")
+        return []
+    # calculate_tokens logs every calculation at INFO
+    EconomicsCalc.logger.setLevel(logging.WARNING)
+
+    rng = np.random.default_rng(42)
+    activity_ids = sorted(EconomicsCalc.ACTIVITY_CATALOG)
+    cases = []
+    for size in ACTIVITY_SIZES:
+        request = EconomicsCalc.TokenCalculationRequest(
+            startup_stage=EconomicsCalc.StartupStage.SEED,
+            activities=[
+                EconomicsCalc.ActivitySubmission(
+                    activity_id=int(rng.choice(activity_ids)),
+                    quality_score=float(rng.random()),
+                    consistency_weeks=int(rng.integers(0, 60))
+                )
+                for _ in range(size)
+            ]
+        )
+        cases.append(Case('economics', 'calculate_tokens', size,
+                          lambda request=request: EconomicsCalc.calculate_tokens(request)))
+    for size in WEEK_SIZES:
+        weeks = [int(week) for week in rng.integers(0, 60, size)]
+        cases.append(Case('economics', 'calculate_consistency_bonus', size,
+                          lambda weeks=weeks: [EconomicsCalc.calculate_consistency_bonus(week) for week in weeks]))
+    return cases
+
+
+def sse_cases() -> List[Case]:
+    rng = np.random.default_rng(42)
+    cases = []
+    for size in QUESTION_SIZES:
+        responses = {
+            component: {f"q{i}": float(value) for i, value in enumerate(rng.random(size))}
+            for component in COMPONENT_WEIGHTS
+        }
+        cases.append(Case('sse', 'score_responses', size, lambda responses=responses: score_responses(responses)))
+    return cases
+
+
+CASE_GROUPS = {
+    'generator': generator_cases,
+    'apply_trend': trend_cases,
+    'economics': economics_cases,
+    'sse': sse_cases
+}
+
+
+def measure(case: Case, repeat: int, min_time: float) -> Dict[str, Any]:
+    """Per-call seconds (min and median of repeat runs) and peak traced bytes of one call
+
+    The loop count is calibrated so one run lasts at least min_time, and timeit disables
+    the garbage collector while timing. Memory is traced in a separate call so tracemalloc
+    overhead does not reach the timings.
+    """
+    timer = timeit.Timer(case.fn)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2 if number < 1000 else 10
+    runs = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'min_s': min(runs),
+        'median_s': statistics.median(runs),
+        'rsd': statistics.stdev(runs) / statistics.mean(runs) if len(runs) > 1 else 0.0,
+        'loops': number,
+        'peak_bytes': peak
+    }
+
+
+def allowed_slowdown(result: Dict[str, Any], previous: Dict[str, Any], tolerance: float, noise_factor: float) -> float:
+    """Relative slowdown of the min time still counted as noise: noise_factor times the larger
+    run-to-run spread (rsd) of the baseline and this run, and at least tolerance"""
+    return max(tolerance, noise_factor * max(result['rsd'], previous.get('rsd', 0.0)))
+
+
+def compare(result: Dict[str, Any], previous: Dict[str, Any], tolerance: float, noise_factor: float,
+            memory_tolerance: float) -> List[str]:
+    """Regressions of result against its baseline entry: min time (the least noisy) and peak memory"""
+    regressions = []
+    if result['min_s'] > previous['min_s'] * (1 + allowed_slowdown(result, previous, tolerance, noise_factor)):
+        regressions.append(f"time {result['min_s'] / previous['min_s'] - 1:+.0%}")
+    if result['peak_bytes'] > previous['peak_bytes'] * (1 + memory_tolerance) + 1024:
+        regressions.append(f"memory {result['peak_bytes'] / max(previous['peak_bytes'], 1) - 1:+.0%}")
+    return regressions
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True)
+        return result.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', help='only cases whose group/name[size] key contains this text')
+    parser.add_argument('--repeat', type=int, default=7, help='timed runs per case')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimum seconds per timed run')
+    parser.add_argument('--save', help='write the results as a baseline file')
+    parser.add_argument('--baseline', help='baseline file to compare against (exit status 1 on regression)')
+    parser.add_argument('--tolerance', type=float, default=0.05,
+                        help='smallest allowed slowdown of the minimum time, whatever the spread')
+    parser.add_argument('--noise-factor', type=float, default=3.0,
+                        help='allowed slowdown in multiples of the run-to-run spread (rsd)')
+    parser.add_argument('--memory-tolerance', type=float, default=0.1, help='allowed growth of peak memory')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['cases']
+
+    cases = [case for build in CASE_GROUPS.values() for case in build()]
+    cases = [case for case in cases if not args.filter or args.filter in case.key]
+
+    results = {}
+    regressed = []
+    print(f"{'case':<48}{'min':>12}{'median':>12}{'rsd':>8}{'peak KiB':>12}  vs baseline")
+    for case in cases:
+        result = results[case.key] = measure(case, args.repeat, args.min_time)
+        line = (f"{case.key:<48}{format_seconds(result['min_s']):>12}{format_seconds(result['median_s']):>12}"
+                f"{result['rsd']:>8.1%}{result['peak_bytes'] / 1024:>12,.1f}")
+        previous = baseline.get(case.key)
+        if previous:
+            regressions = compare(result, previous, args.tolerance, args.noise_factor, args.memory_tolerance)
+            line += f"  {result['min_s'] / previous['min_s'] - 1:+.1%}"
+            if regressions:
+                line += f"  REGRESSION ({', '.join(regressions)})"
+                regressed.append(case.key)
+        print(line, flush=True)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'meta': {
+                    'git_revision': git_revision(),
+                    'python': platform.python_version(),
+                    'numpy': np.__version__,
+                    'platform': platform.platform(),
+                    'repeat': args.repeat,
+                    'min_time': args.min_time
+                },
+                'cases': results
+            }, f, indent=2)
+        print(f"Baseline written to {args.save}")
+
+    if regressed:
+        print(f"{len(regressed)} cases regressed beyond max({args.tolerance:.0%}, {args.noise_factor:g} x rsd) time "
+              f"/ {args.memory_tolerance:.0%} memory")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
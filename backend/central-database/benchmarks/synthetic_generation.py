@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Synthetic generation throughput benchmark
+Measures points/sec of the NumPy engine (columnar series) and of the record dict boundary per dashboard type
+
+Usage: python benchmarks/synthetic_generation.py [--points 1000000] [--repeat 3] [--records] [--workers 4] [--pool 20000]
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.series_pool import SeriesPool
+from utils.synthetic_data_generator import SyntheticDataGenerator, SyntheticDataConfig
+
+TARGET_POINTS_PER_SECOND = 1_000_000
+
+
+def best_rate(fn, points: int, repeat: int) -> float:
+    """Best points/sec over repeat runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return points / best
+
+
+def batch_digest(results) -> str:
+    """SHA-256 over the timestamps and metrics of a generate_batch_series result
+
+    Metric ids are left out: they are drawn at generation time, not from the seed.
+    """
+    digest = hashlib.sha256()
+    for key, series in results.items():
+        digest.update(key.encode())
+        digest.update(series.timestamps.tobytes())
+        for name, values in series.metrics.items():
+            digest.update(name.encode())
+            digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def benchmark_batch(generator: SyntheticDataGenerator, points: int, workers: int, trend: str) -> bool:
+    """Time batch generation of every type on 1 and on workers processes; check outputs match"""
+    configs = [
+        SyntheticDataConfig(user_type, 'metrics', points, 30, 0.2, trend)
+        for user_type in generator.series_builders
+    ]
+    total = points * len(configs)
+    digests = {}
+
+    print(f"\n{'workers':<20}{'batch pts/s':>16}{'speedup':>10}  sha256")
+    for count in sorted({1, workers}):
+        started = time.perf_counter()
+        results = generator.generate_batch_series(configs, workers=count, seed=42)
+        elapsed = time.perf_counter() - started
+        digests[count] = batch_digest(results)
+        if count == 1:
+            serial = elapsed
+        print(f"{count:<20}{total / elapsed:>16,.0f}{serial / elapsed:>9.2f}x  {digests[count][:16]}")
+
+    identical = len(set(digests.values())) == 1
+    print("Outputs identical across worker counts" if identical else "Outputs DIFFER across worker counts")
+    return identical
+
+
+def benchmark_pool(generator: SyntheticDataGenerator, count: int, requests: int, trend: str) -> None:
+    """Time small unseeded series per request, generated directly and taken from a SeriesPool"""
+    config = SyntheticDataConfig('startup_founder', 'metrics', count, 7, 0.2, trend)
+    # Refills run inline here, so the timed loop includes the cost of keeping the key filled
+    pool = SeriesPool(generator, background=False)
+    pool.take(config)  # the first request of a key misses and fills it
+
+    print(f"\n{'small series':<20}{'series/s':>16}  ({count} points each)")
+    for label, fn in (('direct', lambda: generator.generate_series(config)), ('pooled', lambda: pool.take(config))):
+        started = time.perf_counter()
+        for _ in range(requests):
+            fn()
+        print(f"{label:<20}{requests / (time.perf_counter() - started):>16,.0f}")
+    print(f"Pool: {pool.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=1_000_000, help='data points per dashboard type')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement (best is reported)')
+    parser.add_argument('--trend', default='volatile', help='trend of the generated series')
+    parser.add_argument('--records', action='store_true', help='also time conversion to record dicts')
+    parser.add_argument('--workers', type=int, default=0, help='also time batch mode on this many processes')
+    parser.add_argument('--pool', type=int, default=0, help='also time this many small series requests with the pool')
+    args = parser.parse_args()
+
+    generator = SyntheticDataGenerator(seed=42)
+    below_target = []
+
+    print(f"{'dashboard type':<20}{'engine pts/s':>16}" + (f"{'records pts/s':>16}" if args.records else ''))
+    for user_type in generator.series_builders:
+        config = SyntheticDataConfig(user_type, 'metrics', args.points, 30, 0.2, args.trend, seed=42)
+
+        engine_rate = best_rate(lambda: generator.generate_series(config), args.points, args.repeat)
+        line = f"{user_type:<20}{engine_rate:>16,.0f}"
+        if args.records:
+            series = generator.generate_series(config)
+            line += f"{best_rate(series.to_records, args.points, 1):>16,.0f}"
+        print(line)
+
+        if engine_rate < TARGET_POINTS_PER_SECOND:
+            below_target.append(user_type)
+
+    if below_target:
+        print(f"Below {TARGET_POINTS_PER_SECOND:,} points/sec: {', '.join(below_target)}")
+        sys.exit(1)
+
+    if args.workers and not benchmark_batch(generator, args.points, args.workers, args.trend):
+        sys.exit(1)
+
+    if args.pool:
+        benchmark_pool(generator, 10, args.pool, args.trend)
+
+
+if __name__ == "__main__":
+    main()
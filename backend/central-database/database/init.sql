@@ -53,6 +53,46 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql SECURITY DEFINER;
 
+-- Create function for time-ordered UUIDs (UUIDv7: unix ms timestamp, version 7, random bits)
+-- Keys of append-heavy tables then land on the rightmost B-tree page instead of a random one
+CREATE OR REPLACE FUNCTION uuid_generate_v7()
+RETURNS UUID AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(uuid_send(gen_random_uuid())
+                        PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::BIGINT) FROM 3)
+                        FROM 1 FOR 6),
+                52, 1),
+            53, 1),
+        'hex')::UUID;
+$$ LANGUAGE SQL VOLATILE;
+
+-- Create function to trim SSE score history as it is written (keeps the newest
+-- auxeira.sse_history_keep rows per startup; does nothing while the setting is unset)
+CREATE OR REPLACE FUNCTION trim_sse_score_history()
+RETURNS TRIGGER AS $$
+DECLARE
+    keep_rows INTEGER := NULLIF(current_setting('auxeira.sse_history_keep', true), '')::INTEGER;
+BEGIN
+    IF keep_rows IS NOT NULL THEN
+        DELETE FROM sse_score_history h
+        USING (
+            SELECT stale.history_id
+            FROM (SELECT DISTINCT startup_id FROM inserted_history) changed
+            CROSS JOIN LATERAL (
+                SELECT history_id FROM sse_score_history
+                WHERE startup_id = changed.startup_id
+                ORDER BY created_at DESC
+                OFFSET keep_rows
+            ) stale
+        ) trimmed
+        WHERE h.history_id = trimmed.history_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
 -- =============================================
 -- CORE TABLES
 -- =============================================
@@ -114,7 +154,7 @@ CREATE TABLE user_organizations (
 
 -- SSE Scores table with versioning
 CREATE TABLE sse_scores (
-    score_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    score_id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
     startup_id UUID REFERENCES organizations(org_id) ON DELETE CASCADE,
     version INTEGER NOT NULL DEFAULT 1,
     total_score INTEGER NOT NULL CHECK (total_score >= 0 AND total_score <= 100),
@@ -143,9 +183,24 @@ CREATE TABLE sse_scores (
     UNIQUE(startup_id, version)
 );
 
+-- Latest SSE score per startup, maintained by every score insert for O(1) and batch reads
+CREATE TABLE sse_current_scores (
+    startup_id UUID PRIMARY KEY REFERENCES organizations(org_id) ON DELETE CASCADE,
+    score_id UUID NOT NULL REFERENCES sse_scores(score_id) ON DELETE CASCADE,
+    version INTEGER NOT NULL,
+    total_score INTEGER NOT NULL CHECK (total_score >= 0 AND total_score <= 100),
+    component_scores JSONB NOT NULL DEFAULT '{}',
+    percentile INTEGER CHECK (percentile >= 0 AND percentile <= 100),
+    success_probability DECIMAL(5,4),
+    is_synthetic BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP WITH TIME ZONE,
+    created_by UUID REFERENCES users(user_id),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
 -- SSE Score change history
 CREATE TABLE sse_score_history (
-    history_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    history_id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
     startup_id UUID REFERENCES organizations(org_id) ON DELETE CASCADE,
     score_id UUID REFERENCES sse_scores(score_id) ON DELETE CASCADE,
     change_type VARCHAR(50) NOT NULL,
@@ -200,7 +255,7 @@ CREATE TABLE integrations (
 
 -- Integration data storage
 CREATE TABLE integration_data (
-    data_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    data_id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
     integration_id UUID REFERENCES integrations(integration_id) ON DELETE CASCADE,
     data_type VARCHAR(100) NOT NULL,
     data_payload JSONB NOT NULL DEFAULT '{}',
@@ -230,7 +285,7 @@ CREATE TABLE integration_data (
 
 -- User actions and rewards
 CREATE TABLE actions (
-    action_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    action_id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
     user_id UUID REFERENCES users(user_id) ON DELETE CASCADE,
     startup_id UUID REFERENCES organizations(org_id) ON DELETE CASCADE,
     
@@ -381,7 +436,7 @@ CREATE TABLE partnerships (
 
 -- Dashboard metrics storage
 CREATE TABLE dashboard_metrics (
-    metric_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    metric_id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
     user_id UUID REFERENCES users(user_id) ON DELETE CASCADE,
     org_id UUID REFERENCES organizations(org_id) ON DELETE CASCADE,
     
@@ -411,6 +466,40 @@ CREATE TABLE dashboard_metrics (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Precomputed portfolio statistics for investor and government dashboards
+-- (refreshed on a schedule from the latest SSE score of every startup)
+CREATE TABLE portfolio_summaries (
+    -- Scope: 'ecosystem' covers every active startup, 'investor' one investor's portfolio
+    scope_type VARCHAR(20) NOT NULL,
+    scope_id UUID NOT NULL DEFAULT '00000000-0000-0000-0000-000000000000',
+
+    -- Grouping: 'all', 'region' or 'industry'
+    dimension VARCHAR(20) NOT NULL,
+    dimension_value VARCHAR(100) NOT NULL DEFAULT '',
+
+    -- Counts
+    startup_count INTEGER NOT NULL DEFAULT 0,
+    scored_count INTEGER NOT NULL DEFAULT 0,
+    synthetic_count INTEGER NOT NULL DEFAULT 0,
+
+    -- SSE score statistics
+    avg_sse_score DECIMAL(5,2),
+    min_sse_score INTEGER,
+    max_sse_score INTEGER,
+    p25_sse_score DECIMAL(5,2),
+    median_sse_score DECIMAL(5,2),
+    p75_sse_score DECIMAL(5,2),
+    score_distribution JSONB DEFAULT '{}',
+
+    -- Investment totals (investor scope only)
+    total_invested DECIMAL(15,2),
+
+    -- Timestamps
+    refreshed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (scope_type, scope_id, dimension, dimension_value)
+);
+
 -- =============================================
 -- SYNTHETIC DATA MANAGEMENT
 -- =============================================
@@ -474,6 +563,80 @@ CREATE TABLE synthetic_data_sessions (
     last_generated TIMESTAMP WITH TIME ZONE
 );
 
+-- Queued synthetic generation requests, run by handlers.synthetic_jobs workers
+-- (claimed with FOR UPDATE SKIP LOCKED; progress commits with each loaded chunk)
+CREATE TABLE synthetic_generation_jobs (
+    job_id UUID PRIMARY KEY DEFAULT uuid_generate_v7(),
+    user_id UUID REFERENCES users(user_id) ON DELETE CASCADE,
+    org_id UUID REFERENCES organizations(org_id) ON DELETE CASCADE,
+    template_id UUID REFERENCES synthetic_data_templates(template_id),
+
+    -- SyntheticDataConfig fields, with the seed fixed at enqueue time
+    config JSONB NOT NULL,
+    -- End of the series' time axis, fixed at enqueue time like the seed
+    series_end TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+
+    -- Status: 'queued', 'running', 'completed' or 'failed'
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    rows_total BIGINT NOT NULL,
+    rows_generated BIGINT NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id VARCHAR(255),
+    error TEXT,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    started_at TIMESTAMP WITH TIME ZONE,
+    heartbeat_at TIMESTAMP WITH TIME ZONE,
+    completed_at TIMESTAMP WITH TIME ZONE
+);
+
+-- =============================================
+-- BACKGROUND JOB STATE
+-- =============================================
+
+-- Resume points of long-running scheduled jobs (one row per job)
+CREATE TABLE job_checkpoints (
+    job_name VARCHAR(100) PRIMARY KEY,
+
+    -- Keyset cursor: last key processed in the current pass (NULL = start of a pass)
+    cursor_value TEXT,
+
+    -- Progress of the current pass and of the job overall
+    pass_started_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    pass_processed BIGINT NOT NULL DEFAULT 0,
+    total_processed BIGINT NOT NULL DEFAULT 0,
+    passes_completed INTEGER NOT NULL DEFAULT 0,
+    last_completed_at TIMESTAMP WITH TIME ZONE,
+    state JSONB DEFAULT '{}',
+
+    -- Timestamps
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Steps of maintenance planner runs (utils/maintenance_planner.py), one row per step
+CREATE TABLE maintenance_runs (
+    run_id UUID NOT NULL,
+    step INTEGER NOT NULL,
+
+    -- Command and why it was planned
+    action VARCHAR(50) NOT NULL,
+    table_name VARCHAR(100) NOT NULL,
+    index_name VARCHAR(100),
+    reason TEXT,
+    stats JSONB DEFAULT '{}',
+
+    -- Outcome: completed, failed or skipped (did not fit in the time budget)
+    status VARCHAR(20) NOT NULL,
+    duration_ms DECIMAL(12,1),
+    error TEXT,
+
+    -- Timestamps
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (run_id, step)
+);
+
 -- =============================================
 -- TRIGGERS FOR AUTOMATIC TIMESTAMPS
 -- =============================================
@@ -497,12 +660,22 @@ CREATE TRIGGER update_investments_updated_at BEFORE UPDATE ON investments
 CREATE TRIGGER update_partnerships_updated_at BEFORE UPDATE ON partnerships
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_synthetic_data_templates_updated_at BEFORE UPDATE ON synthetic_data_templates
+-- Only content changes bump updated_at: it keys the compiled generation plans,
+-- which usage_count/last_used updates must not invalidate
+CREATE TRIGGER update_synthetic_data_templates_updated_at
+    BEFORE UPDATE OF template_name, template_type, user_type, data_schema, generation_rules,
+                     validation_rules, sample_data, default_parameters, description, version, is_active
+    ON synthetic_data_templates
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
 CREATE TRIGGER update_synthetic_data_sessions_updated_at BEFORE UPDATE ON synthetic_data_sessions
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+-- Inline history trim: once per statement, only for the startups it wrote history for
+CREATE TRIGGER trim_sse_score_history_on_insert AFTER INSERT ON sse_score_history
+    REFERENCING NEW TABLE AS inserted_history
+    FOR EACH STATEMENT EXECUTE FUNCTION trim_sse_score_history();
+
 -- =============================================
 -- INDEXES FOR PERFORMANCE
 -- =============================================
@@ -523,11 +696,13 @@ CREATE INDEX idx_sse_scores_startup ON sse_scores(startup_id);
 CREATE INDEX idx_sse_scores_created ON sse_scores(created_at DESC);
 CREATE INDEX idx_sse_scores_synthetic ON sse_scores(is_synthetic, created_at);
 CREATE INDEX idx_sse_scores_startup_version ON sse_scores(startup_id, version DESC);
+CREATE INDEX idx_sse_current_scores_total ON sse_current_scores(total_score);
+CREATE INDEX idx_sse_score_history_startup_created ON sse_score_history(startup_id, created_at DESC);
 
 -- Integration indexes
 CREATE INDEX idx_integration_data_integration ON integration_data(integration_id);
 CREATE INDEX idx_integration_data_timestamp ON integration_data(sync_timestamp DESC);
-CREATE INDEX idx_integration_data_synthetic ON integration_data(is_synthetic, created_at);
+CREATE INDEX idx_integration_data_synthetic ON integration_data(is_synthetic, created_at, data_id);
 CREATE INDEX idx_integration_data_type_timestamp ON integration_data(data_type, sync_timestamp DESC);
 
 -- Action indexes
@@ -537,13 +712,28 @@ CREATE INDEX idx_actions_completed ON actions(completed_at DESC);
 CREATE INDEX idx_actions_synthetic ON actions(is_synthetic, completed_at);
 CREATE INDEX idx_actions_user_domain ON actions(user_id, domain, completed_at DESC);
 
+-- Gamification indexes (leaderboard ordering)
+CREATE INDEX idx_gamification_profiles_tokens ON gamification_profiles(total_tokens DESC, user_id);
+CREATE INDEX idx_gamification_profiles_startup_tokens ON gamification_profiles(startup_id, total_tokens DESC, user_id);
+
 -- Dashboard metrics indexes
 CREATE INDEX idx_dashboard_metrics_user ON dashboard_metrics(user_id);
 CREATE INDEX idx_dashboard_metrics_org ON dashboard_metrics(org_id);
 CREATE INDEX idx_dashboard_metrics_timestamp ON dashboard_metrics(metric_timestamp DESC);
 CREATE INDEX idx_dashboard_metrics_synthetic ON dashboard_metrics(is_synthetic, metric_timestamp);
+CREATE INDEX idx_dashboard_metrics_synthetic_created ON dashboard_metrics(created_at, metric_id) WHERE is_synthetic = TRUE;
 CREATE INDEX idx_dashboard_metrics_composite ON dashboard_metrics(user_id, dashboard_type, metric_timestamp DESC);
 
+-- Synthetic generation job indexes
+CREATE INDEX idx_synthetic_generation_jobs_claim ON synthetic_generation_jobs(status, created_at)
+    WHERE status IN ('queued', 'running');
+CREATE INDEX idx_synthetic_generation_jobs_user ON synthetic_generation_jobs(user_id, created_at DESC);
+CREATE INDEX idx_maintenance_runs_table ON maintenance_runs(table_name, created_at DESC);
+
+-- Investment indexes
+CREATE INDEX idx_investments_investor ON investments(investor_id, startup_id);
+CREATE INDEX idx_investments_startup ON investments(startup_id);
+
 -- =============================================
 -- ROW LEVEL SECURITY
 -- =============================================
@@ -7,18 +7,36 @@ Performs cleanup of old synthetic data and maintenance tasks
 import json
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 import sys
 
 # Add parent directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+from utils.batch_delete import (
+    BatchDeleter, DEFAULT_CHUNK_SIZE, expired_sessions_target,
+    synthetic_integration_data_target, synthetic_metrics_target
+)
 from utils.database_manager import DatabaseManager
+from utils.maintenance_planner import MaintenancePlanner
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Rows per delete chunk (each chunk commits on its own) and pause between chunks
+CLEANUP_CHUNK_SIZE = int(os.environ.get('CLEANUP_CHUNK_SIZE', DEFAULT_CHUNK_SIZE))
+CLEANUP_THROTTLE_MS = int(os.environ.get('CLEANUP_THROTTLE_MS', 0))
+
+# SSE score history versions kept per startup
+SSE_HISTORY_KEEP = int(os.environ.get('SSE_HISTORY_KEEP', 10))
+
+# Stop deleting when less than this (plus twice the slowest chunk) remains of the Lambda timeout
+CLEANUP_TIME_RESERVE_MS = int(os.environ.get('CLEANUP_TIME_RESERVE_MS', 60000))
+
+# Maintenance steps must fit in the remaining Lambda time minus this reserve
+MAINTENANCE_TIME_RESERVE_MS = int(os.environ.get('MAINTENANCE_TIME_RESERVE_MS', 15000))
+
 def handler(event, context):
     """
     Lambda handler for data cleanup
@@ -50,101 +68,67 @@ def handler(event, context):
         
         cleanup_results = {}
         
-        # 1. Cleanup old synthetic data
+        # Batched deletes: chunk size, pause between chunks and Lambda time budget
+        deleter = BatchDeleter(
+            db_manager,
+            chunk_size=int(params.get('chunkSize', CLEANUP_CHUNK_SIZE)),
+            throttle_ms=int(params.get('throttleMs', CLEANUP_THROTTLE_MS)),
+            remaining_ms=context.get_remaining_time_in_millis if context is not None else None,
+            time_reserve_ms=CLEANUP_TIME_RESERVE_MS
+        )
+        
+        # 1-2. Old synthetic data and expired synthetic data sessions
+        targets = []
         if cleanup_synthetic:
             logger.info(f"Cleaning up synthetic data older than {retention_days} days")
-            deleted_count = db_manager.cleanup_old_synthetic_data(retention_days)
-            cleanup_results['synthetic_data_deleted'] = deleted_count
-            logger.info(f"Deleted {deleted_count} old synthetic data records")
-        
-        # 2. Cleanup old synthetic data sessions
+            targets.append(synthetic_metrics_target(retention_days))
         if cleanup_old_sessions:
             logger.info("Cleaning up expired synthetic data sessions")
-            
-            cleanup_query = """
-                DELETE FROM synthetic_data_sessions 
-                WHERE expiry_date < %s OR 
-                      (expiry_date IS NULL AND created_at < %s)
-            """
-            
-            cutoff_date = datetime.utcnow() - timedelta(days=30)  # 30 days for sessions
-            
-            with db_manager.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(cleanup_query, (datetime.utcnow(), cutoff_date))
-                    sessions_deleted = cursor.rowcount
-                    conn.commit()
-            
-            cleanup_results['sessions_deleted'] = sessions_deleted
-            logger.info(f"Deleted {sessions_deleted} expired synthetic data sessions")
+            targets.append(expired_sessions_target())
         
-        # 3. Cleanup old SSE score history (keep only last 10 versions per startup)
-        logger.info("Cleaning up old SSE score history")
+        progress = deleter.run(targets)
+        cleanup_results['progress'] = progress
         
-        history_cleanup_query = """
-            DELETE FROM sse_score_history 
-            WHERE history_id NOT IN (
-                SELECT history_id FROM (
-                    SELECT history_id,
-                           ROW_NUMBER() OVER (PARTITION BY startup_id ORDER BY created_at DESC) as rn
-                    FROM sse_score_history
-                ) ranked
-                WHERE rn <= 10
-            )
-        """
+        if cleanup_synthetic:
+            cleanup_results['synthetic_data_deleted'] = progress['synthetic_metrics']['deleted']
+            logger.info(f"Deleted {cleanup_results['synthetic_data_deleted']} old synthetic data records")
+        if cleanup_old_sessions:
+            cleanup_results['sessions_deleted'] = progress['synthetic_sessions']['deleted']
+            logger.info(f"Deleted {cleanup_results['sessions_deleted']} expired synthetic data sessions")
+        
+        # 3. Cleanup old SSE score history (keep only the last versions of startups with new history)
+        logger.info("Cleaning up old SSE score history")
         
-        with db_manager.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(history_cleanup_query)
-                history_deleted = cursor.rowcount
-                conn.commit()
+        history_results = db_manager.prune_sse_score_history(int(params.get('historyKeep', SSE_HISTORY_KEEP)))
+        history_deleted = history_results['deleted']
         
         cleanup_results['history_deleted'] = history_deleted
+        cleanup_results['history_startups_visited'] = history_results['startups']
         logger.info(f"Deleted {history_deleted} old SSE score history records")
         
         # 4. Cleanup old integration data (keep last 90 days)
         logger.info("Cleaning up old integration data")
         
-        integration_cleanup_query = """
-            DELETE FROM integration_data 
-            WHERE created_at < %s AND is_synthetic = TRUE
-        """
-        
-        integration_cutoff = datetime.utcnow() - timedelta(days=retention_days)
-        
-        with db_manager.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(integration_cleanup_query, (integration_cutoff,))
-                integration_deleted = cursor.rowcount
-                conn.commit()
+        progress.update(deleter.run([synthetic_integration_data_target(retention_days)]))
+        integration_deleted = progress['synthetic_integration_data']['deleted']
         
         cleanup_results['integration_data_deleted'] = integration_deleted
         logger.info(f"Deleted {integration_deleted} old integration data records")
         
-        # 5. Update table statistics (optional vacuum)
+        # 5. Table and index maintenance chosen from pg_stat_user_tables (optional)
         if vacuum_database:
-            logger.info("Running database vacuum and analyze")
+            logger.info("Running planned database maintenance")
             
-            tables_to_vacuum = [
-                'dashboard_metrics',
-                'integration_data', 
-                'sse_score_history',
-                'synthetic_data_sessions'
-            ]
-            
-            with db_manager.get_connection() as conn:
-                conn.autocommit = True
-                with conn.cursor() as cursor:
-                    for table in tables_to_vacuum:
-                        try:
-                            cursor.execute(f"VACUUM ANALYZE {table}")
-                            logger.info(f"Vacuumed table: {table}")
-                        except Exception as vacuum_error:
-                            logger.warning(f"Failed to vacuum {table}: {vacuum_error}")
-                
-                conn.autocommit = False
+            planner = MaintenancePlanner(
+                db_manager,
+                remaining_ms=context.get_remaining_time_in_millis if context is not None else None,
+                time_reserve_ms=MAINTENANCE_TIME_RESERVE_MS,
+                reindex=params.get('reindex', True)
+            )
+            maintenance = planner.run()
             
-            cleanup_results['vacuum_completed'] = True
+            cleanup_results['maintenance'] = maintenance
+            cleanup_results['vacuum_completed'] = maintenance['completed'] == maintenance['planned']
         
         # 6. Get updated database statistics
         stats = db_manager.get_database_stats()
@@ -166,6 +150,7 @@ def handler(event, context):
             'statusCode': 200,
             'body': json.dumps({
                 'message': 'Data cleanup completed successfully',
+                'complete': all(table['status'] == 'complete' for table in progress.values()),
                 'cleanup_results': cleanup_results,
                 'total_deleted': total_deleted,
                 'retention_days': retention_days,
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Synthetic Metrics Compaction Lambda Handler
+Thins overlapping synthetic points in dashboard_metrics to one per time bucket, in resumable user batches
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.database_manager import DatabaseManager
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+COMPACTION_JOB_NAME = 'synthetic_compaction'
+
+# Target density: at most one synthetic point per (user, dashboard_type) per bucket
+COMPACTION_BUCKET = os.environ.get('SYNTHETIC_COMPACTION_BUCKET', '6 hours')
+COMPACTION_BATCH_USERS = int(os.environ.get('SYNTHETIC_COMPACTION_BATCH_USERS', 200))
+
+# Dashboard reads timed before and after a run
+COMPACTION_SAMPLE_SERIES = int(os.environ.get('SYNTHETIC_COMPACTION_SAMPLE_SERIES', 20))
+
+# Stop when less than this (plus twice the slowest batch so far) remains of the Lambda timeout
+TIME_RESERVE_MS = int(os.environ.get('COMPACTION_TIME_RESERVE_MS', 30000))
+
+def run_compaction(db_manager, context, bucket: str = COMPACTION_BUCKET,
+                   batch_users: int = COMPACTION_BATCH_USERS) -> dict:
+    """Compact user batches from the checkpoint on until the pass completes or time runs out"""
+    checkpoint = db_manager.start_job_checkpoint(COMPACTION_JOB_NAME)
+    cursor_value = checkpoint['cursor_value']
+
+    # The scheduled generator writes each user's own dashboard type; sample the users compacted first
+    sample = [
+        (str(user['user_id']), user['user_type'])
+        for user in db_manager.get_synthetic_generation_users(cursor_value, COMPACTION_SAMPLE_SERIES)
+    ]
+    reads_before = db_manager.measure_dashboard_reads(sample)
+
+    users = 0
+    reclaimed = 0
+    batches = 0
+    slowest_ms = 0
+    status = 'in_progress'
+
+    while True:
+        started = datetime.utcnow()
+        result = db_manager.compact_synthetic_metrics(COMPACTION_JOB_NAME, cursor_value, batch_users, bucket)
+        if result is None:
+            status = 'conflict'
+            break
+
+        users += result['users']
+        reclaimed += result['deleted']
+        batches += 1
+        cursor_value = result['cursor']
+        slowest_ms = max(slowest_ms, (datetime.utcnow() - started).total_seconds() * 1000)
+
+        if result['pass_complete']:
+            status = 'complete'
+            break
+
+        if context is not None and context.get_remaining_time_in_millis() < TIME_RESERVE_MS + 2 * slowest_ms:
+            status = 'time_budget_exhausted'
+            logger.info(f"Stopping {COMPACTION_JOB_NAME} after user {cursor_value}; resuming next invocation")
+            break
+
+    reads_after = db_manager.measure_dashboard_reads(sample)
+    speedup = reads_before['avg_ms'] / reads_after['avg_ms'] if reads_after['avg_ms'] else None
+
+    logger.info(f"Compaction reclaimed {reclaimed} rows over {users} users; dashboard reads "
+                f"{reads_before['avg_ms']}ms -> {reads_after['avg_ms']}ms")
+
+    return {
+        'status': status,
+        'bucket': bucket,
+        'users': users,
+        'batches': batches,
+        'reclaimedRows': reclaimed,
+        'cursor': cursor_value,
+        'dashboardReads': {
+            'sampledSeries': len(sample),
+            'before': reads_before,
+            'after': reads_after,
+            'speedup': round(speedup, 2) if speedup else None
+        }
+    }
+
+def handler(event, context):
+    """
+    Lambda handler for synthetic metrics compaction
+    """
+    try:
+        logger.info("Starting synthetic metrics compaction")
+
+        # Initialize database manager
+        db_manager = DatabaseManager(
+            host=os.environ.get('DB_HOST'),
+            port=int(os.environ.get('DB_PORT', 5432)),
+            database=os.environ.get('DB_NAME'),
+            username=os.environ.get('DB_USER'),
+            password=os.environ.get('DB_PASSWORD')
+        )
+
+        # Parse compaction parameters
+        body = event.get('body', '{}')
+        params = json.loads(body) if isinstance(body, str) else body
+
+        result = run_compaction(
+            db_manager,
+            context,
+            bucket=params.get('bucket', COMPACTION_BUCKET),
+            batch_users=int(params.get('batchUsers', COMPACTION_BATCH_USERS))
+        )
+
+        # Close database connections
+        db_manager.close()
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'message': 'Synthetic metrics compaction completed',
+                **result,
+                'timestamp': datetime.utcnow().isoformat()
+            })
+        }
+
+    except Exception as e:
+        logger.error(f"Synthetic metrics compaction error: {str(e)}")
+
+        return {
+            'statusCode': 500,
+            'body': json.dumps({
+                'error': f'Synthetic metrics compaction failed: {str(e)}',
+                'timestamp': datetime.utcnow().isoformat()
+            })
+        }
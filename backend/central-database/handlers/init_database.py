@@ -45,6 +45,9 @@ def handler(event, context):
             stats = db_manager.get_database_stats()
             logger.info(f"Database stats: {stats}")
             
+            # Materialize current SSE scores missing from sse_current_scores
+            backfilled_scores = db_manager.backfill_current_sse_scores()
+
             # Cleanup old synthetic data (older than 90 days)
             deleted_count = db_manager.cleanup_old_synthetic_data(90)
             logger.info(f"Cleaned up {deleted_count} old synthetic records")
@@ -55,6 +58,7 @@ def handler(event, context):
                     'message': 'Database maintenance completed',
                     'stats': stats,
                     'cleanedRecords': deleted_count,
+                    'backfilledCurrentScores': backfilled_scores,
                     'timestamp': datetime.utcnow().isoformat()
                 })
             }
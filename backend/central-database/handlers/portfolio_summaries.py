@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Portfolio Summaries Lambda Handler
+Precomputes portfolio-wide statistics for the investor and government dashboards
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.database_manager import DatabaseManager
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+def handler(event, context):
+    """
+    Lambda handler for refreshing portfolio summaries
+    """
+    try:
+        logger.info("Starting portfolio summary refresh")
+
+        # Initialize database manager
+        db_manager = DatabaseManager(
+            host=os.environ.get('DB_HOST'),
+            port=int(os.environ.get('DB_PORT', 5432)),
+            database=os.environ.get('DB_NAME'),
+            username=os.environ.get('DB_USER'),
+            password=os.environ.get('DB_PASSWORD')
+        )
+
+        started = datetime.utcnow()
+        refreshed = db_manager.refresh_portfolio_summaries()
+        duration_ms = int((datetime.utcnow() - started).total_seconds() * 1000)
+
+        logger.info(f"Portfolio summaries refreshed in {duration_ms}ms: {refreshed}")
+
+        # Close database connections
+        db_manager.close()
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'message': 'Portfolio summaries refreshed',
+                'refreshed': refreshed,
+                'durationMs': duration_ms,
+                'timestamp': datetime.utcnow().isoformat()
+            })
+        }
+
+    except Exception as e:
+        logger.error(f"Portfolio summary refresh error: {str(e)}")
+
+        return {
+            'statusCode': 500,
+            'body': json.dumps({
+                'error': f'Portfolio summary refresh failed: {str(e)}',
+                'timestamp': datetime.utcnow().isoformat()
+            })
+        }
@@ -7,6 +7,7 @@ Generates synthetic data for all dashboard types on schedule
 import json
 import logging
 import os
+import time
 from datetime import datetime
 import sys
 import random
@@ -15,12 +16,128 @@ import random
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.database_manager import DatabaseManager
-from utils.synthetic_data_generator import SyntheticDataGenerator, SyntheticDataConfig
+from utils.synthetic_data_generator import SyntheticDataGenerator, SyntheticDataConfig, BatchWorkers, DEFAULT_CHUNK_SIZE, prefetch
+from utils.series_pool import SeriesPool
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Scheduled generation walks every eligible user in shards, resuming from job_checkpoints
+SHARDED_JOB_NAME = 'synthetic_generation'
+SHARD_SIZE = int(os.environ.get('SYNTHETIC_SHARD_SIZE', 500))
+SHARD_WORKERS = int(os.environ.get('SYNTHETIC_SHARD_WORKERS', 1))
+
+# Pre-generated series for the small per-user configs of the scheduled run
+series_pool = SeriesPool(SyntheticDataGenerator())
+
+# Worker processes for SHARD_WORKERS > 1, started on first use and kept while the Lambda stays warm
+shard_workers = None
+
+# Stop when less than this (plus twice the slowest shard so far) remains of the Lambda timeout
+TIME_RESERVE_MS = int(os.environ.get('SYNTHETIC_TIME_RESERVE_MS', 30000))
+
+def _shard_configs(users):
+    """Per-user generation configs of a shard (a week of 5-15 points each)"""
+    return [
+        SyntheticDataConfig(
+            user_type=user['user_type'],
+            data_type='metrics',
+            count=random.randint(5, 15),  # Random number of data points
+            time_range_days=7,  # Last week's data
+            variance=0.2,
+            trend=random.choice(['stable', 'improving', 'declining']),
+            seed=None
+        )
+        for user in users
+    ]
+
+def _get_shard_workers():
+    global shard_workers
+    if shard_workers is None or shard_workers.closed:
+        shard_workers = BatchWorkers(SHARD_WORKERS)
+    return shard_workers
+
+def _generate_shards(db_manager, synthetic_generator, after_user_id):
+    """Yield (users, series_list) pages after after_user_id; runs ahead on the prefetch thread"""
+    while True:
+        users = db_manager.get_synthetic_generation_users(after_user_id, SHARD_SIZE)
+        configs = _shard_configs(users)
+        if SHARD_WORKERS > 1:
+            # Each worker gets a few contiguous chunks of the shard's configs
+            series_list = synthetic_generator.generate_series_list(configs, ids=False, batch_workers=_get_shard_workers())
+        else:
+            # Small per-user series come from the pool, which stays warm across warm invocations
+            series_list = [series_pool.generate_series(config, ids=False) for config in configs]
+        yield users, series_list
+        if len(users) < SHARD_SIZE:
+            return
+        after_user_id = str(users[-1]['user_id'])
+
+def run_sharded_generation(db_manager, synthetic_generator, context):
+    """Generate for every eligible user, one bulk load per shard, until done or out of time
+
+    Shards are generated one ahead of the database writes. Each shard's COPY commits together
+    with the job checkpoint, so the next invocation resumes after the last loaded user.
+    """
+    checkpoint = db_manager.start_job_checkpoint(SHARDED_JOB_NAME)
+    cursor_value = checkpoint['cursor_value']
+    logger.info(f"Resuming {SHARDED_JOB_NAME} after user {cursor_value}" if cursor_value
+                else f"Starting a new {SHARDED_JOB_NAME} pass")
+    
+    users_processed = 0
+    records = 0
+    shards = 0
+    slowest_ms = 0
+    status = 'in_progress'
+    
+    last_shard_at = time.perf_counter()
+    shard_iter = prefetch(_generate_shards(db_manager, synthetic_generator, cursor_value), depth=1)
+    try:
+        for users, series_list in shard_iter:
+            pass_complete = len(users) < SHARD_SIZE
+            next_cursor = str(users[-1]['user_id']) if users else cursor_value
+            
+            inserted = db_manager.copy_synthetic_shard(
+                [(user['user_id'], user['org_id'], series) for user, series in zip(users, series_list)],
+                SHARDED_JOB_NAME,
+                expected_cursor=cursor_value,
+                cursor_value=next_cursor,
+                pass_complete=pass_complete
+            )
+            if inserted is None:
+                status = 'conflict'
+                break
+            
+            cursor_value = None if pass_complete else next_cursor
+            users_processed += len(users)
+            records += inserted
+            shards += 1
+            # Shard time includes waiting for generation, so it covers the whole pipeline
+            now = time.perf_counter()
+            slowest_ms = max(slowest_ms, (now - last_shard_at) * 1000)
+            last_shard_at = now
+            logger.info(f"Shard {shards}: {len(users)} users, {inserted} records")
+            
+            if pass_complete:
+                status = 'complete'
+                break
+            
+            if context is not None and context.get_remaining_time_in_millis() < TIME_RESERVE_MS + 2 * slowest_ms:
+                status = 'time_budget_exhausted'
+                logger.info(f"Stopping {SHARDED_JOB_NAME} after user {cursor_value}; resuming next invocation")
+                break
+    finally:
+        shard_iter.close()
+    
+    return {
+        'status': status,
+        'totalUsers': users_processed,
+        'totalRecords': records,
+        'shards': shards,
+        'cursor': cursor_value
+    }
+
 def handler(event, context):
     """
     Lambda handler for synthetic data generation
@@ -42,68 +159,16 @@ def handler(event, context):
         # Check if this is a scheduled event or manual trigger
         is_scheduled = 'source' in event and event['source'] == 'aws.events'
         
-        if is_scheduled:
-            logger.info("Scheduled synthetic data generation")
+        if is_scheduled or event.get('job') == 'sharded':
+            logger.info("Sharded synthetic data generation")
             
-            # Generate data for all active users
-            users_query = """
-                SELECT u.user_id, u.user_type, uo.org_id
-                FROM users u
-                JOIN user_organizations uo ON u.user_id = uo.user_id
-                WHERE u.is_active = TRUE AND uo.is_primary = TRUE
-                LIMIT 100
-            """
-            
-            users = db_manager.execute_query(users_query, fetch=True)
-            
-            if not users:
-                logger.info("No active users found")
-                return {
-                    'statusCode': 200,
-                    'body': json.dumps({
-                        'message': 'No active users found for data generation',
-                        'timestamp': datetime.utcnow().isoformat()
-                    })
-                }
-            
-            total_generated = 0
-            
-            for user in users:
-                try:
-                    # Generate synthetic data for this user
-                    config = SyntheticDataConfig(
-                        user_type=user['user_type'],
-                        data_type='metrics',
-                        count=random.randint(5, 15),  # Random number of data points
-                        time_range_days=7,  # Last week's data
-                        variance=0.2,
-                        trend=random.choice(['stable', 'improving', 'declining']),
-                        seed=None
-                    )
-                    
-                    synthetic_data = synthetic_generator.generate_data(config)
-                    
-                    if synthetic_data:
-                        success = db_manager.insert_synthetic_data(
-                            data=synthetic_data,
-                            user_id=user['user_id'],
-                            org_id=user['org_id']
-                        )
-                        
-                        if success:
-                            total_generated += len(synthetic_data)
-                            logger.info(f"Generated {len(synthetic_data)} records for user {user['user_id']}")
-                        
-                except Exception as user_error:
-                    logger.error(f"Failed to generate data for user {user['user_id']}: {user_error}")
-                    continue
+            result = run_sharded_generation(db_manager, synthetic_generator, context)
             
             response = {
                 'statusCode': 200,
                 'body': json.dumps({
                     'message': 'Scheduled synthetic data generation completed',
-                    'totalUsers': len(users),
-                    'totalRecords': total_generated,
+                    **result,
                     'timestamp': datetime.utcnow().isoformat()
                 })
             }
@@ -129,46 +194,36 @@ def handler(event, context):
                 seed=params.get('seed')
             )
             
-            # Generate synthetic data
-            synthetic_data = synthetic_generator.generate_data(config)
-            
             # For manual generation, we need user_id and org_id
             user_id = params.get('userId')
             org_id = params.get('orgId')
             
-            if user_id and org_id and synthetic_data:
-                success = db_manager.insert_synthetic_data(
-                    data=synthetic_data,
+            if user_id and org_id and config.count > 0:
+                # Stream chunks into the database so large backfills run in bounded memory
+                generated = db_manager.copy_synthetic_series(
+                    synthetic_generator.iter_series(config, chunk_size=params.get('chunkSize', DEFAULT_CHUNK_SIZE), ids=False),
                     user_id=user_id,
                     org_id=org_id
                 )
                 
-                if success:
-                    response = {
-                        'statusCode': 200,
-                        'body': json.dumps({
-                            'message': 'Synthetic data generated successfully',
-                            'generated': len(synthetic_data),
-                            'config': config.__dict__,
-                            'timestamp': datetime.utcnow().isoformat()
-                        })
-                    }
-                else:
-                    response = {
-                        'statusCode': 500,
-                        'body': json.dumps({
-                            'error': 'Failed to insert synthetic data',
-                            'timestamp': datetime.utcnow().isoformat()
-                        })
-                    }
+                response = {
+                    'statusCode': 200,
+                    'body': json.dumps({
+                        'message': 'Synthetic data generated successfully',
+                        'generated': generated,
+                        'config': config.__dict__,
+                        'timestamp': datetime.utcnow().isoformat()
+                    })
+                }
             else:
-                # Return generated data without inserting
+                # Return a preview of the generated data without inserting
+                preview = synthetic_generator.generate_series(config, 0, 5).to_records()
                 response = {
                     'statusCode': 200,
                     'body': json.dumps({
                         'message': 'Synthetic data generated (not inserted)',
-                        'data': synthetic_data[:5] if synthetic_data else [],  # Return first 5 records
-                        'total': len(synthetic_data) if synthetic_data else 0,
+                        'data': preview,  # Return first 5 records
+                        'total': max(0, config.count),
                         'config': config.__dict__,
                         'timestamp': datetime.utcnow().isoformat()
                     })
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Synthetic Generation Job Worker
+Runs queued synthetic_generation_jobs (from POST /api/synthetic/generate) on schedule or as worker processes
+
+Usage: python handlers/synthetic_jobs.py [--workers 4] [--poll-interval 5]
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import time
+from datetime import datetime
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.database_manager import DatabaseManager
+from utils.synthetic_data_generator import SyntheticDataGenerator, SyntheticDataConfig, DEFAULT_CHUNK_SIZE
+from utils.template_compiler import TemplateCompiler
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+JOB_CHUNK_SIZE = int(os.environ.get('SYNTHETIC_JOB_CHUNK_SIZE', DEFAULT_CHUNK_SIZE))
+JOB_MAX_ATTEMPTS = int(os.environ.get('SYNTHETIC_JOB_MAX_ATTEMPTS', 3))
+
+# Running jobs without a heartbeat for this long are reclaimed from their (dead) worker
+JOB_STALE_SECONDS = int(os.environ.get('SYNTHETIC_JOB_STALE_SECONDS', 300))
+
+# Requeue the current job when less than this remains of the Lambda timeout
+TIME_RESERVE_MS = int(os.environ.get('SYNTHETIC_TIME_RESERVE_MS', 30000))
+
+def create_db_manager():
+    return DatabaseManager(
+        host=os.environ.get('DB_HOST'),
+        port=int(os.environ.get('DB_PORT', 5432)),
+        database=os.environ.get('DB_NAME'),
+        username=os.environ.get('DB_USER'),
+        password=os.environ.get('DB_PASSWORD')
+    )
+
+def run_job(db_manager, synthetic_generator, template_compiler, job, worker_id, out_of_time) -> str:
+    """Load a claimed job chunk by chunk from rows_generated on; returns the job's resulting status"""
+    job_id = str(job['job_id'])
+
+    try:
+        config = SyntheticDataConfig(**job['config'])
+
+        plan = None
+        if job['template_id']:
+            template = db_manager.get_synthetic_template(str(job['template_id']))
+            if not template:
+                raise ValueError("Template not found")
+            plan = template_compiler.get_plan(template)
+
+        chunks = synthetic_generator.iter_series(
+            config, chunk_size=JOB_CHUNK_SIZE, plan=plan, start=job['rows_generated'], end=job['series_end'], ids=False
+        )
+        try:
+            for series in chunks:
+                if not db_manager.copy_synthetic_job_chunk(job_id, worker_id, series, job['user_id'], job['org_id']):
+                    return 'lost'
+                if out_of_time():
+                    db_manager.finish_synthetic_job(job_id, worker_id, 'queued', count_attempt=False)
+                    return 'queued'
+        finally:
+            chunks.close()
+
+        if plan:
+            db_manager.record_template_usage(plan.template_id)
+        db_manager.finish_synthetic_job(job_id, worker_id, 'completed')
+        return 'completed'
+
+    except Exception as e:
+        logger.error(f"Synthetic generation job {job_id} failed: {e}")
+        status = 'failed' if job['attempts'] >= JOB_MAX_ATTEMPTS else 'queued'
+        db_manager.finish_synthetic_job(job_id, worker_id, status, error=str(e))
+        return status
+
+def run_worker(db_manager, synthetic_generator, template_compiler, worker_id, out_of_time) -> dict:
+    """Claim and run jobs until the queue is empty or time runs out"""
+    results = {}
+    while not out_of_time():
+        job = db_manager.claim_synthetic_job(worker_id, JOB_STALE_SECONDS, JOB_MAX_ATTEMPTS)
+        if not job:
+            break
+        logger.info(f"Worker {worker_id} claimed job {job['job_id']} at row {job['rows_generated']}")
+        status = run_job(db_manager, synthetic_generator, template_compiler, job, worker_id, out_of_time)
+        results[status] = results.get(status, 0) + 1
+    return results
+
+def handler(event, context):
+    """
+    Lambda handler running queued synthetic generation jobs
+    """
+    try:
+        db_manager = create_db_manager()
+        synthetic_generator = SyntheticDataGenerator()
+        template_compiler = TemplateCompiler(synthetic_generator.metric_ranges)
+        worker_id = f"lambda:{getattr(context, 'aws_request_id', os.getpid())}"
+
+        def out_of_time():
+            return context is not None and context.get_remaining_time_in_millis() < TIME_RESERVE_MS
+
+        results = run_worker(db_manager, synthetic_generator, template_compiler, worker_id, out_of_time)
+
+        # Close database connections
+        db_manager.close()
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'message': 'Synthetic generation jobs processed',
+                'jobs': results,
+                'timestamp': datetime.utcnow().isoformat()
+            })
+        }
+
+    except Exception as e:
+        logger.error(f"Synthetic generation job worker error: {str(e)}")
+
+        return {
+            'statusCode': 500,
+            'body': json.dumps({
+                'error': f'Synthetic generation job worker failed: {str(e)}',
+                'timestamp': datetime.utcnow().isoformat()
+            })
+        }
+
+def worker_process(poll_interval: float):
+    """Long-running worker: poll for jobs until interrupted"""
+    db_manager = create_db_manager()
+    synthetic_generator = SyntheticDataGenerator()
+    template_compiler = TemplateCompiler(synthetic_generator.metric_ranges)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    try:
+        while True:
+            if not run_worker(db_manager, synthetic_generator, template_compiler, worker_id, lambda: False):
+                time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db_manager.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=1, help='worker processes')
+    parser.add_argument('--poll-interval', type=float, default=5.0, help='seconds between polls of an empty queue')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    processes = [
+        multiprocessing.Process(target=worker_process, args=(args.poll_interval,), daemon=True)
+        for _ in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Auxeira Batched Deletes
+Deletes rows matching a predicate in index-ordered chunks with short commits, resumable through job_checkpoints
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.unit_of_work import RollbackTransaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Stop when less than this (plus twice the slowest chunk so far) remains of the time budget
+DEFAULT_TIME_RESERVE_MS = 30000
+
+
+@dataclass
+class DeleteTarget:
+    """Rows of table matching where, visited in order_by order (an index order whose last column is unique)"""
+    name: str
+    table: str
+    where: str
+    order_by: Tuple[str, ...]
+    cursor_types: Tuple[str, ...]
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def job_name(self) -> str:
+        return f"cleanup:{self.name}"
+
+    def chunk_query(self, resume: bool) -> str:
+        """Delete the next chunk; returns rows deleted, rows visited and the last visited key"""
+        columns = ', '.join(self.order_by)
+        key = self.order_by[-1]
+        after = ''
+        if resume:
+            bounds = ', '.join(f"%(after_{i})s::{kind}" for i, kind in enumerate(self.cursor_types))
+            after = f"AND ({columns}) > ({bounds})"
+
+        return f"""
+            WITH chunk AS (
+                SELECT {columns} FROM {self.table}
+                WHERE ({self.where}) {after}
+                ORDER BY {columns}
+                LIMIT %(chunk_size)s
+            ),
+            deleted AS (
+                DELETE FROM {self.table} t
+                USING chunk c
+                WHERE t.{key} = c.{key}
+                RETURNING 1
+            )
+            SELECT (SELECT COUNT(*) FROM deleted) AS deleted,
+                   (SELECT COUNT(*) FROM chunk) AS visited,
+                   (SELECT json_build_array({columns}) FROM chunk
+                    ORDER BY {', '.join(f'{column} DESC' for column in self.order_by)} LIMIT 1) AS last_key
+        """
+
+
+def synthetic_metrics_target(retention_days: int) -> DeleteTarget:
+    """Synthetic dashboard_metrics created before the retention window"""
+    return DeleteTarget(
+        name='synthetic_metrics',
+        table='dashboard_metrics',
+        where="is_synthetic = TRUE AND created_at < %(cutoff)s",
+        order_by=('created_at', 'metric_id'),
+        cursor_types=('timestamptz', 'uuid'),
+        params={'cutoff': datetime.now(timezone.utc) - timedelta(days=retention_days)}
+    )
+
+
+def expired_sessions_target(session_days: int = 30) -> DeleteTarget:
+    """Synthetic data sessions past their expiry date, or older than session_days without one"""
+    now = datetime.now(timezone.utc)
+    return DeleteTarget(
+        name='synthetic_sessions',
+        table='synthetic_data_sessions',
+        where="expiry_date < %(now)s OR (expiry_date IS NULL AND created_at < %(cutoff)s)",
+        order_by=('session_id',),
+        cursor_types=('uuid',),
+        params={'now': now, 'cutoff': now - timedelta(days=session_days)}
+    )
+
+
+def synthetic_integration_data_target(retention_days: int) -> DeleteTarget:
+    """Synthetic integration_data created before the retention window"""
+    return DeleteTarget(
+        name='synthetic_integration_data',
+        table='integration_data',
+        where="is_synthetic = TRUE AND created_at < %(cutoff)s",
+        order_by=('created_at', 'data_id'),
+        cursor_types=('timestamptz', 'uuid'),
+        params={'cutoff': datetime.now(timezone.utc) - timedelta(days=retention_days)}
+    )
+
+
+class BatchDeleter:
+    """Runs DeleteTargets chunk by chunk until they are done or the time budget runs low
+
+    Every chunk commits together with its target's job_checkpoints cursor, so an interrupted
+    run loses at most the chunk in flight and the next run resumes after the last deleted key.
+    """
+
+    def __init__(self,
+                 db_manager,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 throttle_ms: int = 0,
+                 remaining_ms: Optional[Callable[[], int]] = None,
+                 time_reserve_ms: int = DEFAULT_TIME_RESERVE_MS):
+        self.db_manager = db_manager
+        self.chunk_size = chunk_size
+        self.throttle_ms = throttle_ms
+        self.remaining_ms = remaining_ms
+        self.time_reserve_ms = time_reserve_ms
+        self.slowest_ms = 0.0
+
+    def out_of_time(self) -> bool:
+        return self.remaining_ms is not None and \
+            self.remaining_ms() < self.time_reserve_ms + 2 * self.slowest_ms
+
+    def run(self, targets: List[DeleteTarget]) -> Dict[str, Dict[str, Any]]:
+        """Progress per target name: status, rows deleted and visited, chunks and elapsed time"""
+        progress = {}
+        for target in targets:
+            if self.out_of_time():
+                progress[target.name] = {'status': 'pending', 'deleted': 0, 'visited': 0, 'chunks': 0}
+                continue
+            progress[target.name] = self.run_target(target)
+        return progress
+
+    def run_target(self, target: DeleteTarget) -> Dict[str, Any]:
+        checkpoint = self.db_manager.start_job_checkpoint(target.job_name)
+        cursor_value = checkpoint['cursor_value']
+        result = {'status': 'in_progress', 'deleted': 0, 'visited': 0, 'chunks': 0}
+        started = time.perf_counter()
+
+        while True:
+            chunk_started = time.perf_counter()
+            chunk = self.delete_chunk(target, cursor_value)
+            if chunk is None:
+                result['status'] = 'conflict'
+                break
+
+            result['deleted'] += chunk['deleted']
+            result['visited'] += chunk['visited']
+            result['chunks'] += 1
+            cursor_value = chunk['cursor']
+            self.slowest_ms = max(self.slowest_ms, (time.perf_counter() - chunk_started) * 1000)
+
+            if chunk['pass_complete']:
+                result['status'] = 'complete'
+                break
+
+            if self.out_of_time():
+                result['status'] = 'time_budget_exhausted'
+                logger.info(f"Stopping {target.job_name} at {cursor_value}; resuming next invocation")
+                break
+
+            if self.throttle_ms:
+                time.sleep(self.throttle_ms / 1000)
+
+        result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"{target.name}: deleted {result['deleted']} rows in {result['chunks']} chunks ({result['status']})")
+        return result
+
+    def delete_chunk(self, target: DeleteTarget, expected_cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Delete one chunk after expected_cursor and advance the checkpoint in the same transaction
+
+        Returns None if another run already moved the checkpoint.
+        """
+        params = dict(target.params, chunk_size=self.chunk_size)
+        if expected_cursor is not None:
+            params.update({f"after_{i}": value for i, value in enumerate(json.loads(expected_cursor))})
+
+        try:
+            with self.db_manager.transaction(own_transaction=True) as cursor:
+                cursor.execute(target.chunk_query(expected_cursor is not None), params)
+                row = cursor.fetchone()
+                pass_complete = row['visited'] < self.chunk_size
+                cursor_value = json.dumps(row['last_key']) if row['last_key'] else expected_cursor
+
+                if not self.db_manager.advance_job_checkpoint(cursor, target.job_name, expected_cursor,
+                                                              cursor_value, row['deleted'], pass_complete):
+                    raise RollbackTransaction(f"Checkpoint of {target.job_name} moved by another run; chunk rolled back")
+        except RollbackTransaction as e:
+            logger.warning(str(e))
+            return None
+
+        return {
+            'deleted': row['deleted'],
+            'visited': row['visited'],
+            'cursor': None if pass_complete else cursor_value,
+            'pass_complete': pass_complete
+        }
@@ -4,21 +4,104 @@ Auxeira Database Manager
 Handles database connections, migrations, and data operations with timestamping
 """
 
+import io
 import os
 import json
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 from contextlib import contextmanager
 import psycopg2
-from psycopg2.extras import RealDictCursor, Json
+from psycopg2.extras import RealDictCursor, Json, execute_values
 from psycopg2.pool import ThreadedConnectionPool
 import uuid
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.batch_delete import BatchDeleter, DEFAULT_CHUNK_SIZE, synthetic_metrics_target
+from utils.ids import uuid7, uuid7_batch, uuid7_floor, uuid7_timestamp
+from utils.leaderboard import create_leaderboard_service, current_week_start
+from utils.query_profiler import QueryProfiler, DEFAULT_SLOW_QUERY_MS
+from utils.request_timing import timed
+from utils.score_distribution import ScoreDistribution
+from utils.unit_of_work import RollbackTransaction, UnitOfWork, current_unit_of_work, start_unit_of_work
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Scope id used for ecosystem-wide rows in portfolio_summaries
+ECOSYSTEM_SCOPE_ID = '00000000-0000-0000-0000-000000000000'
+
+# SSE score buckets (inclusive bounds) used for portfolio score distributions
+SCORE_BUCKETS = [(low, low + 9 if low < 90 else 100) for low in range(0, 100, 10)]
+
+# SSE score history newer than this is left to the next prune, so transactions still open are not skipped
+SSE_HISTORY_PRUNE_LAG_SECONDS = 300
+
+# Latest SSE score per startup (materialized in sse_current_scores by insert_sse_score)
+LATEST_SSE_SCORES_CTE = """
+    latest AS (
+        SELECT startup_id, total_score, is_synthetic
+        FROM sse_current_scores
+    )
+"""
+
+# Aggregate columns shared by every portfolio_summaries grouping
+PORTFOLIO_STATS_COLUMNS = """
+    COUNT(*) AS startup_count,
+    COUNT(total_score) AS scored_count,
+    COUNT(*) FILTER (WHERE is_synthetic) AS synthetic_count,
+    ROUND(AVG(total_score), 2) AS avg_sse_score,
+    MIN(total_score) AS min_sse_score,
+    MAX(total_score) AS max_sse_score,
+    percentile_cont(0.25) WITHIN GROUP (ORDER BY total_score) AS p25_sse_score,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY total_score) AS median_sse_score,
+    percentile_cont(0.75) WITHIN GROUP (ORDER BY total_score) AS p75_sse_score,
+    jsonb_build_object({distribution}) AS score_distribution
+""".format(distribution=', '.join(
+    f"'{low}-{high}', COUNT(*) FILTER (WHERE total_score BETWEEN {low} AND {high})"
+    for low, high in SCORE_BUCKETS
+))
+
+PORTFOLIO_SUMMARY_INSERT_COLUMNS = """
+    scope_type, scope_id, dimension, dimension_value,
+    startup_count, scored_count, synthetic_count,
+    avg_sse_score, min_sse_score, max_sse_score,
+    p25_sse_score, median_sse_score, p75_sse_score, score_distribution,
+    total_invested, refreshed_at
+"""
+
+# Actions per INSERT statement when recording actions in bulk
+ACTION_BATCH_PAGE_SIZE = 1000
+
+# synthetic_algorithm prefix of rows written by the scheduled generator, the only rows compaction thins
+SCHEDULED_ALGORITHM_PREFIX = 'scheduled:'
+
+# Bulk load of synthetic series rows (see _synthetic_copy_text); metric ids come from the column default
+SYNTHETIC_COPY_QUERY = """
+    COPY dashboard_metrics (
+        user_id, org_id, dashboard_type, metric_name,
+        metric_value, metric_timestamp, is_synthetic, synthetic_algorithm, created_at
+    ) FROM STDIN
+"""
+
+
+def _synthetic_copy_text(series: Any, user_id: str, org_id: str, created_at: str, algorithm_prefix: str = '') -> str:
+    """COPY text rows of one synthetic series for SYNTHETIC_COPY_QUERY"""
+    # Generated values never contain tabs, newlines or backslashes, so no escaping is needed
+    prefix = f"{user_id}\t{org_id}\t{series.dashboard_type}\tsynthetic_metrics\t"
+    suffix = f"\tt\t{algorithm_prefix}{series.synthetic_algorithm}\t{created_at}\n"
+    return ''.join(
+        f"{prefix}{metrics}\t{timestamp}{suffix}"
+        for metrics, timestamp in zip(series.metrics_json(), series.timestamp_strings())
+    )
+
+
 class DatabaseManager:
     """Main database manager class with connection pooling and timestamping"""
     
@@ -29,7 +112,10 @@ class DatabaseManager:
                  username: str = "postgres",
                  password: str = "postgres",
                  min_connections: int = 1,
-                 max_connections: int = 20):
+                 max_connections: int = 20,
+                 score_rebuild_interval: int = int(os.environ.get('SSE_DISTRIBUTION_REBUILD_SECONDS', 900)),
+                 profile_queries: bool = os.environ.get('QUERY_PROFILING', 'false').lower() == 'true',
+                 slow_query_ms: float = float(os.environ.get('SLOW_QUERY_MS', DEFAULT_SLOW_QUERY_MS))):
         
         self.connection_params = {
             'host': host,
@@ -39,6 +125,11 @@ class DatabaseManager:
             'password': password
         }
         
+        # Per-statement timings (opt-in): every cursor of every pooled connection reports to the profiler
+        self.profiler = QueryProfiler(slow_query_ms=slow_query_ms) if profile_queries else None
+        if self.profiler:
+            self.connection_params['connection_factory'] = self.profiler.connection_factory()
+        
         # Initialize connection pool
         try:
             self.pool = ThreadedConnectionPool(
@@ -50,34 +141,102 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Failed to initialize connection pool: {e}")
             raise
+
+        # Latest-score histogram for SSE percentile ranking
+        self.score_distribution = ScoreDistribution(rebuild_interval_seconds=score_rebuild_interval)
+
+        # Token leaderboards (in process, or Redis when REDIS_HOST is set)
+        self.leaderboards = create_leaderboard_service()
+        self._leaderboard_lock = threading.Lock()
     
+    def _checkout(self):
+        """Connection from the pool (its wait is reported to the profiler)"""
+        if not self.profiler:
+            return self.pool.getconn()
+        started = time.perf_counter()
+        conn = self.pool.getconn()
+        conn.pool_wait_ms = (time.perf_counter() - started) * 1000
+        return conn
+
+    def begin_unit_of_work(self, shared: bool = True) -> UnitOfWork:
+        """Share one connection and transaction among this context's calls until the unit of work finishes
+
+        Inside it, commit() and rollback() of the connections handed out act on savepoints; the
+        transaction commits or rolls back in UnitOfWork.finish (see api.main's request hooks).
+        """
+        return start_unit_of_work(UnitOfWork(self.pool, self._checkout, shared=shared))
+
+    def _after_commit(self, callback) -> None:
+        """Run callback once the current unit of work commits, or now outside of one"""
+        unit = current_unit_of_work()
+        if unit is not None and unit.pool is self.pool and unit.shared:
+            unit.after_commit(callback)
+        else:
+            callback()
+
     @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
+    def get_connection(self, own_transaction: bool = False):
+        """Context manager for database connections (counted as db time of the current API request)
+
+        own_transaction=True checks out a separate connection even inside a unit of work, so its
+        commits are real: bulk paths committing in chunks keep their transactions (and row locks)
+        short instead of holding them until the request ends. It must not touch rows the request's
+        own transaction has locked.
+        """
+        unit = current_unit_of_work()
+        if unit is not None and unit.pool is self.pool:
+            if unit.shared and not own_transaction:
+                with timed('db'):
+                    with unit.connection() as conn:
+                        yield conn
+                return
+            unit.count_checkout()
+
         conn = None
-        try:
-            conn = self.pool.getconn()
-            yield conn
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"Database operation failed: {e}")
-            raise
-        finally:
-            if conn:
-                self.pool.putconn(conn)
+        with timed('db'):
+            try:
+                conn = self._checkout()
+                yield conn
+            except Exception as e:
+                if conn:
+                    conn.rollback()
+                logger.error(f"Database operation failed: {e}")
+                raise
+            finally:
+                if conn:
+                    self.pool.putconn(conn)
     
+    @contextmanager
+    def transaction(self, own_transaction: bool = False):
+        """Context manager yielding a cursor whose statements commit or roll back together
+
+        Raise RollbackTransaction to roll back without logging an error. The rollback goes through
+        the connection get_connection handed out, so inside a unit of work it undoes only this
+        transaction's savepoint. See get_connection for own_transaction.
+        """
+        rolled_back = None
+        with self.get_connection(own_transaction) as conn:
+            try:
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    yield cursor
+            except RollbackTransaction as e:
+                conn.rollback()
+                rolled_back = e
+            else:
+                conn.commit()
+        if rolled_back is not None:
+            raise rolled_back
+
     def execute_query(self, query: str, params: Optional[Tuple] = None, fetch: bool = False) -> Optional[List[Dict]]:
         """Execute a query with optional parameters"""
         with self.get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cursor:
                 cursor.execute(query, params)
-                
-                if fetch:
-                    return [dict(row) for row in cursor.fetchall()]
-                else:
-                    conn.commit()
-                    return None
+
+                # Commit fetched statements too, so INSERT ... RETURNING persists
+                rows = [dict(row) for row in cursor.fetchall()] if fetch else None
+                conn.commit()
+                return rows
     
     def execute_many(self, query: str, params_list: List[Tuple]) -> None:
         """Execute a query multiple times with different parameters"""
@@ -86,6 +245,29 @@ class DatabaseManager:
                 cursor.executemany(query, params_list)
                 conn.commit()
     
+    def iter_query(self, query: str, params: Optional[Tuple] = None, batch_size: int = 10000) -> Iterable[List[Dict]]:
+        """Stream a query's rows in batches of dicts through a server-side cursor
+
+        Only one batch is held in memory, so large tables can be exported (see utils.exporters).
+        """
+        with self.get_connection() as conn:
+            try:
+                with conn.cursor(name=f"export_{uuid.uuid4().hex}", cursor_factory=RealDictCursor) as cursor:
+                    cursor.itersize = batch_size
+                    cursor.execute(query, params)
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        yield [dict(row) for row in rows]
+            except GeneratorExit:
+                # The consumer stopped early: the cursor is closed, end its transaction before the
+                # connection goes back
+                if not conn.closed:
+                    conn.rollback()
+                raise
+            conn.commit()
+    
     def initialize_database(self, schema_file: str = "database/init.sql") -> bool:
         """Initialize the database with the schema"""
         try:
@@ -120,7 +302,7 @@ class DatabaseManager:
             
             for record in data:
                 params = (
-                    record.get('metric_id', str(uuid.uuid4())),
+                    record.get('metric_id') or uuid7(),
                     user_id,
                     org_id,
                     record['dashboard_type'],
@@ -141,6 +323,250 @@ class DatabaseManager:
             logger.error(f"Failed to insert synthetic data: {e}")
             return False
     
+    def copy_synthetic_series(self, chunks: Iterable[Any], user_id: str, org_id: str) -> int:
+        """Stream synthetic series chunks (SyntheticDataGenerator.iter_series) into dashboard_metrics
+
+        Each chunk is written with one COPY and committed, so memory stays bounded by the
+        chunk size and a failure keeps the chunks already loaded. Returns rows inserted.
+        Metric ids are assigned by the database, so generate the chunks with ids=False to
+        skip the ids.
+        """
+        inserted = 0
+        started = time.perf_counter()
+        created_at = datetime.now(timezone.utc).isoformat()
+
+        with self.get_connection(own_transaction=True) as conn:
+            with conn.cursor() as cursor:
+                for series in chunks:
+                    buffer = io.StringIO(_synthetic_copy_text(series, user_id, org_id, created_at))
+                    cursor.copy_expert(SYNTHETIC_COPY_QUERY, buffer)
+                    conn.commit()
+                    inserted += len(series)
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Copied {inserted} synthetic data records in {elapsed:.1f}s "
+                    f"({inserted / elapsed if elapsed else 0:.0f} rows/s)")
+        return inserted
+    
+    def get_synthetic_generation_users(self, after_user_id: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """Next page of active users with a primary organization, in user_id order (keyset pagination)"""
+        query = """
+            SELECT u.user_id, u.user_type, uo.org_id
+            FROM users u
+            JOIN user_organizations uo ON u.user_id = uo.user_id AND uo.is_primary = TRUE
+            WHERE u.is_active = TRUE
+              AND (%s::uuid IS NULL OR u.user_id > %s::uuid)
+            ORDER BY u.user_id
+            LIMIT %s
+        """
+        return self.execute_query(query, (after_user_id, after_user_id, limit), fetch=True) or []
+    
+    def start_job_checkpoint(self, job_name: str) -> Dict[str, Any]:
+        """Checkpoint of a job, created at the start of a pass if it does not exist yet"""
+        # The no-op update makes RETURNING give the row even when a concurrent run inserted it first,
+        # which a DO NOTHING insert unioned with a select (same snapshot) does not see
+        query = """
+            INSERT INTO job_checkpoints (job_name)
+            VALUES (%s)
+            ON CONFLICT (job_name) DO UPDATE SET job_name = EXCLUDED.job_name
+            RETURNING *
+        """
+        return self.execute_query(query, (job_name,), fetch=True)[0]
+    
+    def advance_job_checkpoint(self, cursor, job_name: str, expected_cursor: Optional[str],
+                               cursor_value: Optional[str], processed: int, pass_complete: bool = False) -> bool:
+        """Move a job's keyset cursor inside the caller's transaction
+
+        Only succeeds if the stored cursor is still expected_cursor, so two overlapping runs of
+        a job can never both commit the same range. A completed pass resets the cursor to NULL.
+        """
+        cursor.execute("""
+            UPDATE job_checkpoints SET
+                cursor_value = CASE WHEN %(complete)s THEN NULL ELSE %(cursor_value)s END,
+                pass_processed = CASE WHEN %(complete)s THEN 0 ELSE pass_processed + %(processed)s END,
+                total_processed = total_processed + %(processed)s,
+                passes_completed = passes_completed + CASE WHEN %(complete)s THEN 1 ELSE 0 END,
+                pass_started_at = CASE WHEN %(complete)s THEN NOW() ELSE pass_started_at END,
+                last_completed_at = CASE WHEN %(complete)s THEN NOW() ELSE last_completed_at END,
+                updated_at = NOW()
+            WHERE job_name = %(job_name)s
+              AND cursor_value IS NOT DISTINCT FROM %(expected)s
+        """, {
+            'job_name': job_name,
+            'expected': expected_cursor,
+            'cursor_value': cursor_value,
+            'processed': processed,
+            'complete': pass_complete
+        })
+        return cursor.rowcount == 1
+    
+    def copy_synthetic_shard(self, shard: List[Tuple[str, str, Any]], job_name: str,
+                             expected_cursor: Optional[str], cursor_value: Optional[str],
+                             pass_complete: bool = False) -> Optional[int]:
+        """Load a shard of (user_id, org_id, series) with one COPY and advance the job checkpoint
+
+        Both happen in one transaction, so a shard is either fully loaded and checkpointed or
+        not at all. Rows are tagged with SCHEDULED_ALGORITHM_PREFIX for compaction. Returns rows
+        inserted, or None if another run already moved the checkpoint.
+        """
+        created_at = datetime.now(timezone.utc).isoformat()
+
+        try:
+            with self.transaction(own_transaction=True) as cursor:
+                if not self.advance_job_checkpoint(cursor, job_name, expected_cursor, cursor_value,
+                                                   len(shard), pass_complete):
+                    raise RollbackTransaction(f"Checkpoint of {job_name} moved by another run; shard discarded")
+
+                if shard:
+                    buffer = io.StringIO(''.join(
+                        _synthetic_copy_text(series, user_id, org_id, created_at, SCHEDULED_ALGORITHM_PREFIX)
+                        for user_id, org_id, series in shard
+                    ))
+                    cursor.copy_expert(SYNTHETIC_COPY_QUERY, buffer)
+        except RollbackTransaction as e:
+            logger.warning(str(e))
+            return None
+
+        return sum(len(series) for _, _, series in shard)
+    
+    def enqueue_synthetic_job(self, user_id: str, org_id: str, config: Dict[str, Any],
+                              template_id: Optional[str] = None, series_end: Optional[datetime] = None) -> Optional[str]:
+        """Queue a synthetic generation job for handlers.synthetic_jobs workers
+
+        series_end anchors the series' time axis (default: now); every chunk is generated against it.
+        """
+        try:
+            query = """
+                INSERT INTO synthetic_generation_jobs (user_id, org_id, template_id, config, rows_total, series_end)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                RETURNING job_id
+            """
+            series_end = series_end or datetime.now(timezone.utc)
+            result = self.execute_query(
+                query, (user_id, org_id, template_id, Json(config), max(0, config['count']), series_end), fetch=True
+            )
+            job_id = str(result[0]['job_id'])
+            logger.info(f"Queued synthetic generation job {job_id} ({config['count']} rows)")
+            return job_id
+            
+        except Exception as e:
+            logger.error(f"Failed to queue synthetic generation job: {e}")
+            return None
+    
+    def claim_synthetic_job(self, worker_id: str, stale_seconds: int = 300,
+                            max_attempts: int = 3) -> Optional[Dict[str, Any]]:
+        """Claim the oldest queued job, or a running one whose worker stopped heartbeating
+
+        FOR UPDATE SKIP LOCKED lets any number of workers poll the table without blocking
+        each other or claiming the same job. Stale jobs that already used max_attempts (e.g.
+        ones that keep killing their worker) are failed instead of reclaimed.
+        """
+        with self.transaction() as cursor:
+            cursor.execute("""
+                UPDATE synthetic_generation_jobs SET
+                    status = 'failed',
+                    error = 'Worker stopped heartbeating on the last attempt',
+                    completed_at = NOW()
+                WHERE status = 'running'
+                  AND heartbeat_at < NOW() - make_interval(secs => %s)
+                  AND attempts >= %s
+                RETURNING job_id
+            """, (stale_seconds, max_attempts))
+            for row in cursor.fetchall():
+                logger.warning(f"Synthetic generation job {row['job_id']} failed after {max_attempts} attempts")
+
+            cursor.execute("""
+                UPDATE synthetic_generation_jobs SET
+                    status = 'running',
+                    worker_id = %s,
+                    attempts = attempts + 1,
+                    started_at = COALESCE(started_at, NOW()),
+                    heartbeat_at = NOW()
+                WHERE job_id = (
+                    SELECT job_id FROM synthetic_generation_jobs
+                    WHERE status = 'queued'
+                       OR (status = 'running' AND heartbeat_at < NOW() - make_interval(secs => %s)
+                           AND attempts < %s)
+                    ORDER BY created_at
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING *
+            """, (worker_id, stale_seconds, max_attempts))
+            result = cursor.fetchone()
+        return dict(result) if result else None
+    
+    def copy_synthetic_job_chunk(self, job_id: str, worker_id: str, series: Any, user_id: str, org_id: str) -> bool:
+        """Load one chunk of a job and record its progress in the same transaction
+
+        Returns False (loading nothing) if the job is no longer held by this worker.
+        """
+        created_at = datetime.now(timezone.utc).isoformat()
+        
+        with self.transaction(own_transaction=True) as cursor:
+            cursor.execute("""
+                UPDATE synthetic_generation_jobs
+                SET rows_generated = rows_generated + %s, heartbeat_at = NOW()
+                WHERE job_id = %s AND worker_id = %s AND status = 'running'
+            """, (len(series), job_id, worker_id))
+            if cursor.rowcount != 1:
+                logger.warning(f"Synthetic generation job {job_id} is no longer held by {worker_id}")
+                return False
+            
+            cursor.copy_expert(SYNTHETIC_COPY_QUERY, io.StringIO(_synthetic_copy_text(series, user_id, org_id, created_at)))
+        return True
+    
+    def finish_synthetic_job(self, job_id: str, worker_id: str, status: str,
+                             error: Optional[str] = None, count_attempt: bool = True) -> None:
+        """Complete, fail or requeue ('queued') a job held by worker_id
+
+        A requeue with count_attempt=False (e.g. out of time) does not use up an attempt.
+        """
+        query = """
+            UPDATE synthetic_generation_jobs SET
+                status = %s,
+                error = %s,
+                attempts = attempts - CASE WHEN %s THEN 0 ELSE 1 END,
+                worker_id = CASE WHEN %s = 'queued' THEN NULL ELSE worker_id END,
+                completed_at = CASE WHEN %s IN ('completed', 'failed') THEN NOW() END
+            WHERE job_id = %s AND worker_id = %s
+        """
+        self.execute_query(query, (status, error, count_attempt, status, status, job_id, worker_id))
+        logger.info(f"Synthetic generation job {job_id}: {status}")
+    
+    def get_synthetic_job(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """A user's synthetic generation job"""
+        query = """
+            SELECT job_id, template_id, config, status, rows_total, rows_generated, attempts, error,
+                   created_at, started_at, heartbeat_at, completed_at
+            FROM synthetic_generation_jobs
+            WHERE job_id = %s AND user_id = %s
+        """
+        result = self.execute_query(query, (job_id, user_id), fetch=True)
+        return result[0] if result else None
+    
+    def get_synthetic_template(self, template_id: str) -> Optional[Dict[str, Any]]:
+        """Get an active synthetic data template with its schema and generation rules"""
+        query = """
+            SELECT template_id, template_name, user_type, data_schema, generation_rules,
+                   default_parameters, version, updated_at
+            FROM synthetic_data_templates
+            WHERE template_id = %s AND is_active = TRUE
+        """
+
+        result = self.execute_query(query, (template_id,), fetch=True)
+        return result[0] if result else None
+
+    def record_template_usage(self, template_id: str) -> None:
+        """Count a generation run against a template (leaves updated_at, and so cached plans, alone)"""
+        query = """
+            UPDATE synthetic_data_templates
+            SET usage_count = usage_count + 1, last_used = NOW()
+            WHERE template_id = %s
+        """
+
+        self.execute_query(query, (template_id,))
+    
     def get_dashboard_metrics(self, 
                             user_id: str, 
                             dashboard_type: str, 
@@ -245,56 +671,182 @@ class DatabaseManager:
                          component_scores: Dict[str, Any],
                          responses: Dict[str, Any],
                          created_by: str,
-                         is_synthetic: bool = False) -> Optional[str]:
-        """Insert SSE score with versioning and timestamping"""
+                         is_synthetic: bool = False) -> Optional[Dict[str, Any]]:
+        """Insert SSE score with versioning and timestamping
+
+        Returns the stored score_id, version and percentile, or None on failure.
+        """
         try:
-            # Get next version number
-            version_query = """
-                SELECT COALESCE(MAX(version), 0) + 1 as next_version 
-                FROM sse_scores 
-                WHERE startup_id = %s
-            """
-            version_result = self.execute_query(version_query, (startup_id,), fetch=True)
-            next_version = version_result[0]['next_version'] if version_result else 1
-            
-            # Insert new score
-            score_id = str(uuid.uuid4())
-            insert_query = """
-                INSERT INTO sse_scores (
-                    score_id, startup_id, version, total_score, component_scores, 
-                    responses, is_synthetic, created_at, created_by
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING score_id
-            """
-            
-            params = (
-                score_id, startup_id, next_version, total_score,
-                Json(component_scores), Json(responses), is_synthetic,
-                datetime.now(timezone.utc), created_by
-            )
-            
-            result = self.execute_query(insert_query, params, fetch=True)
-            if result:
-                logger.info(f"Inserted SSE score for startup {startup_id}, version {next_version}")
-                return result[0]['score_id']
-            return None
-            
+            # Keep the histogram fresh before locking the startup's current row
+            self.refresh_score_distribution()
+
+            with self.transaction() as cursor:
+                # Serialize inserts per startup so concurrent ones get distinct versions; a row lock on
+                # sse_current_scores would not cover a startup's first score, which has no row yet
+                cursor.execute("SELECT pg_advisory_xact_lock(hashtextextended(%s::text, 0))", (startup_id,))
+                cursor.execute("""
+                    SELECT version, total_score
+                    FROM sse_current_scores
+                    WHERE startup_id = %s
+                """, (startup_id,))
+                previous = cursor.fetchone()
+
+                if previous is None:
+                    # Startups scored before sse_current_scores existed
+                    cursor.execute("""
+                        SELECT version, total_score
+                        FROM sse_scores
+                        WHERE startup_id = %s
+                        ORDER BY version DESC
+                        LIMIT 1
+                    """, (startup_id,))
+                    previous = cursor.fetchone()
+
+                next_version = previous['version'] + 1 if previous else 1
+                previous_score = previous['total_score'] if previous else None
+
+                # Rank against the latest score of every other startup
+                percentile = self.score_distribution.percentile(
+                    total_score, previous_score=previous_score, include_self=True
+                )
+
+                # Insert new score
+                score_id = uuid7()
+                current_time = datetime.now(timezone.utc)
+                cursor.execute("""
+                    INSERT INTO sse_scores (
+                        score_id, startup_id, version, total_score, component_scores,
+                        responses, percentile, is_synthetic, created_at, created_by
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """, (
+                    score_id, startup_id, next_version, total_score,
+                    Json(component_scores), Json(responses), percentile, is_synthetic,
+                    current_time, created_by
+                ))
+
+                # Materialize it as the startup's current score
+                cursor.execute("""
+                    INSERT INTO sse_current_scores (
+                        startup_id, score_id, version, total_score, component_scores,
+                        percentile, is_synthetic, created_at, created_by, updated_at
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (startup_id) DO UPDATE SET
+                        score_id = EXCLUDED.score_id,
+                        version = EXCLUDED.version,
+                        total_score = EXCLUDED.total_score,
+                        component_scores = EXCLUDED.component_scores,
+                        percentile = EXCLUDED.percentile,
+                        is_synthetic = EXCLUDED.is_synthetic,
+                        created_at = EXCLUDED.created_at,
+                        created_by = EXCLUDED.created_by,
+                        updated_at = EXCLUDED.updated_at
+                    WHERE sse_current_scores.version < EXCLUDED.version
+                """, (
+                    startup_id, score_id, next_version, total_score, Json(component_scores),
+                    percentile, is_synthetic, current_time, created_by, current_time
+                ))
+
+            self._after_commit(lambda: self.score_distribution.record(total_score, previous_score))
+            logger.info(f"Inserted SSE score for startup {startup_id}, version {next_version}")
+            return {'score_id': score_id, 'version': next_version, 'percentile': percentile}
+
         except Exception as e:
             logger.error(f"Failed to insert SSE score: {e}")
             return None
-    
+
+    def refresh_score_distribution(self, force: bool = False) -> None:
+        """Rebuild the in-memory SSE score histogram from the database when it is stale"""
+        if not force and not self.score_distribution.needs_rebuild():
+            return
+
+        query = f"""
+            WITH {LATEST_SSE_SCORES_CTE}
+            SELECT total_score, COUNT(*) AS startup_count
+            FROM latest
+            GROUP BY total_score
+        """
+
+        result = self.execute_query(query, fetch=True) or []
+        self.score_distribution.rebuild({row['total_score']: row['startup_count'] for row in result})
+        logger.info(f"Rebuilt SSE score distribution over {self.score_distribution.total} startups")
+
+    def backfill_current_sse_scores(self) -> int:
+        """Materialize current scores for startups whose latest score predates sse_current_scores"""
+        query = """
+            INSERT INTO sse_current_scores (
+                startup_id, score_id, version, total_score, component_scores,
+                percentile, success_probability, is_synthetic, created_at, created_by
+            )
+            SELECT DISTINCT ON (s.startup_id)
+                   s.startup_id, s.score_id, s.version, s.total_score, s.component_scores,
+                   s.percentile, s.success_probability, s.is_synthetic, s.created_at, s.created_by
+            FROM sse_scores s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM sse_current_scores c WHERE c.startup_id = s.startup_id
+            )
+            ORDER BY s.startup_id, s.version DESC
+            ON CONFLICT (startup_id) DO NOTHING
+        """
+
+        with self.transaction() as cursor:
+            cursor.execute(query)
+            backfilled = cursor.rowcount
+
+        if backfilled:
+            logger.info(f"Backfilled {backfilled} current SSE scores")
+        return backfilled
+
     def get_latest_sse_score(self, startup_id: str) -> Optional[Dict[str, Any]]:
-        """Get the latest SSE score for a startup"""
+        """Get the latest SSE score for a startup
+
+        Startups scored before sse_current_scores existed (and not yet backfilled by
+        backfill_current_sse_scores) fall back to their highest sse_scores version.
+        """
         query = """
-            SELECT * FROM sse_scores 
-            WHERE startup_id = %s 
-            ORDER BY version DESC 
-            LIMIT 1
+            SELECT s.* FROM sse_current_scores c
+            JOIN sse_scores s ON s.score_id = c.score_id
+            WHERE c.startup_id = %s
         """
-        
+
         result = self.execute_query(query, (startup_id,), fetch=True)
+        if not result:
+            result = self.execute_query("""
+                SELECT * FROM sse_scores
+                WHERE startup_id = %s
+                ORDER BY version DESC
+                LIMIT 1
+            """, (startup_id,), fetch=True)
         return result[0] if result else None
-    
+
+    def get_latest_sse_scores(self, startup_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the latest SSE scores for many startups in one query, keyed by startup id"""
+        if not startup_ids:
+            return {}
+
+        query = """
+            SELECT startup_id, score_id, version, total_score, component_scores,
+                   percentile, success_probability, is_synthetic, created_at
+            FROM sse_current_scores
+            WHERE startup_id = ANY(%s::uuid[])
+        """
+
+        result = self.execute_query(query, (list(startup_ids),), fetch=True) or []
+        scores = {str(row['startup_id']): row for row in result}
+
+        # Startups scored before sse_current_scores existed (see get_latest_sse_score)
+        missing = [str(startup_id) for startup_id in startup_ids if str(startup_id) not in scores]
+        if missing:
+            fallback = self.execute_query("""
+                SELECT DISTINCT ON (startup_id)
+                       startup_id, score_id, version, total_score, component_scores,
+                       percentile, success_probability, is_synthetic, created_at
+                FROM sse_scores
+                WHERE startup_id = ANY(%s::uuid[])
+                ORDER BY startup_id, version DESC
+            """, (missing,), fetch=True) or []
+            scores.update((str(row['startup_id']), row) for row in fallback)
+        return scores
+
     def insert_action(self, 
                      user_id: str, 
                      startup_id: str, 
@@ -306,7 +858,7 @@ class DatabaseManager:
                      is_synthetic: bool = False) -> Optional[str]:
         """Insert user action with token calculation"""
         try:
-            action_id = str(uuid.uuid4())
+            action_id = uuid7()
             query = """
                 INSERT INTO actions (
                     action_id, user_id, startup_id, action_type, domain,
@@ -333,48 +885,430 @@ class DatabaseManager:
             logger.error(f"Failed to insert action: {e}")
             return None
     
-    def update_gamification_profile(self, user_id: str, token_delta: int, action_count: int = 1) -> bool:
+    def update_gamification_profile(self,
+                                    user_id: str,
+                                    token_delta: int,
+                                    action_count: int = 1,
+                                    startup_id: Optional[str] = None) -> bool:
         """Update gamification profile with new tokens and actions"""
         try:
             query = """
                 INSERT INTO gamification_profiles (
-                    user_id, total_tokens, lifetime_tokens, actions_this_week, 
+                    user_id, startup_id, total_tokens, lifetime_tokens, actions_this_week,
                     last_active_date, updated_at
-                ) VALUES (%s, %s, %s, %s, %s, %s)
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
                 ON CONFLICT (user_id) DO UPDATE SET
+                    startup_id = COALESCE(EXCLUDED.startup_id, gamification_profiles.startup_id),
                     total_tokens = gamification_profiles.total_tokens + EXCLUDED.total_tokens,
                     lifetime_tokens = gamification_profiles.lifetime_tokens + EXCLUDED.lifetime_tokens,
                     actions_this_week = gamification_profiles.actions_this_week + EXCLUDED.actions_this_week,
                     last_active_date = EXCLUDED.last_active_date,
                     updated_at = EXCLUDED.updated_at
+                RETURNING total_tokens, startup_id
             """
-            
+
             current_date = datetime.now(timezone.utc).date()
             current_time = datetime.now(timezone.utc)
-            
-            params = (user_id, token_delta, token_delta, action_count, current_date, current_time)
-            self.execute_query(query, params)
+
+            params = (user_id, startup_id, token_delta, token_delta, action_count, current_date, current_time)
+            result = self.execute_query(query, params, fetch=True)
+
+            if result:
+                self._record_leaderboard_update(user_id, result[0]['total_tokens'], token_delta, result[0]['startup_id'])
+
             logger.info(f"Updated gamification profile for user {user_id}: +{token_delta} tokens")
             return True
-            
+
         except Exception as e:
             logger.error(f"Failed to update gamification profile: {e}")
             return False
+
+    def record_action(self,
+                      user_id: str,
+                      action_type: str,
+                      domain: str,
+                      base_tokens: int,
+                      actual_tokens: int,
+                      multipliers: Dict[str, Any] = None,
+                      metadata: Dict[str, Any] = None,
+                      is_synthetic: bool = False,
+                      startup_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Record an action and award its tokens as one transaction (see record_actions)"""
+        result = self.record_actions([{
+            'user_id': user_id,
+            'startup_id': startup_id,
+            'action_type': action_type,
+            'domain': domain,
+            'base_tokens': base_tokens,
+            'actual_tokens': actual_tokens,
+            'multipliers': multipliers,
+            'metadata': metadata,
+            'is_synthetic': is_synthetic
+        }])
+
+        if not result:
+            return None
+
+        return {
+            'action_id': result['action_ids'][0],
+            'startup_id': result['startup_ids'][0],
+            'total_tokens': result['profiles'].get(str(user_id))
+        }
+
+    def record_actions(self, actions: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Insert actions and apply the aggregated token deltas per user in one transaction
+
+        Each action needs user_id, action_type, domain, base_tokens and actual_tokens, and may
+        set startup_id (defaults to the user's primary organization), multipliers, metadata,
+        is_synthetic and completed_at (defaults to now). Raises ValueError when an action has
+        no startup_id and its user has no primary organization.
+        """
+        if not actions:
+            return {'action_ids': [], 'startup_ids': [], 'profiles': {}}
+
+        try:
+            current_time = datetime.now(timezone.utc)
+            week_start = current_week_start()
+
+            with self.transaction() as cursor:
+                missing_org_users = list({str(a['user_id']) for a in actions if not a.get('startup_id')})
+                primary_orgs = {}
+                if missing_org_users:
+                    cursor.execute("""
+                        SELECT user_id, org_id FROM user_organizations
+                        WHERE user_id = ANY(%s::uuid[]) AND is_primary = TRUE
+                    """, (missing_org_users,))
+                    primary_orgs = {str(row['user_id']): str(row['org_id']) for row in cursor.fetchall()}
+
+                    unknown = [user_id for user_id in missing_org_users if user_id not in primary_orgs]
+                    if unknown:
+                        raise ValueError(f"User organization not found for {len(unknown)} user(s)")
+
+                rows = []
+                weekly_deltas: Dict[str, int] = {}
+                for action_id, action in zip(uuid7_batch(len(actions)), actions):
+                    user_id = str(action['user_id'])
+                    completed_at = action.get('completed_at') or current_time
+                    rows.append((
+                        action_id, user_id, action.get('startup_id') or primary_orgs[user_id],
+                        action['action_type'], action['domain'],
+                        action['base_tokens'], action['actual_tokens'],
+                        Json(action.get('multipliers') or {}), Json(action.get('metadata') or {}),
+                        action.get('is_synthetic', False), completed_at, current_time
+                    ))
+                    if completed_at >= week_start:
+                        weekly_deltas[user_id] = weekly_deltas.get(user_id, 0) + action['actual_tokens']
+
+                # Insert the actions and upsert one aggregated delta per user in a single
+                # statement per page; actions_this_week only counts actions from this week
+                profile_rows = execute_values(cursor, """
+                    WITH inserted AS (
+                        INSERT INTO actions (
+                            action_id, user_id, startup_id, action_type, domain,
+                            base_tokens, actual_tokens, multipliers, metadata, is_synthetic,
+                            completed_at, created_at
+                        ) VALUES %s
+                        RETURNING user_id, startup_id, actual_tokens, completed_at, created_at
+                    )
+                    INSERT INTO gamification_profiles (
+                        user_id, startup_id, total_tokens, lifetime_tokens, actions_this_week,
+                        last_active_date, updated_at
+                    )
+                    SELECT user_id,
+                           (array_agg(startup_id ORDER BY completed_at DESC))[1],
+                           SUM(actual_tokens),
+                           SUM(actual_tokens),
+                           COUNT(*) FILTER (
+                               WHERE completed_at >= date_trunc('week', NOW() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+                           ),
+                           (MAX(completed_at) AT TIME ZONE 'UTC')::date,
+                           MAX(created_at)
+                    FROM inserted
+                    GROUP BY user_id
+                    ON CONFLICT (user_id) DO UPDATE SET
+                        startup_id = COALESCE(EXCLUDED.startup_id, gamification_profiles.startup_id),
+                        total_tokens = gamification_profiles.total_tokens + EXCLUDED.total_tokens,
+                        lifetime_tokens = gamification_profiles.lifetime_tokens + EXCLUDED.lifetime_tokens,
+                        actions_this_week = gamification_profiles.actions_this_week + EXCLUDED.actions_this_week,
+                        last_active_date = GREATEST(gamification_profiles.last_active_date, EXCLUDED.last_active_date),
+                        updated_at = EXCLUDED.updated_at
+                    RETURNING user_id, total_tokens, startup_id
+                """, rows, page_size=ACTION_BATCH_PAGE_SIZE, fetch=True)
+
+            # Later pages return later totals, so the last row per user is the final one
+            profiles = {str(row['user_id']): row for row in profile_rows}
+            for user_id, profile in profiles.items():
+                self._record_leaderboard_update(
+                    user_id, profile['total_tokens'], weekly_deltas.get(user_id, 0), profile['startup_id']
+                )
+
+            logger.info(f"Recorded {len(rows)} actions for {len(profiles)} users")
+            return {
+                'action_ids': [row[0] for row in rows],
+                'startup_ids': [row[2] for row in rows],
+                'profiles': {user_id: profile['total_tokens'] for user_id, profile in profiles.items()}
+            }
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to record actions: {e}")
+            return None
+
+    def _record_leaderboard_update(self, user_id: str, total_tokens: int, token_delta: int, startup_id: Optional[str]) -> None:
+        """Apply a committed profile update to the leaderboards without failing the write"""
+        def record():
+            try:
+                # Boards that are not loaded yet pick this update up when they are
+                if self.leaderboards.is_loaded():
+                    self.leaderboards.record(user_id, total_tokens, token_delta, startup_id)
+            except Exception as e:
+                logger.warning(f"Failed to update leaderboards for user {user_id}: {e}")
+
+        self._after_commit(record)
+
+    def refresh_leaderboards(self, force: bool = False, wait: bool = True) -> None:
+        """Load the gamification leaderboards from the database when missing or stale
+
+        With wait=False (API requests) only boards that were never loaded are loaded in the
+        caller; stale ones keep serving while a background thread reloads them. One load runs at a time.
+        """
+        if not force and not self.leaderboards.needs_rebuild():
+            return
+
+        if not wait and self.leaderboards.is_loaded():
+            if self._leaderboard_lock.acquire(blocking=False):
+                threading.Thread(target=self._reload_leaderboards, name='leaderboard-refresh', daemon=True).start()
+            return
+
+        with self._leaderboard_lock:
+            if force or self.leaderboards.needs_rebuild():
+                self._load_leaderboards()
+
+    def _reload_leaderboards(self) -> None:
+        """Background reload; the caller holds _leaderboard_lock"""
+        try:
+            self._load_leaderboards()
+        except Exception as e:
+            logger.error(f"Leaderboard reload failed: {e}")
+        finally:
+            self._leaderboard_lock.release()
+
+    def _load_leaderboards(self) -> None:
+        week_start = current_week_start()
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                # Streams in idx_gamification_profiles_tokens order
+                cursor.execute("""
+                    SELECT user_id, startup_id, total_tokens
+                    FROM gamification_profiles
+                    ORDER BY total_tokens DESC, user_id
+                """)
+                profiles = cursor.fetchall()
+
+                cursor.execute("""
+                    SELECT user_id, SUM(actual_tokens) AS tokens
+                    FROM actions
+                    WHERE completed_at >= %s
+                    GROUP BY user_id
+                """, (week_start,))
+                weekly_tokens = cursor.fetchall()
+            conn.commit()
+
+        self.leaderboards.rebuild(profiles, weekly_tokens)
+
+    def get_primary_org_id(self, user_id: str) -> Optional[str]:
+        """Get the primary organization of a user"""
+        query = """
+            SELECT org_id FROM user_organizations
+            WHERE user_id = %s AND is_primary = TRUE
+            LIMIT 1
+        """
+
+        result = self.execute_query(query, (user_id,), fetch=True)
+        return result[0]['org_id'] if result else None
+
+    def refresh_portfolio_summaries(self) -> Dict[str, int]:
+        """Recompute ecosystem and investor portfolio statistics into portfolio_summaries"""
+        ecosystem_query = f"""
+            WITH {LATEST_SSE_SCORES_CTE},
+            startups AS (
+                SELECT o.org_id,
+                       COALESCE(o.region, 'unknown') AS region,
+                       COALESCE(o.industry, 'unknown') AS industry,
+                       l.total_score,
+                       COALESCE(l.is_synthetic, FALSE) AS is_synthetic
+                FROM organizations o
+                LEFT JOIN latest l ON l.startup_id = o.org_id
+                WHERE o.org_type = 'startup' AND o.is_active = TRUE
+            )
+            INSERT INTO portfolio_summaries ({PORTFOLIO_SUMMARY_INSERT_COLUMNS})
+            SELECT 'ecosystem', %s::uuid,
+                   CASE WHEN GROUPING(region) = 0 THEN 'region'
+                        WHEN GROUPING(industry) = 0 THEN 'industry'
+                        ELSE 'all' END,
+                   CASE WHEN GROUPING(region) = 0 THEN region
+                        WHEN GROUPING(industry) = 0 THEN industry
+                        ELSE '' END,
+                   {PORTFOLIO_STATS_COLUMNS},
+                   NULL, %s
+            FROM startups
+            GROUP BY GROUPING SETS ((), (region), (industry))
+        """
+
+        investor_query = f"""
+            WITH {LATEST_SSE_SCORES_CTE},
+            holdings AS (
+                SELECT investor_id, startup_id, SUM(amount) AS invested
+                FROM investments
+                WHERE status = 'active'
+                GROUP BY investor_id, startup_id
+            ),
+            startups AS (
+                SELECT h.investor_id,
+                       h.invested,
+                       COALESCE(o.region, 'unknown') AS region,
+                       COALESCE(o.industry, 'unknown') AS industry,
+                       l.total_score,
+                       COALESCE(l.is_synthetic, FALSE) AS is_synthetic
+                FROM holdings h
+                JOIN organizations o ON o.org_id = h.startup_id
+                LEFT JOIN latest l ON l.startup_id = h.startup_id
+            )
+            INSERT INTO portfolio_summaries ({PORTFOLIO_SUMMARY_INSERT_COLUMNS})
+            SELECT 'investor', investor_id,
+                   CASE WHEN GROUPING(region) = 0 THEN 'region'
+                        WHEN GROUPING(industry) = 0 THEN 'industry'
+                        ELSE 'all' END,
+                   CASE WHEN GROUPING(region) = 0 THEN region
+                        WHEN GROUPING(industry) = 0 THEN industry
+                        ELSE '' END,
+                   {PORTFOLIO_STATS_COLUMNS},
+                   SUM(invested), %s
+            FROM startups
+            GROUP BY GROUPING SETS ((investor_id), (investor_id, region), (investor_id, industry))
+        """
+
+        current_time = datetime.now(timezone.utc)
+
+        # Readers keep seeing the previous snapshot until the refresh commits
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM portfolio_summaries")
+            cursor.execute(ecosystem_query, (ECOSYSTEM_SCOPE_ID, current_time))
+            ecosystem_rows = cursor.rowcount
+            cursor.execute(investor_query, (current_time,))
+            investor_rows = cursor.rowcount
+
+        logger.info(f"Refreshed portfolio summaries: {ecosystem_rows} ecosystem rows, {investor_rows} investor rows")
+        return {'ecosystem_rows': ecosystem_rows, 'investor_rows': investor_rows}
+
+    def get_portfolio_summaries(self,
+                                scope_type: str,
+                                scope_id: Optional[str] = None,
+                                dimension: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get precomputed portfolio statistics for a scope"""
+        query = """
+            SELECT * FROM portfolio_summaries
+            WHERE scope_type = %s AND scope_id = %s
+        """
+        params = [scope_type, scope_id or ECOSYSTEM_SCOPE_ID]
+
+        if dimension:
+            query += " AND dimension = %s"
+            params.append(dimension)
+
+        query += " ORDER BY dimension, startup_count DESC, dimension_value"
+
+        return self.execute_query(query, params, fetch=True) or []
+
+    def compact_synthetic_metrics(self, job_name: str, expected_cursor: Optional[str],
+                                  batch_users: int, bucket: str) -> Optional[Dict[str, Any]]:
+        """Thin the synthetic points of the next batch of users to one per (user, dashboard_type, bucket)
+
+        Overlapping scheduled runs leave several points per time bucket; the most recently
+        generated one is kept. Only the scheduled generator's rows (SCHEDULED_ALGORITHM_PREFIX) are
+        touched; series loaded through the API or generation jobs are left as requested. Users are visited in user_id order after expected_cursor, and
+        the job checkpoint advances in the same transaction. Returns the batch result, or
+        None if another run already moved the checkpoint.
+        """
+        query = """
+            WITH batch AS (
+                SELECT user_id FROM users
+                WHERE %(cursor)s::uuid IS NULL OR user_id > %(cursor)s::uuid
+                ORDER BY user_id
+                LIMIT %(batch_users)s
+            ),
+            ranked AS (
+                SELECT m.metric_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY m.user_id, m.dashboard_type,
+                                        date_bin(%(bucket)s::interval, m.metric_timestamp, TIMESTAMPTZ '2000-01-01')
+                           ORDER BY m.created_at DESC, m.metric_id DESC
+                       ) AS rn
+                FROM dashboard_metrics m
+                JOIN batch b ON b.user_id = m.user_id
+                WHERE m.is_synthetic = TRUE
+                  AND m.synthetic_algorithm LIKE %(scheduled)s
+            ),
+            deleted AS (
+                DELETE FROM dashboard_metrics d
+                USING ranked r
+                WHERE d.metric_id = r.metric_id AND r.rn > 1
+                RETURNING 1
+            )
+            SELECT (SELECT COUNT(*) FROM batch) AS users,
+                   (SELECT user_id FROM batch ORDER BY user_id DESC LIMIT 1) AS last_user_id,
+                   (SELECT COUNT(*) FROM deleted) AS deleted
+        """
+        try:
+            with self.transaction(own_transaction=True) as cursor:
+                cursor.execute(query, {'cursor': expected_cursor, 'batch_users': batch_users, 'bucket': bucket,
+                                       'scheduled': SCHEDULED_ALGORITHM_PREFIX + '%'})
+                result = cursor.fetchone()
+                pass_complete = result['users'] < batch_users
+                cursor_value = str(result['last_user_id']) if result['last_user_id'] else expected_cursor
+
+                if not self.advance_job_checkpoint(cursor, job_name, expected_cursor, cursor_value,
+                                                   result['users'], pass_complete):
+                    raise RollbackTransaction(f"Checkpoint of {job_name} moved by another run; batch rolled back")
+        except RollbackTransaction as e:
+            logger.warning(str(e))
+            return None
+
+        return {
+            'users': result['users'],
+            'deleted': result['deleted'],
+            'cursor': None if pass_complete else cursor_value,
+            'pass_complete': pass_complete
+        }
     
-    def cleanup_old_synthetic_data(self, days: int = 90) -> int:
-        """Clean up old synthetic data beyond retention period"""
+    def measure_dashboard_reads(self, series: List[Tuple[str, str]], days: int = 30, repeat: int = 3) -> Dict[str, float]:
+        """Average latency (best of repeat) and rows of get_dashboard_metrics over (user_id, dashboard_type) pairs"""
+        if not series:
+            return {'avg_ms': 0.0, 'avg_rows': 0.0}
+        
+        total_ms = 0.0
+        total_rows = 0
+        for user_id, dashboard_type in series:
+            best = float('inf')
+            for _ in range(repeat):
+                started = time.perf_counter()
+                rows = self.get_dashboard_metrics(user_id, dashboard_type, days)
+                best = min(best, time.perf_counter() - started)
+            total_ms += best * 1000
+            total_rows += len(rows)
+        
+        return {
+            'avg_ms': round(total_ms / len(series), 3),
+            'avg_rows': round(total_rows / len(series), 1)
+        }
+    
+    def cleanup_old_synthetic_data(self, days: int = 90, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Clean up old synthetic data beyond retention period, in committed chunks"""
         try:
-            query = """
-                DELETE FROM dashboard_metrics 
-                WHERE is_synthetic = TRUE 
-                    AND created_at < NOW() - INTERVAL '%s days'
-            """
-            
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query, (days,))
-                    deleted_count = cursor.rowcount
-                    conn.commit()
+            progress = BatchDeleter(self, chunk_size=chunk_size).run_target(synthetic_metrics_target(days))
+            deleted_count = progress['deleted']
             
             logger.info(f"Cleaned up {deleted_count} old synthetic data records")
             return deleted_count
@@ -383,6 +1317,64 @@ class DatabaseManager:
             logger.error(f"Failed to cleanup old synthetic data: {e}")
             return 0
     
+    def prune_sse_score_history(self, keep: int = 10, job_name: str = 'sse_history_prune',
+                                lag_seconds: int = SSE_HISTORY_PRUNE_LAG_SECONDS) -> Dict[str, int]:
+        """Keep the newest keep history rows of each startup that gained history since the last run
+
+        History ids are UUIDv7 from uuid_generate_v7(), so the job_checkpoints cursor holds a bound
+        on the database clock and new history is found through the primary key. The bound trails the
+        database clock by lag_seconds: history of transactions still open at a run (ids taken before
+        they commit) is left for the next run instead of being skipped. Each changed startup is trimmed
+        through idx_sse_score_history_startup_created, reading only its kept and removed rows.
+        """
+        try:
+            self.start_job_checkpoint(job_name)
+
+            with self.transaction() as cursor:
+                cursor.execute("SELECT cursor_value FROM job_checkpoints WHERE job_name = %s FOR UPDATE", (job_name,))
+                watermark = cursor.fetchone()['cursor_value']
+
+                # Ids come from the database clock, so the bound does too; the first run visits every startup
+                cursor.execute("SELECT uuid_generate_v7() AS now_id")
+                bound = uuid7_floor(uuid7_timestamp(cursor.fetchone()['now_id']) - timedelta(seconds=lag_seconds))
+                if watermark is not None and bound <= str(watermark):
+                    bound = str(watermark)
+
+                cursor.execute("""
+                    WITH changed AS (
+                        SELECT DISTINCT startup_id FROM sse_score_history
+                        WHERE %(watermark)s::uuid IS NULL
+                           OR (history_id >= %(watermark)s::uuid AND history_id < %(bound)s::uuid)
+                    ),
+                    deleted AS (
+                        DELETE FROM sse_score_history h
+                        USING (
+                            SELECT stale.history_id
+                            FROM changed
+                            CROSS JOIN LATERAL (
+                                SELECT history_id FROM sse_score_history
+                                WHERE startup_id = changed.startup_id
+                                ORDER BY created_at DESC
+                                OFFSET %(keep)s
+                            ) stale
+                        ) trimmed
+                        WHERE h.history_id = trimmed.history_id
+                        RETURNING 1
+                    )
+                    SELECT (SELECT COUNT(*) FROM changed) AS startups,
+                           (SELECT COUNT(*) FROM deleted) AS deleted
+                """, {'watermark': watermark, 'bound': bound, 'keep': keep})
+                result = cursor.fetchone()
+
+                self.advance_job_checkpoint(cursor, job_name, watermark, bound, result['deleted'])
+
+            logger.info(f"Pruned {result['deleted']} SSE score history rows of {result['startups']} startups")
+            return {'startups': result['startups'], 'deleted': result['deleted']}
+
+        except Exception as e:
+            logger.error(f"Failed to prune SSE score history: {e}")
+            return {'startups': 0, 'deleted': 0}
+    
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics and health metrics"""
         try:
@@ -431,6 +1423,25 @@ class DatabaseManager:
             logger.error(f"Failed to get database stats: {e}")
             return {}
     
+    def get_query_report(self, limit: int = 50) -> Optional[Dict[str, Any]]:
+        """Profiled statements by total time, joined with their pg_stat_statements entries"""
+        if not self.profiler:
+            return None
+        
+        server_stats = None
+        try:
+            server_stats = self.execute_query("""
+                SELECT query, calls, total_exec_time, rows, shared_blks_hit, shared_blks_read
+                FROM pg_stat_statements
+                WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+            """, fetch=True)
+        except Exception as e:
+            logger.warning(f"pg_stat_statements unavailable: {e}")
+        
+        report = self.profiler.report(server_stats, limit)
+        report['pg_stat_statements'] = server_stats is not None
+        return report
+    
     def close(self):
         """Close all database connections"""
         if hasattr(self, 'pool'):
@@ -472,7 +1483,7 @@ def main():
                     print("✓ Linked user to organization")
                 
                 # Insert test SSE score
-                score_id = db.insert_sse_score(
+                score = db.insert_sse_score(
                     startup_id=org_id,
                     total_score=78,
                     component_scores={"team": 20, "market": 16, "product": 15},
@@ -481,8 +1492,8 @@ def main():
                     is_synthetic=True
                 )
                 
-                if score_id:
-                    print(f"✓ Inserted test SSE score: {score_id}")
+                if score:
+                    print(f"✓ Inserted test SSE score: {score['score_id']}")
         
         # Get database statistics
         stats = db.get_database_stats()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Auxeira Test Database Provisioning
+Builds a template database once per schema checksum and clones per-test databases from it
+"""
+
+import argparse
+import hashlib
+import io
+import logging
+import os
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+import psycopg2
+from psycopg2 import sql
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.database_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_FILE = os.path.join(os.path.dirname(__file__), '..', 'database', 'init.sql')
+
+# Seconds a reset waits for table locks before failing (a leftover open transaction would block it forever)
+RESET_LOCK_TIMEOUT = '5s'
+
+
+def schema_checksum(schema_file: str) -> str:
+    """sha256 of the schema file's contents"""
+    with open(schema_file, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class DatabaseProvisioner:
+    """Per-test databases cloned from a template built once per schema checksum
+
+    CREATE DATABASE ... TEMPLATE copies the template's files, so a clone costs the same however long
+    init.sql takes to execute. With reuse=True, released databases are truncated back to the schema's
+    seed rows and handed out again instead of being dropped.
+    """
+
+    def __init__(self,
+                 host: str = None,
+                 port: int = None,
+                 username: str = None,
+                 password: str = None,
+                 schema_file: str = DEFAULT_SCHEMA_FILE,
+                 maintenance_database: str = 'postgres',
+                 prefix: str = 'auxeira_test',
+                 reuse: bool = False):
+        self.connection_params = {
+            'host': host or os.environ.get('DB_HOST', 'localhost'),
+            'port': port or int(os.environ.get('DB_PORT', 5432)),
+            'user': username or os.environ.get('DB_USER', 'postgres'),
+            'password': password if password is not None else os.environ.get('DB_PASSWORD', 'postgres')
+        }
+        self.schema_file = schema_file
+        self.maintenance_database = maintenance_database
+        self.prefix = prefix
+        self.reuse = reuse
+
+        self.checksum = schema_checksum(schema_file)
+        # Identifiers are limited to 63 bytes; 12 hex digits are plenty to tell schema versions apart
+        self.template_name = f"{prefix}_tpl_{self.checksum[:12]}"
+
+        self._template_ready = False
+        self._created: List[str] = []
+        self._idle: List[str] = []
+        self._seed_rows: Optional[Dict[str, str]] = None
+        self._table_names: Optional[List[str]] = None
+
+    def _connect(self, database: str):
+        return psycopg2.connect(dbname=database, **self.connection_params)
+
+    @contextmanager
+    def _maintenance(self) -> Iterator:
+        """Autocommit cursor on the maintenance database (CREATE/DROP DATABASE cannot run in a transaction)"""
+        conn = self._connect(self.maintenance_database)
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cursor:
+                yield cursor
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _database_exists(cursor, name: str) -> bool:
+        cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (name,))
+        return cursor.fetchone() is not None
+
+    def ensure_template(self) -> str:
+        """Build the template for the current schema checksum unless it exists; returns its name
+
+        Concurrent test runs serialize on an advisory lock, so only one of them executes the schema.
+        The schema is loaded into a scratch database that is renamed once it succeeded, so a failed
+        or interrupted build never leaves a half-initialized template behind.
+        """
+        if self._template_ready:
+            return self.template_name
+
+        with self._maintenance() as cursor:
+            cursor.execute("SELECT pg_advisory_lock(hashtext(%s))", (self.template_name,))
+            try:
+                if not self._database_exists(cursor, self.template_name):
+                    self._build_template(cursor)
+            finally:
+                cursor.execute("SELECT pg_advisory_unlock(hashtext(%s))", (self.template_name,))
+
+        self._template_ready = True
+        return self.template_name
+
+    def _build_template(self, cursor) -> None:
+        build_name = f"{self.template_name}_build"
+        started = time.perf_counter()
+        cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(build_name)))
+        cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(build_name)))
+
+        db_manager = DatabaseManager(
+            host=self.connection_params['host'],
+            port=self.connection_params['port'],
+            database=build_name,
+            username=self.connection_params['user'],
+            password=self.connection_params['password'],
+            min_connections=1,
+            max_connections=1
+        )
+        try:
+            success = db_manager.initialize_database(self.schema_file)
+        finally:
+            db_manager.close()
+
+        if not success:
+            cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(build_name)))
+            raise RuntimeError(f"Failed to build template database from {self.schema_file}")
+
+        cursor.execute(sql.SQL("ALTER DATABASE {} RENAME TO {}").format(
+            sql.Identifier(build_name), sql.Identifier(self.template_name)))
+        # Nobody may connect to a template, or cloning it fails while the connection is open
+        cursor.execute(sql.SQL("ALTER DATABASE {} WITH IS_TEMPLATE true ALLOW_CONNECTIONS false").format(
+            sql.Identifier(self.template_name)))
+        logger.info(f"Built template database {self.template_name} in {time.perf_counter() - started:.2f}s")
+
+    def create_database(self, name: Optional[str] = None) -> str:
+        """Clone a new database from the template; returns its name"""
+        template_name = self.ensure_template()
+        name = name or f"{self.prefix}_{uuid.uuid4().hex[:12]}"
+        with self._maintenance() as cursor:
+            cursor.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+                sql.Identifier(name), sql.Identifier(template_name)))
+        self._created.append(name)
+        return name
+
+    def drop_database(self, name: str) -> None:
+        """Drop a database, disconnecting any sessions still attached to it"""
+        with self._maintenance() as cursor:
+            cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(name)))
+        if name in self._created:
+            self._created.remove(name)
+        if name in self._idle:
+            self._idle.remove(name)
+
+    def _capture_seed_rows(self, name: str) -> None:
+        """Remember the public tables of a fresh clone and COPY out the rows the schema seeds"""
+        conn = self._connect(name)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT c.relname
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p') AND NOT c.relispartition
+                    ORDER BY c.relname
+                """)
+                self._table_names = [row[0] for row in cursor.fetchall()]
+
+                seed_rows = {}
+                for table in self._seed_order(cursor, self._table_names):
+                    cursor.execute(sql.SQL("SELECT EXISTS (SELECT 1 FROM {})").format(sql.Identifier(table)))
+                    if cursor.fetchone()[0]:
+                        buffer = io.StringIO()
+                        cursor.copy_expert(sql.SQL("COPY {} TO STDOUT").format(sql.Identifier(table)), buffer)
+                        seed_rows[table] = buffer.getvalue()
+                self._seed_rows = seed_rows
+            conn.rollback()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _seed_order(cursor, tables: List[str]) -> List[str]:
+        """Tables ordered so every table comes after the tables its foreign keys reference"""
+        cursor.execute("""
+            SELECT DISTINCT child.relname, parent.relname
+            FROM pg_constraint con
+            JOIN pg_class child ON child.oid = con.conrelid
+            JOIN pg_class parent ON parent.oid = con.confrelid
+            JOIN pg_namespace n ON n.oid = child.relnamespace
+            WHERE con.contype = 'f' AND n.nspname = 'public' AND child.oid <> parent.oid
+        """)
+        references: Dict[str, set] = {table: set() for table in tables}
+        for child, parent in cursor.fetchall():
+            if child in references and parent in references:
+                references[child].add(parent)
+
+        ordered, placed = [], set()
+        while references:
+            ready = sorted(table for table, parents in references.items() if parents <= placed)
+            # A foreign key cycle: place the rest as is (their seed rows, if any, must not depend on each other)
+            ready = ready or sorted(references)
+            for table in ready:
+                ordered.append(table)
+                placed.add(table)
+                del references[table]
+        return ordered
+
+    def reset_database(self, name: str) -> None:
+        """Truncate every public table of a clone and restore the schema's seed rows"""
+        if self._seed_rows is None:
+            raise RuntimeError("Seed rows have not been captured; reset only databases from acquire()")
+
+        conn = self._connect(name)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(sql.SQL("SET lock_timeout = {}").format(sql.Literal(RESET_LOCK_TIMEOUT)))
+                cursor.execute(sql.SQL("TRUNCATE {} RESTART IDENTITY CASCADE").format(
+                    sql.SQL(', ').join(sql.Identifier(table) for table in self._table_names)))
+                for table, rows in self._seed_rows.items():
+                    cursor.copy_expert(sql.SQL("COPY {} FROM STDIN").format(sql.Identifier(table)), io.StringIO(rows))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def acquire(self) -> str:
+        """A database in the template's state: a reset idle one when reusing, otherwise a fresh clone"""
+        if self._idle:
+            name = self._idle.pop()
+            try:
+                self.reset_database(name)
+                return name
+            except Exception as e:
+                logger.error(f"Failed to reset {name}, cloning a new database instead: {e}")
+                self.drop_database(name)
+
+        name = self.create_database()
+        if self.reuse and self._seed_rows is None:
+            self._capture_seed_rows(name)
+        return name
+
+    def release(self, name: str) -> None:
+        """Return a database from acquire(): kept for reuse, or dropped"""
+        if self.reuse:
+            self._idle.append(name)
+        else:
+            self.drop_database(name)
+
+    @contextmanager
+    def database(self) -> Iterator[str]:
+        """Context manager yielding the name of a database in the template's state
+
+        Close the test's connections before the block ends: a reset waits for their locks.
+        """
+        name = self.acquire()
+        try:
+            yield name
+        finally:
+            self.release(name)
+
+    def database_manager(self, name: str, **kwargs) -> DatabaseManager:
+        """DatabaseManager connected to one of the provisioned databases"""
+        return DatabaseManager(
+            host=self.connection_params['host'],
+            port=self.connection_params['port'],
+            database=name,
+            username=self.connection_params['user'],
+            password=self.connection_params['password'],
+            **kwargs
+        )
+
+    def prune_templates(self) -> List[str]:
+        """Drop this prefix's templates built from other schema checksums; returns their names"""
+        with self._maintenance() as cursor:
+            cursor.execute(
+                "SELECT datname FROM pg_database WHERE datname LIKE %s AND datname <> %s ORDER BY datname",
+                (f"{self.prefix}\\_tpl\\_%", self.template_name)
+            )
+            stale = [row[0] for row in cursor.fetchall()]
+            for name in stale:
+                # A template cannot be dropped until it is an ordinary database again
+                cursor.execute(sql.SQL("ALTER DATABASE {} IS_TEMPLATE false").format(sql.Identifier(name)))
+                cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(name)))
+                logger.info(f"Dropped stale template database {name}")
+        return stale
+
+    def close(self) -> None:
+        """Drop every database this provisioner created (the template is kept for the next run)"""
+        for name in list(self._created):
+            try:
+                self.drop_database(name)
+            except Exception as e:
+                logger.error(f"Failed to drop test database {name}: {e}")
+        self._idle.clear()
+
+
+def main():
+    """Build the template and time per-test provisioning: init.sql vs template clone vs truncate-and-reuse"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--schema-file', default=DEFAULT_SCHEMA_FILE)
+    parser.add_argument('--prefix', default='auxeira_test')
+    parser.add_argument('--count', type=int, default=5, help='databases provisioned per strategy')
+    parser.add_argument('--prune', action='store_true', help='drop templates of other schema checksums')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    provisioner = DatabaseProvisioner(schema_file=args.schema_file, prefix=args.prefix)
+    if args.prune:
+        for name in provisioner.prune_templates():
+            print(f"Dropped {name}")
+
+    started = time.perf_counter()
+    print(f"Template: {provisioner.ensure_template()} ({time.perf_counter() - started:.2f}s)")
+
+    timings = {}
+    try:
+        # The old path: an empty database initialized from the schema file
+        started = time.perf_counter()
+        for i in range(args.count):
+            name = f"{args.prefix}_initsql_{i}"
+            with provisioner._maintenance() as cursor:
+                cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(name)))
+            provisioner._created.append(name)
+            db_manager = provisioner.database_manager(name, min_connections=1, max_connections=1)
+            try:
+                db_manager.initialize_database(args.schema_file)
+            finally:
+                db_manager.close()
+        timings['init.sql'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(args.count):
+            provisioner.create_database()
+        timings['template clone'] = time.perf_counter() - started
+
+        provisioner.reuse = True
+        provisioner.release(provisioner.acquire())
+        started = time.perf_counter()
+        for _ in range(args.count):
+            provisioner.release(provisioner.acquire())
+        timings['truncate and reuse'] = time.perf_counter() - started
+    finally:
+        provisioner.close()
+
+    for strategy, elapsed in timings.items():
+        print(f"{strategy:<20}{elapsed / args.count * 1000:>10.1f} ms per database")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Auxeira Data Exporters
+Streaming exporters (Postgres COPY text, CSV, NDJSON, Parquet, Arrow) with optional gzip/zstd compression
+for synthetic series and database query results
+"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('copy', 'csv', 'ndjson', 'parquet', 'arrow')
+COMPRESSIONS = ('gzip', 'zstd')
+
+FORMAT_EXTENSIONS = {
+    '.copy': 'copy',
+    '.tsv': 'copy',
+    '.csv': 'csv',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow'
+}
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.zst': 'zstd'}
+
+# Columns of a synthetic series export, matching dashboard_metrics (and export_to_sql_inserts)
+SERIES_COLUMNS = [
+    'metric_id', 'dashboard_type', 'metric_name', 'metric_value',
+    'metric_timestamp', 'is_synthetic', 'synthetic_algorithm'
+]
+
+_COPY_SPECIAL = ('\\', '\t', '\n', '\r')
+_JSON_SPECIAL = ('"', '\\') + tuple(chr(c) for c in range(32))
+
+
+class Table:
+    """A batch of rows stored column by column
+
+    Columns are lists or NumPy arrays. json_columns hold JSON text that NDJSON embeds as-is.
+    """
+
+    def __init__(self, columns: List[str], data: List[Sequence[Any]], json_columns: Sequence[str] = ()):
+        self.columns = columns
+        self.data = data
+        self.json_columns = set(json_columns)
+
+    def __len__(self) -> int:
+        return len(self.data[0]) if self.data else 0
+
+
+def series_table(series, user_id: Optional[str] = None, org_id: Optional[str] = None) -> Table:
+    """Table of a SyntheticSeries in dashboard_metrics layout (plus user_id/org_id when given)"""
+    rows = len(series)
+    columns = list(SERIES_COLUMNS)
+    data = [
+        series.metric_id_strings(),
+        [series.dashboard_type] * rows,
+        ['synthetic_metrics'] * rows,
+        series.metrics_json(),
+        series.timestamps,
+        np.ones(rows, dtype=bool),
+        [series.synthetic_algorithm] * rows
+    ]
+    if user_id is not None:
+        columns.insert(1, 'user_id')
+        data.insert(1, [str(user_id)] * rows)
+    if org_id is not None:
+        index = columns.index('dashboard_type')
+        columns.insert(index, 'org_id')
+        data.insert(index, [str(org_id)] * rows)
+    return Table(columns, data, json_columns=('metric_value',))
+
+
+def rows_table(rows: List[Dict[str, Any]]) -> Table:
+    """Table of row dicts (e.g. DatabaseManager.iter_query batches); dict/list values become JSON"""
+    if not rows:
+        return Table([], [])
+
+    columns = list(rows[0].keys())
+    data = []
+    json_columns = []
+    for column in columns:
+        values = [row.get(column) for row in rows]
+        if any(isinstance(value, (dict, list)) for value in values):
+            values = [None if value is None else json.dumps(value, default=str) for value in values]
+            json_columns.append(column)
+        data.append(values)
+    return Table(columns, data, json_columns)
+
+
+def to_table(batch: Any) -> Table:
+    """Normalize a batch: Table, SyntheticSeries or list of row dicts"""
+    if isinstance(batch, Table):
+        return batch
+    if hasattr(batch, 'metrics_json'):
+        return series_table(batch)
+    return rows_table(list(batch))
+
+
+def _text_value(value: Any, null: str, true: str, false: str) -> str:
+    if value is None:
+        return null
+    if isinstance(value, bool):
+        return true if value else false
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _json_value(value: Any) -> str:
+    if value is None or isinstance(value, (bool, int, float)):
+        return json.dumps(value)
+    if isinstance(value, Decimal) and value.is_finite():
+        # NUMERIC columns stay numbers, written with their exact digits
+        return str(value)
+    return json.dumps(_text_value(value, '', 'true', 'false'))
+
+
+def column_strings(values: Sequence[Any], null: str = '', true: str = 'true', false: str = 'false') -> List[str]:
+    """Text form of a column, vectorized for NumPy arrays and constant-type lists"""
+    if isinstance(values, np.ndarray):
+        if np.issubdtype(values.dtype, np.datetime64):
+            return np.datetime_as_string(values, unit='us').tolist()
+        if values.dtype == bool:
+            return np.where(values, true, false).tolist()
+        return [str(value) for value in values.tolist()]
+    if values and all(type(value) is str for value in values):
+        return list(values)
+    return [_text_value(value, null, true, false) for value in values]
+
+
+def _needs_escape(values: List[str], special: Sequence[str]) -> bool:
+    joined = ''.join(values)
+    return any(char in joined for char in special)
+
+
+class _Writer:
+    """Base class of the streaming writers: write(table) per batch, then close()"""
+
+    def __init__(self, path: str, compression: Optional[str]):
+        self.path = path
+        self.compression = compression
+        self.rows = 0
+
+    def write(self, table: Table) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class _TextWriter(_Writer):
+    """Writer of a text format, through gzip/zstd compression when requested"""
+
+    def __init__(self, path: str, compression: Optional[str]):
+        super().__init__(path, compression)
+        self._stream = open_output(path, compression)
+        self.out = io.TextIOWrapper(self._stream, encoding='utf-8', newline='')
+
+    def close(self) -> None:
+        self.out.close()
+
+
+def copy_lines(table: Table) -> List[str]:
+    """Postgres COPY text lines of a table (tab separated, \\N for NULL)"""
+    columns = []
+    for values in table.data:
+        text = column_strings(values, null='\\N', true='t', false='f')
+        if _needs_escape(text, _COPY_SPECIAL):
+            text = [
+                value if value == '\\N' else
+                value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+                for value in text
+            ]
+        columns.append(text)
+    return ['\t'.join(row) + '\n' for row in zip(*columns)]
+
+
+def copy_buffer(table: Table) -> io.StringIO:
+    """In-memory COPY text of a table, ready for cursor.copy_expert"""
+    buffer = io.StringIO()
+    buffer.writelines(copy_lines(table))
+    buffer.seek(0)
+    return buffer
+
+
+class CopyTextWriter(_TextWriter):
+    """Postgres COPY text format, loadable with COPY ... FROM STDIN"""
+
+    def write(self, table: Table) -> None:
+        if not len(table):
+            return
+        self.out.writelines(copy_lines(table))
+        self.rows += len(table)
+
+
+class CsvWriter(_TextWriter):
+    """CSV with a header row (empty field for NULL)"""
+
+    def __init__(self, path: str, compression: Optional[str]):
+        super().__init__(path, compression)
+        self.writer = csv.writer(self.out)
+        self.header = None
+
+    def write(self, table: Table) -> None:
+        if not len(table):
+            return
+        if self.header is None:
+            self.header = table.columns
+            self.writer.writerow(table.columns)
+        self.writer.writerows(zip(*(column_strings(values) for values in table.data)))
+        self.rows += len(table)
+
+
+class NdjsonWriter(_TextWriter):
+    """Newline-delimited JSON, one object per row"""
+
+    def write(self, table: Table) -> None:
+        if not len(table):
+            return
+        encoded = []
+        for column, values in zip(table.columns, table.data):
+            if column in table.json_columns:
+                encoded.append(['null' if value is None else value for value in values])
+            elif isinstance(values, np.ndarray) and values.dtype == bool:
+                encoded.append(np.where(values, 'true', 'false').tolist())
+            elif isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.number):
+                encoded.append([json.dumps(value) for value in values.tolist()])
+            elif isinstance(values, np.ndarray) or all(type(value) is str for value in values):
+                text = column_strings(values)
+                if _needs_escape(text, _JSON_SPECIAL):
+                    encoded.append([json.dumps(value) for value in text])
+                else:
+                    encoded.append([f'"{value}"' for value in text])
+            else:
+                encoded.append([_json_value(value) for value in values])
+
+        template = '{' + ', '.join(f'{json.dumps(column)}: %s' for column in table.columns) + '}\n'
+        self.out.writelines(template % row for row in zip(*encoded))
+        self.rows += len(table)
+
+
+class _ArrowWriter(_Writer):
+    """Base of the pyarrow writers; the schema is taken from the first batch"""
+
+    def __init__(self, path: str, compression: Optional[str]):
+        super().__init__(path, compression)
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("Parquet and Arrow exports require the pyarrow package")
+        self.pa = pyarrow
+        self.schema = None
+        self.writer = None
+
+    def _arrow_table(self, table: Table):
+        arrays = {}
+        for column, values in zip(table.columns, table.data):
+            if not isinstance(values, np.ndarray):
+                values = [
+                    value.isoformat() if isinstance(value, date) and not isinstance(value, datetime) else
+                    str(value) if not isinstance(value, (str, int, float, bool, datetime, type(None))) else value
+                    for value in values
+                ]
+            arrays[column] = self.pa.array(values)
+        arrow_table = self.pa.table(arrays)
+        if self.schema is None:
+            # Columns that are all NULL in the first batch are typed as strings
+            self.schema = self.pa.schema([
+                field.with_type(self.pa.string()) if self.pa.types.is_null(field.type) else field
+                for field in arrow_table.schema
+            ])
+            self.writer = self._open(self.schema)
+        return arrow_table.cast(self.schema)
+
+    def _open(self, schema):
+        raise NotImplementedError
+
+    def write(self, table: Table) -> None:
+        if not len(table):
+            return
+        arrow_table = self._arrow_table(table)
+        self.writer.write_table(arrow_table)
+        self.rows += len(table)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+class ParquetWriter(_ArrowWriter):
+    """Parquet file; gzip/zstd select the Parquet codec (snappy otherwise)"""
+
+    def _open(self, schema):
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(self.path, schema, compression=self.compression or 'snappy')
+
+
+class ArrowWriter(_ArrowWriter):
+    """Arrow IPC file (Feather v2); zstd compresses the record batches"""
+
+    def _open(self, schema):
+        if self.compression not in (None, 'zstd'):
+            raise ValueError("Arrow exports support zstd compression only")
+        options = self.pa.ipc.IpcWriteOptions(compression=self.compression)
+        return self.pa.ipc.new_file(self.path, schema, options=options)
+
+
+WRITERS = {
+    'copy': CopyTextWriter,
+    'csv': CsvWriter,
+    'ndjson': NdjsonWriter,
+    'parquet': ParquetWriter,
+    'arrow': ArrowWriter
+}
+
+
+def open_output(path: str, compression: Optional[str] = None):
+    """Binary file handle for path, compressing with gzip or zstd when requested"""
+    if compression is None:
+        return open(path, 'wb')
+    if compression == 'gzip':
+        return gzip.open(path, 'wb', compresslevel=6)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd compression requires the zstandard package")
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, 'wb'), closefd=True)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def detect_format(path: str, fmt: Optional[str] = None, compression: Optional[str] = None):
+    """(format, compression) from explicit arguments or the file name, e.g. metrics.csv.gz"""
+    root, extension = os.path.splitext(path)
+    if extension in COMPRESSION_EXTENSIONS:
+        compression = compression or COMPRESSION_EXTENSIONS[extension]
+        root, extension = os.path.splitext(root)
+    fmt = fmt or FORMAT_EXTENSIONS.get(extension)
+
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format for {path}: {fmt}")
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}")
+    return fmt, compression
+
+
+def create_writer(path: str, fmt: Optional[str] = None, compression: Optional[str] = None) -> _Writer:
+    """Streaming writer for path; format and compression default to the file extension"""
+    fmt, compression = detect_format(path, fmt, compression)
+    return WRITERS[fmt](path, compression)
+
+
+def export_batches(batches: Iterable[Any], path: str, fmt: Optional[str] = None,
+                   compression: Optional[str] = None) -> int:
+    """Stream batches to a file and return the number of rows written
+
+    Batches are SyntheticSeries (e.g. SyntheticDataGenerator.iter_series), lists of row dicts
+    (e.g. DatabaseManager.iter_query) or Tables; only one batch is held in memory at a time.
+    """
+    writer = create_writer(path, fmt, compression)
+    try:
+        for batch in batches:
+            writer.write(to_table(batch))
+    finally:
+        writer.close()
+
+    logger.info(f"Exported {writer.rows} rows to {path}")
+    return writer.rows
+
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Auxeira Time-Ordered IDs
+UUIDv7 generation (RFC 9562) for primary keys of append-heavy tables, matching uuid_generate_v7() in init.sql
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List
+
+import numpy as np
+
+# Layout: 48-bit unix ms | version 7 | 12-bit counter | variant 10 | 62 random bits.
+# The counter restarts every millisecond and, when it runs out, borrows the next one,
+# so ids from one process are strictly increasing.
+_COUNTER_BITS = 12
+_RANDOM_MASK = (1 << 62) - 1
+_VARIANT = 0b10 << 62
+
+_lock = threading.Lock()
+_last_ticks = 0
+
+
+def _reserve_ticks(count: int) -> int:
+    """First of count consecutive (ms << 12 | counter) ticks, never reused within the process"""
+    global _last_ticks
+    now = (time.time_ns() // 1_000_000) << _COUNTER_BITS
+    with _lock:
+        start = max(now, _last_ticks + 1)
+        _last_ticks = start + count - 1
+    return start
+
+
+def uuid7() -> str:
+    """A new time-ordered UUID string"""
+    ticks = _reserve_ticks(1)
+    random_bits = int.from_bytes(os.urandom(8), 'big') & _RANDOM_MASK
+    value = (
+        (ticks >> _COUNTER_BITS) << 80
+        | 0x7 << 76
+        | (ticks & 0xFFF) << 64
+        | _VARIANT
+        | random_bits
+    )
+    hex_id = f"{value:032x}"
+    return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
+
+
+def uuid7_batch(count: int) -> List[str]:
+    """count time-ordered UUID strings, increasing in list order"""
+    if count <= 0:
+        return []
+    return uuid_strings(uuid7_batch_bytes(count))
+
+
+def uuid7_batch_bytes(count: int) -> np.ndarray:
+    """count time-ordered UUIDv7s as (count, 16) uint8 bytes, increasing in row order"""
+    if count <= 0:
+        return np.empty((0, 16), dtype=np.uint8)
+    ticks = _reserve_ticks(count) + np.arange(count, dtype=np.uint64)
+    words = np.empty((count, 2), dtype='>u8')
+    words[:, 0] = ((ticks >> np.uint64(_COUNTER_BITS)) << np.uint64(16)) | np.uint64(0x7000) | (ticks & np.uint64(0xFFF))
+    random_words = np.frombuffer(os.urandom(8 * count), dtype=np.uint64)
+    words[:, 1] = (random_words & np.uint64(_RANDOM_MASK)) | np.uint64(_VARIANT)
+    return words.view(np.uint8).reshape(count, 16)
+
+
+def uuid7_from_timestamps(timestamps: np.ndarray, random_bytes: np.ndarray) -> np.ndarray:
+    """UUIDv7 bytes (n, 16) for given datetime64 timestamps, using (n, 16) uint8 random_bytes
+
+    Deterministic for deterministic inputs. Ids of backdated timestamps land all over the primary
+    key index, so rows inserted now should use uuid7_batch_bytes instead.
+    """
+    ids = random_bytes.copy()
+    millis = timestamps.astype('datetime64[ms]').astype(np.int64).astype('>u8')
+    ids[:, :6] = millis.view(np.uint8).reshape(-1, 8)[:, 2:]
+    ids[:, 6] = (ids[:, 6] & 0x0F) | 0x70  # version 7
+    ids[:, 8] = (ids[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    return ids
+
+
+def uuid_strings(uuid_bytes: np.ndarray) -> List[str]:
+    """Format (n, 16) uint8 UUID bytes as canonical UUID strings"""
+    hex_ids = np.ascontiguousarray(uuid_bytes).tobytes().hex()
+    return [
+        f"{hex_ids[i:i + 8]}-{hex_ids[i + 8:i + 12]}-{hex_ids[i + 12:i + 16]}-"
+        f"{hex_ids[i + 16:i + 20]}-{hex_ids[i + 20:i + 32]}"
+        for i in range(0, len(hex_ids), 32)
+    ]
+
+
+def uuid7_timestamp(value: str) -> datetime:
+    """Creation time encoded in a UUIDv7"""
+    millis = int(str(value).replace('-', '')[:12], 16)
+    return datetime.fromtimestamp(millis / 1000, tz=timezone.utc)
+
+
+def uuid7_floor(moment: datetime) -> str:
+    """Smallest UUIDv7 of moment's millisecond: every id created from then on sorts at or after it"""
+    millis = int(moment.timestamp() * 1000)
+    hex_id = f"{millis:012x}7000" + "8" + "0" * 15
+    return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Auxeira Gamification Leaderboards
+Sorted-set leaderboards (global, per organization, per week) with fast rank lookups,
+kept in process or in Redis and updated incrementally as tokens are awarded
+"""
+
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_SCOPES = ('global', 'org', 'week')
+
+
+def current_week_key(day: Optional[date] = None) -> str:
+    """ISO week identifier used as the weekly leaderboard key, e.g. '2025-W42'"""
+    year, week, _ = (day or datetime.now(timezone.utc).date()).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def current_week_start() -> datetime:
+    """Start of the current ISO week (Monday 00:00 UTC), the window of the weekly board"""
+    today = datetime.now(timezone.utc).date()
+    return datetime.combine(today - timedelta(days=today.weekday()), datetime.min.time(), tzinfo=timezone.utc)
+
+
+class SortedScoreSet:
+    """In-process sorted set ordered by score descending, then member ascending
+
+    Ranks are found by binary search over a sorted key list, so lookups stay
+    sub-millisecond at millions of members; updates shift the list in C (memmove).
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[int, str]] = []
+        self._scores: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def load(self, entries: Iterable[Tuple[str, int]]) -> None:
+        """Replace the set contents with (member, score) pairs"""
+        self._scores = {member: int(score) for member, score in entries}
+        self._keys = sorted((-score, member) for member, score in self._scores.items())
+
+    def score(self, member: str) -> Optional[int]:
+        return self._scores.get(member)
+
+    def set(self, member: str, score: int) -> None:
+        self.remove(member)
+        score = int(score)
+        self._scores[member] = score
+        insort(self._keys, (-score, member))
+
+    def incr(self, member: str, delta: int) -> int:
+        score = self._scores.get(member, 0) + int(delta)
+        self.set(member, score)
+        return score
+
+    def remove(self, member: str) -> None:
+        score = self._scores.pop(member, None)
+        if score is not None:
+            index = bisect_left(self._keys, (-score, member))
+            del self._keys[index]
+
+    def rank(self, member: str) -> Optional[int]:
+        """Zero-based rank of member (0 is the highest score)"""
+        score = self._scores.get(member)
+        if score is None:
+            return None
+        return bisect_left(self._keys, (-score, member))
+
+    def range(self, start: int, stop: int) -> List[Tuple[str, int]]:
+        """Members ranked in [start, stop) with their scores"""
+        return [(member, -neg_score) for neg_score, member in self._keys[max(0, start):stop]]
+
+
+class RedisScoreSet:
+    """Redis sorted set with the same interface as SortedScoreSet"""
+
+    def __init__(self, client, key: str, ttl_seconds: Optional[int] = None):
+        self.client = client
+        self.key = key
+        self.ttl_seconds = ttl_seconds
+
+    def __len__(self) -> int:
+        return self.client.zcard(self.key)
+
+    def exists(self) -> bool:
+        return bool(self.client.exists(self.key))
+
+    def load(self, entries: Iterable[Tuple[str, int]]) -> None:
+        pipe = self.client.pipeline()
+        pipe.delete(self.key)
+        batch = {}
+        for member, score in entries:
+            batch[member] = int(score)
+            if len(batch) >= 10000:
+                pipe.zadd(self.key, batch)
+                batch = {}
+        if batch:
+            pipe.zadd(self.key, batch)
+        if self.ttl_seconds:
+            pipe.expire(self.key, self.ttl_seconds)
+        pipe.execute()
+
+    def score(self, member: str) -> Optional[int]:
+        score = self.client.zscore(self.key, member)
+        return int(score) if score is not None else None
+
+    def set(self, member: str, score: int) -> None:
+        self.client.zadd(self.key, {member: int(score)})
+
+    def incr(self, member: str, delta: int) -> int:
+        score = int(self.client.zincrby(self.key, int(delta), member))
+        if self.ttl_seconds:
+            self.client.expire(self.key, self.ttl_seconds)
+        return score
+
+    def remove(self, member: str) -> None:
+        self.client.zrem(self.key, member)
+
+    def rank(self, member: str) -> Optional[int]:
+        return self.client.zrevrank(self.key, member)
+
+    def range(self, start: int, stop: int) -> List[Tuple[str, int]]:
+        if stop <= start:
+            return []
+        entries = self.client.zrevrange(self.key, max(0, start), stop - 1, withscores=True)
+        return [(member.decode() if isinstance(member, bytes) else member, int(score)) for member, score in entries]
+
+
+class LeaderboardService:
+    """Global, per-organization and weekly token leaderboards
+
+    Boards are loaded from the database on first use (see DatabaseManager.refresh_leaderboards)
+    and then updated incrementally by every gamification profile update. In-process boards
+    are reloaded every rebuild_interval_seconds so that processes converge on updates made
+    elsewhere; Redis-backed boards are shared and only loaded when missing.
+    """
+
+    def __init__(self, redis_client=None, key_prefix: str = 'auxeira:leaderboard',
+                 rebuild_interval_seconds: float = 900):
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.rebuild_interval_seconds = rebuild_interval_seconds
+        self._boards: Dict[Tuple[str, str], SortedScoreSet] = {}
+        self._member_orgs: Dict[str, str] = {}
+        self._week_key: Optional[str] = None
+        self._built_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def is_loaded(self) -> bool:
+        """Whether boards have been loaded and can take incremental updates"""
+        if self.redis is not None:
+            return self._board('global', '').exists()
+        return self._built_at is not None
+
+    def needs_rebuild(self) -> bool:
+        """Whether the boards were never loaded, are stale, or the week has rolled over"""
+        week_key = current_week_key()
+        if self.redis is not None:
+            # Shared boards: load once per week (marker) or when the global board was evicted
+            loaded = self.redis.exists(self._loaded_marker(week_key)) and self.is_loaded()
+            if loaded:
+                self._week_key = week_key
+            return not loaded
+        if self._week_key != week_key:
+            return True
+        return self._built_at is None or time.monotonic() - self._built_at > self.rebuild_interval_seconds
+
+    def rebuild(self,
+                profiles: Iterable[Tuple[str, Optional[str], int]],
+                weekly_tokens: Iterable[Tuple[str, int]]) -> None:
+        """Load boards from (user_id, org_id, total_tokens) profiles and this week's (user_id, tokens)"""
+        week_key = current_week_key()
+        global_entries = []
+        org_entries: Dict[str, List[Tuple[str, int]]] = {}
+        member_orgs = {}
+
+        for user_id, org_id, total_tokens in profiles:
+            user_id = str(user_id)
+            global_entries.append((user_id, total_tokens or 0))
+            if org_id:
+                org_id = str(org_id)
+                member_orgs[user_id] = org_id
+                org_entries.setdefault(org_id, []).append((user_id, total_tokens or 0))
+
+        with self._lock:
+            if self.redis is None:
+                self._boards = {}
+            self._board('global', '').load(global_entries)
+            for org_id, entries in org_entries.items():
+                self._board('org', org_id).load(entries)
+            self._board('week', week_key).load((str(user_id), tokens or 0) for user_id, tokens in weekly_tokens)
+            self._member_orgs = member_orgs
+            self._week_key = week_key
+            self._built_at = time.monotonic()
+            if self.redis is not None:
+                self.redis.set(self._loaded_marker(week_key), 1, ex=8 * 24 * 3600)
+
+        logger.info(f"Loaded leaderboards: {len(global_entries)} profiles, {len(org_entries)} organizations")
+
+    def record(self, user_id: str, total_tokens: int, token_delta: int, org_id: Optional[str] = None) -> None:
+        """Apply a profile update: new lifetime total and the tokens just awarded"""
+        user_id = str(user_id)
+        org_id = str(org_id) if org_id else None
+
+        with self._lock:
+            self._board('global', '').set(user_id, total_tokens)
+
+            previous_org = self._member_orgs.get(user_id)
+            if previous_org and previous_org != org_id and org_id:
+                self._board('org', previous_org).remove(user_id)
+            org_id = org_id or previous_org
+            if org_id:
+                self._member_orgs[user_id] = org_id
+                self._board('org', org_id).set(user_id, total_tokens)
+
+            if token_delta:
+                self._board('week', self._week_key or current_week_key()).incr(user_id, token_delta)
+
+    def board_key(self, scope: str, user_id: Optional[str] = None, org_id: Optional[str] = None) -> str:
+        """Resolve the board key for a scope ('' for global, org id, or ISO week)"""
+        if scope == 'global':
+            return ''
+        if scope == 'org':
+            return str(org_id or self._member_orgs.get(str(user_id), ''))
+        if scope == 'week':
+            return self._week_key or current_week_key()
+        raise ValueError(f"Unsupported leaderboard scope: {scope}")
+
+    def top(self, scope: str, key: str, limit: int = 10) -> List[Dict[str, int]]:
+        """Top entries of a board"""
+        with self._lock:
+            entries = self._board(scope, key).range(0, limit)
+        return [
+            {'rank': rank + 1, 'userId': member, 'tokens': score}
+            for rank, (member, score) in enumerate(entries)
+        ]
+
+    def around(self, scope: str, key: str, user_id: str, radius: int = 5) -> Optional[Dict[str, object]]:
+        """A user's rank and the entries within radius places of it"""
+        user_id = str(user_id)
+        with self._lock:
+            board = self._board(scope, key)
+            rank = board.rank(user_id)
+            if rank is None:
+                return None
+            start = max(0, rank - radius)
+            entries = board.range(start, rank + radius + 1)
+            size = len(board)
+
+        return {
+            'rank': rank + 1,
+            'tokens': dict(entries).get(user_id),
+            'totalEntries': size,
+            'neighbours': [
+                {'rank': start + offset + 1, 'userId': member, 'tokens': score}
+                for offset, (member, score) in enumerate(entries)
+            ]
+        }
+
+    def _loaded_marker(self, week_key: str) -> str:
+        return f"{self.key_prefix}:loaded:{week_key}"
+
+    def _board(self, scope: str, key: str):
+        if self.redis is not None:
+            ttl = 14 * 24 * 3600 if scope == 'week' else None
+            return RedisScoreSet(self.redis, f"{self.key_prefix}:{scope}:{key}", ttl_seconds=ttl)
+
+        board = self._boards.get((scope, key))
+        if board is None:
+            board = self._boards[(scope, key)] = SortedScoreSet()
+        return board
+
+
+def create_leaderboard_service() -> LeaderboardService:
+    """Build a LeaderboardService, backed by Redis when REDIS_HOST is configured"""
+    rebuild_interval = int(os.environ.get('LEADERBOARD_REBUILD_SECONDS', 900))
+    redis_host = os.environ.get('REDIS_HOST')
+
+    if redis_host:
+        try:
+            import redis
+            client = redis.Redis(
+                host=redis_host,
+                port=int(os.environ.get('REDIS_PORT', 6379)),
+                socket_timeout=1
+            )
+            return LeaderboardService(redis_client=client, rebuild_interval_seconds=rebuild_interval)
+        except ImportError:
+            logger.warning("redis package not installed, using in-process leaderboards")
+
+    return LeaderboardService(rebuild_interval_seconds=rebuild_interval)
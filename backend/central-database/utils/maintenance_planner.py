@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Auxeira Maintenance Planner
+Chooses VACUUM / ANALYZE / REINDEX CONCURRENTLY steps from pg_stat_user_tables and estimated bloat,
+runs them within a time budget and records each step in maintenance_runs
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from psycopg2.extras import Json, RealDictCursor
+
+from utils.ids import uuid7
+
+logger = logging.getLogger(__name__)
+
+# VACUUM when dead tuples exceed threshold + scale * live tuples (stricter than the autovacuum defaults)
+VACUUM_THRESHOLD = 1000
+VACUUM_SCALE = 0.1
+
+# ANALYZE when rows modified since the last analyze exceed threshold + scale * live tuples
+ANALYZE_THRESHOLD = 500
+ANALYZE_SCALE = 0.05
+
+# REINDEX CONCURRENTLY B-tree indexes at least this large whose estimated bloat exceeds the ratio
+REINDEX_MIN_BYTES = 8 * 2**20
+REINDEX_BLOAT_RATIO = 0.4
+
+# Conservative throughput used to estimate whether a step fits in the remaining time
+VACUUM_BYTES_PER_SECOND = 100 * 2**20
+ANALYZE_SECONDS = 2.0
+REINDEX_BYTES_PER_SECOND = 25 * 2**20
+
+# Invalid indexes named like this are leftovers of an interrupted REINDEX CONCURRENTLY and run first
+CONCURRENT_BUILD_LEFTOVER = re.compile(r'_cc(new|old)\d*$')
+FIRST_PRIORITY = 1e18
+
+# Time left for the caller after the last step
+DEFAULT_TIME_RESERVE_MS = 30000
+
+TABLE_STATS_QUERY = """
+    SELECT s.relname AS table_name,
+           s.n_live_tup, s.n_dead_tup, s.n_mod_since_analyze,
+           GREATEST(s.last_vacuum, s.last_autovacuum) AS last_vacuum,
+           GREATEST(s.last_analyze, s.last_autoanalyze) AS last_analyze,
+           pg_table_size(s.relid) AS table_bytes
+    FROM pg_stat_user_tables s
+    WHERE s.schemaname = 'public'
+"""
+
+# Expected B-tree size: per entry an 8-byte tuple header, the MAXALIGNed key and a 4-byte line
+# pointer, on leaf pages filled to the default 90%
+INDEX_STATS_QUERY = """
+    SELECT t.relname AS table_name,
+           ic.relname AS index_name,
+           i.indisvalid AS is_valid,
+           pg_relation_size(i.indexrelid) AS index_bytes,
+           GREATEST(ic.reltuples, 0) * (12 + 8 * CEIL(COALESCE((
+               SELECT SUM(st.avg_width)
+               FROM pg_attribute a
+               JOIN pg_stats st ON st.schemaname = 'public' AND st.tablename = t.relname AND st.attname = a.attname
+               WHERE a.attrelid = t.oid AND a.attnum = ANY(i.indkey)
+           ), 16) / 8.0)) / 0.9 AS expected_bytes
+    FROM pg_index i
+    JOIN pg_class t ON t.oid = i.indrelid
+    JOIN pg_class ic ON ic.oid = i.indexrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    JOIN pg_am am ON am.oid = ic.relam
+    WHERE n.nspname = 'public' AND am.amname = 'btree'
+"""
+
+
+@dataclass
+class MaintenanceStep:
+    """One maintenance command with the statistics that called for it"""
+    action: str  # VACUUM, ANALYZE, VACUUM ANALYZE, REINDEX, DROP INVALID INDEX
+    table_name: str
+    index_name: Optional[str] = None
+    reason: str = ''
+    priority: float = 0.0
+    estimated_seconds: float = 0.0
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    def sql(self) -> str:
+        if self.action == 'REINDEX':
+            return f'REINDEX INDEX CONCURRENTLY "{self.index_name}"'
+        if self.action == 'DROP INVALID INDEX':
+            return f'DROP INDEX CONCURRENTLY IF EXISTS "{self.index_name}"'
+        return f'{self.action} "{self.table_name}"'
+
+
+class MaintenancePlanner:
+    """Plans and runs table and index maintenance from the statistics collector
+
+    Steps run highest priority first on an autocommit connection. A step whose estimated
+    duration does not fit in the remaining budget is skipped, and every step runs with a
+    statement_timeout of the remaining budget. An interrupted REINDEX CONCURRENTLY leaves an
+    invalid index behind, which the next plan drops.
+    """
+
+    def __init__(self,
+                 db_manager,
+                 remaining_ms: Optional[Callable[[], int]] = None,
+                 time_reserve_ms: int = DEFAULT_TIME_RESERVE_MS,
+                 reindex: bool = True):
+        self.db_manager = db_manager
+        self.remaining_ms = remaining_ms
+        self.time_reserve_ms = time_reserve_ms
+        self.reindex = reindex
+
+    def plan(self) -> List[MaintenanceStep]:
+        """Maintenance steps the current statistics call for, highest priority first"""
+        with self.db_manager.get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(TABLE_STATS_QUERY)
+                tables = cursor.fetchall()
+                cursor.execute(INDEX_STATS_QUERY)
+                indexes = cursor.fetchall()
+            conn.commit()
+
+        steps = [step for step in (self._table_step(table) for table in tables) if step]
+        steps.extend(step for step in (self._index_step(index) for index in indexes) if step)
+        steps.sort(key=lambda step: step.priority, reverse=True)
+        return steps
+
+    def _table_step(self, table: Dict[str, Any]) -> Optional[MaintenanceStep]:
+        live = table['n_live_tup'] or 0
+        dead = table['n_dead_tup'] or 0
+        modified = table['n_mod_since_analyze'] or 0
+
+        needs_vacuum = dead > VACUUM_THRESHOLD + VACUUM_SCALE * live
+        needs_analyze = modified > ANALYZE_THRESHOLD + ANALYZE_SCALE * live or \
+            (table['last_analyze'] is None and live + modified > 0)
+        if not needs_vacuum and not needs_analyze:
+            return None
+
+        dead_ratio = dead / (live + dead) if live + dead else 0.0
+        reasons = []
+        if needs_vacuum:
+            reasons.append(f"{dead} dead tuples ({dead_ratio:.0%})")
+        if needs_analyze:
+            reasons.append(f"{modified} rows modified since analyze" if table['last_analyze'] else "never analyzed")
+
+        action = 'VACUUM ANALYZE' if needs_vacuum else 'ANALYZE'
+        estimated = ANALYZE_SECONDS + (table['table_bytes'] / VACUUM_BYTES_PER_SECOND if needs_vacuum else 0)
+        return MaintenanceStep(
+            action=action,
+            table_name=table['table_name'],
+            reason='; '.join(reasons),
+            priority=dead + modified,
+            estimated_seconds=round(estimated, 2),
+            stats={
+                'n_live_tup': live,
+                'n_dead_tup': dead,
+                'n_mod_since_analyze': modified,
+                'dead_ratio': round(dead_ratio, 4),
+                'table_bytes': table['table_bytes'],
+                'last_vacuum': table['last_vacuum'].isoformat() if table['last_vacuum'] else None,
+                'last_analyze': table['last_analyze'].isoformat() if table['last_analyze'] else None
+            }
+        )
+
+    def _index_step(self, index: Dict[str, Any]) -> Optional[MaintenanceStep]:
+        size = index['index_bytes']
+        if not index['is_valid']:
+            # Left behind by an interrupted REINDEX CONCURRENTLY (or CREATE INDEX CONCURRENTLY)
+            if not CONCURRENT_BUILD_LEFTOVER.search(index['index_name']):
+                return None
+            return MaintenanceStep(
+                action='DROP INVALID INDEX',
+                table_name=index['table_name'],
+                index_name=index['index_name'],
+                reason='invalid index left by an interrupted concurrent build',
+                priority=FIRST_PRIORITY,
+                estimated_seconds=1.0,
+                stats={'index_bytes': size}
+            )
+
+        if not self.reindex or size < REINDEX_MIN_BYTES:
+            return None
+        bloat = 1 - float(index['expected_bytes']) / size
+        if bloat < REINDEX_BLOAT_RATIO:
+            return None
+
+        return MaintenanceStep(
+            action='REINDEX',
+            table_name=index['table_name'],
+            index_name=index['index_name'],
+            reason=f"estimated bloat {bloat:.0%} of {size / 2**20:.1f} MB",
+            priority=bloat * size / 100,
+            estimated_seconds=round(size / REINDEX_BYTES_PER_SECOND, 2),
+            stats={'index_bytes': size, 'expected_bytes': int(index['expected_bytes']), 'bloat_ratio': round(bloat, 4)}
+        )
+
+    def _budget_ms(self) -> Optional[int]:
+        if self.remaining_ms is None:
+            return None
+        return self.remaining_ms() - self.time_reserve_ms
+
+    def run(self, steps: Optional[List[MaintenanceStep]] = None) -> Dict[str, Any]:
+        """Run planned steps within the time budget; returns the run id and each step's outcome"""
+        steps = self.plan() if steps is None else steps
+        run_id = uuid7()
+        results = []
+
+        with self.db_manager.get_connection(own_transaction=True) as conn:
+            conn.autocommit = True
+            try:
+                with conn.cursor() as cursor:
+                    for number, step in enumerate(steps, 1):
+                        results.append(self._run_step(cursor, run_id, number, step))
+                    cursor.execute("RESET statement_timeout")
+            finally:
+                conn.autocommit = False
+
+        completed = sum(1 for result in results if result['status'] == 'completed')
+        logger.info(f"Maintenance run {run_id}: {completed} of {len(steps)} steps completed")
+        return {'run_id': run_id, 'planned': len(steps), 'completed': completed, 'steps': results}
+
+    def _run_step(self, cursor, run_id: str, number: int, step: MaintenanceStep) -> Dict[str, Any]:
+        result = dict(asdict(step), step=number, status='completed', duration_ms=0.0, error=None)
+        del result['stats']
+
+        budget_ms = self._budget_ms()
+        if budget_ms is not None and budget_ms < step.estimated_seconds * 1000:
+            result['status'] = 'skipped'
+            result['error'] = 'does not fit in the remaining time budget'
+        else:
+            started = time.perf_counter()
+            try:
+                cursor.execute("SELECT set_config('statement_timeout', %s, false)",
+                               (str(max(budget_ms, 1000)) if budget_ms is not None else '0',))
+                cursor.execute(step.sql())
+                logger.info(f"Maintenance: {step.sql()} ({step.reason})")
+            except Exception as e:
+                result['status'] = 'failed'
+                result['error'] = str(e).strip()
+                logger.warning(f"Maintenance step failed: {step.sql()}: {result['error']}")
+            result['duration_ms'] = round((time.perf_counter() - started) * 1000, 1)
+
+        self._record(run_id, number, step, result)
+        return result
+
+    def _record(self, run_id: str, number: int, step: MaintenanceStep, result: Dict[str, Any]) -> None:
+        try:
+            self.db_manager.execute_query("""
+                INSERT INTO maintenance_runs (
+                    run_id, step, action, table_name, index_name, reason,
+                    status, duration_ms, error, stats
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (
+                run_id, number, step.action, step.table_name, step.index_name, step.reason,
+                result['status'], result['duration_ms'], result['error'], Json(step.stats)
+            ))
+        except Exception as e:
+            logger.error(f"Failed to record maintenance step {run_id}/{number}: {e}")
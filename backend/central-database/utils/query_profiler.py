@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Auxeira Query Profiler
+Opt-in per-statement latency histograms, row counts, pool wait and slow query log for DatabaseManager
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import psycopg2.extensions
+
+logger = logging.getLogger(__name__)
+
+# Latency histogram bucket upper bounds (ms); the last bucket is open-ended
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+DEFAULT_SLOW_QUERY_MS = 500.0
+
+# Statements longer than this (e.g. execute_values pages with inlined rows) are normalized from their
+# first characters only and never cached; the cache of shorter ones is bounded by total text size
+MAX_NORMALIZED_CHARS = 4096
+NORMALIZED_CACHE_BYTES = 4 * 1024 * 1024
+
+_COMMENTS = re.compile(r'--[^\n]*|/\*.*?\*/', re.S)
+_STRINGS = re.compile(r"(?:E|e)?'(?:[^']|'')*'")
+_PLACEHOLDERS = re.compile(r'%\([^)]+\)s|%s|\$\d+')
+_NUMBERS = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])')
+_LISTS = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_ROW_LISTS = re.compile(r'\(\?\.\.\.\)(?:\s*,\s*\(\?\.\.\.\))+')
+_WHITESPACE = re.compile(r'\s+')
+_GROUP_RUNS = re.compile(r'\([^()]*\)(?:\s*,\s*\([^()]*\))+')
+
+
+def _drop_open_group(text: str) -> str:
+    """Text up to the innermost parenthesis left open, i.e. without a row cut off mid-way"""
+    opened = []
+    for index, char in enumerate(text):
+        if char == '(':
+            opened.append(index)
+        elif char == ')' and opened:
+            opened.pop()
+    return text[:opened[-1]].rstrip().rstrip(',') if opened else text
+
+
+def normalize(statement: str, max_chars: Optional[int] = None) -> str:
+    """Statement text with comments, literals and placeholders removed
+
+    psycopg2 placeholders and the $n placeholders of pg_stat_statements both become ?, and
+    lists of them collapse, so a statement and its pg_stat_statements entry normalize alike.
+    Past max_chars only the start is normalized, cut back to whole literals and rows with any run
+    of rows collapsed, so pages of the same bulk insert share one text.
+    """
+    truncated = max_chars is not None and len(statement) > max_chars
+    if truncated:
+        statement = statement[:max_chars]
+        if statement.count("'") % 2:
+            statement = statement[:statement.rfind("'")]
+    text = _COMMENTS.sub(' ', statement)
+    text = _STRINGS.sub('?', text)
+    text = _PLACEHOLDERS.sub('?', text)
+    text = _NUMBERS.sub('?', text)
+    text = _LISTS.sub('(?...)', text)
+    text = _ROW_LISTS.sub('(?...)', text)
+    if truncated:
+        text = _GROUP_RUNS.sub('(...)', _drop_open_group(text)) + ' ...'
+    return _WHITESPACE.sub(' ', text).strip().rstrip(';').lower()
+
+
+def fingerprint(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16]
+
+
+def redact(params: Any) -> Any:
+    """Parameter shapes without values, for logging"""
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {key: type(value).__name__ for key, value in params.items()}
+    if isinstance(params, (list, tuple)):
+        return [type(value).__name__ for value in params]
+    return type(params).__name__
+
+
+class _StatementStats:
+    __slots__ = ('statement', 'calls', 'errors', 'total_ms', 'max_ms', 'rows', 'pool_wait_ms', 'buckets')
+
+    def __init__(self, statement: str):
+        self.statement = statement
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.pool_wait_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the histogram bucket holding the given fraction of calls"""
+        if not self.calls:
+            return None
+        target = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+
+class QueryProfiler:
+    """Aggregates statement timings per fingerprint (thread safe)"""
+
+    def __init__(self, slow_query_ms: float = DEFAULT_SLOW_QUERY_MS, max_statements: int = 1000):
+        self.slow_query_ms = slow_query_ms
+        self.max_statements = max_statements
+        self.started_at = time.time()
+        self._stats: Dict[str, _StatementStats] = {}
+        self._lock = threading.Lock()
+        self._cursor_classes: Dict[type, type] = {}
+        self._normalized: Dict[str, tuple] = {}
+        self._normalized_bytes = 0
+
+    def _identify(self, statement: str) -> tuple:
+        if len(statement) > MAX_NORMALIZED_CHARS:
+            normalized = normalize(statement, MAX_NORMALIZED_CHARS)
+            return fingerprint(normalized), normalized
+        known = self._normalized.get(statement)
+        if known is None:
+            normalized = normalize(statement)
+            known = (fingerprint(normalized), normalized)
+            size = len(statement) + len(normalized)
+            if self._normalized_bytes + size <= NORMALIZED_CACHE_BYTES:
+                self._normalized[statement] = known
+                self._normalized_bytes += size
+        return known
+
+    def record(self, statement: str, elapsed_ms: float, rows: int = 0, pool_wait_ms: float = 0.0,
+               params: Any = None, error: bool = False) -> None:
+        """Add one execution of statement to its fingerprint's stats"""
+        key, normalized = self._identify(statement)
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound), len(LATENCY_BUCKETS_MS))
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_statements:
+                    key, stats = '_other', self._stats.setdefault('_other', _StatementStats('(other statements)'))
+                else:
+                    stats = self._stats[key] = _StatementStats(normalized)
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.rows += max(rows, 0)
+            stats.pool_wait_ms += pool_wait_ms
+            stats.buckets[bucket] += 1
+
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning(f"Slow query {key} ({elapsed_ms:.1f} ms, {rows} rows): {normalized[:500]} "
+                           f"params={redact(params)}")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+    def report(self, server_stats: Optional[List[Dict[str, Any]]] = None, limit: int = 50) -> Dict[str, Any]:
+        """Statements by total time, merged with pg_stat_statements rows on matching fingerprints"""
+        server = {}
+        for row in server_stats or []:
+            key, _ = self._identify(row['query'])
+            merged = server.setdefault(key, {'calls': 0, 'total_exec_ms': 0.0, 'rows': 0,
+                                             'shared_blks_hit': 0, 'shared_blks_read': 0})
+            merged['calls'] += row['calls']
+            merged['total_exec_ms'] += float(row['total_exec_time'])
+            merged['rows'] += row['rows']
+            merged['shared_blks_hit'] += row['shared_blks_hit']
+            merged['shared_blks_read'] += row['shared_blks_read']
+
+        with self._lock:
+            ranked = sorted(self._stats.items(), key=lambda item: item[1].total_ms, reverse=True)[:limit]
+            statements = [
+                {
+                    'fingerprint': key,
+                    'statement': stats.statement,
+                    'calls': stats.calls,
+                    'errors': stats.errors,
+                    'total_ms': round(stats.total_ms, 2),
+                    'mean_ms': round(stats.total_ms / stats.calls, 3),
+                    'p50_ms': stats.percentile(0.5),
+                    'p95_ms': stats.percentile(0.95),
+                    'p99_ms': stats.percentile(0.99),
+                    'max_ms': round(stats.max_ms, 2),
+                    'rows': stats.rows,
+                    'mean_pool_wait_ms': round(stats.pool_wait_ms / stats.calls, 3),
+                    'histogram': dict(zip([f"<={bound}" for bound in LATENCY_BUCKETS_MS] + ['>'], stats.buckets)),
+                    'server': server.get(key)
+                }
+                for key, stats in ranked
+            ]
+
+        return {
+            'since': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(self.started_at)),
+            'slow_query_ms': self.slow_query_ms,
+            'statements': statements
+        }
+
+    def connection_factory(self):
+        """psycopg2 connection class whose cursors (of any cursor_factory) report to this profiler"""
+        profiler = self
+
+        class ProfiledConnection(psycopg2.extensions.connection):
+            pool_wait_ms = 0.0
+
+            def cursor(self, *args, **kwargs):
+                factory = kwargs.get('cursor_factory') or self.cursor_factory or psycopg2.extensions.cursor
+                kwargs['cursor_factory'] = profiler._cursor_class(factory)
+                return super().cursor(*args, **kwargs)
+
+        return ProfiledConnection
+
+    def _cursor_class(self, factory: type) -> type:
+        profiled = self._cursor_classes.get(factory)
+        if profiled is None:
+            profiled = self._cursor_classes[factory] = type(f"Profiled{factory.__name__}", (_ProfiledCursorMixin, factory), {
+                '_profiler': self
+            })
+        return profiled
+
+
+class _ProfiledCursorMixin:
+    """Times execute/executemany/copy_expert; the first statement on a checkout carries its pool wait"""
+
+    _profiler: QueryProfiler
+
+    def _profile(self, statement, params, call):
+        if isinstance(statement, bytes):
+            statement = statement.decode()
+        elif not isinstance(statement, str):
+            statement = statement.as_string(self.connection)
+
+        pool_wait_ms = self.connection.pool_wait_ms
+        self.connection.pool_wait_ms = 0.0
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception:
+            self._profiler.record(statement, (time.perf_counter() - started) * 1000, 0, pool_wait_ms, params, True)
+            raise
+        self._profiler.record(statement, (time.perf_counter() - started) * 1000, self.rowcount, pool_wait_ms, params)
+        return result
+
+    def execute(self, query, vars=None):
+        execute = super().execute
+        return self._profile(query, vars, lambda: execute(query, vars))
+
+    def executemany(self, query, vars_list):
+        executemany = super().executemany
+        return self._profile(query, vars_list, lambda: executemany(query, vars_list))
+
+    def copy_expert(self, sql, file, size=8192):
+        copy_expert = super().copy_expert
+        return self._profile(sql, None, lambda: copy_expert(sql, file, size))
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Auxeira Request Timing
+Per-route latency histograms split into auth, db, serialize and handler phases,
+with Server-Timing headers and Prometheus text exposition
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds (seconds), Prometheus style; +Inf is implicit
+LATENCY_BUCKETS_S = (0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PHASES = ('auth', 'db', 'serialize', 'handler', 'total')
+
+METRIC_NAME = 'auxeira_http_request_duration_seconds'
+
+
+class RequestTimings:
+    """Phase durations (ms) of the request in flight"""
+
+    __slots__ = ('started', 'phases', 'depth')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {'auth': 0.0, 'db': 0.0, 'serialize': 0.0}
+        self.depth = {'auth': 0, 'db': 0, 'serialize': 0}
+
+    def finish(self) -> Dict[str, float]:
+        """All phases; handler time is whatever the other phases do not account for"""
+        total = (time.perf_counter() - self.started) * 1000
+        phases = dict(self.phases)
+        phases['handler'] = max(total - sum(phases.values()), 0.0)
+        phases['total'] = total
+        return phases
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar('request_timings', default=None)
+
+
+def start_request() -> RequestTimings:
+    timings = RequestTimings()
+    _current.set(timings)
+    return timings
+
+
+def end_request() -> Optional[RequestTimings]:
+    timings = _current.get()
+    _current.set(None)
+    return timings
+
+
+@contextmanager
+def timed(phase: str):
+    """Add the enclosed time to phase of the current request (nested sections count once)"""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+
+    timings.depth[phase] += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.depth[phase] -= 1
+        if timings.depth[phase] == 0:
+            timings.phases[phase] += (time.perf_counter() - started) * 1000
+
+
+def server_timing_header(phases: Dict[str, float]) -> str:
+    return ', '.join(f"{phase};dur={phases[phase]:.2f}" for phase in PHASES if phase in phases)
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'count', 'sum')
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_S) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS_S) if seconds <= bound), len(LATENCY_BUCKETS_S))
+        self.buckets[index] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Linear interpolation inside the bucket holding the quantile (as Prometheus histogram_quantile)"""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            if seen + count >= target and count:
+                if index == len(LATENCY_BUCKETS_S):
+                    return LATENCY_BUCKETS_S[-1]
+                lower = LATENCY_BUCKETS_S[index - 1] if index else 0.0
+                return lower + (LATENCY_BUCKETS_S[index] - lower) * (target - seen) / count
+            seen += count
+        return LATENCY_BUCKETS_S[-1]
+
+
+class RouteLatency:
+    """Histograms per (route, method, phase), thread safe"""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str, str], _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, route: str, method: str, phases: Dict[str, float]) -> None:
+        with self._lock:
+            for phase, ms in phases.items():
+                histogram = self._histograms.get((route, method, phase))
+                if histogram is None:
+                    histogram = self._histograms[(route, method, phase)] = _Histogram()
+                histogram.observe(ms / 1000)
+
+    def summary(self) -> List[Dict[str, object]]:
+        """p50/p95/p99 (ms) per route, method and phase"""
+        with self._lock:
+            return [
+                {
+                    'route': route,
+                    'method': method,
+                    'phase': phase,
+                    'count': histogram.count,
+                    'mean_ms': round(histogram.sum / histogram.count * 1000, 3),
+                    **{
+                        f"p{int(q * 100)}_ms": round(histogram.quantile(q) * 1000, 3)
+                        for q in (0.5, 0.95, 0.99)
+                    }
+                }
+                for (route, method, phase), histogram in sorted(self._histograms.items())
+            ]
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition (version 0.0.4) of all histograms"""
+        lines = [
+            f"# HELP {METRIC_NAME} API request latency by route and phase (auth, db, serialize, handler, total)",
+            f"# TYPE {METRIC_NAME} histogram"
+        ]
+        with self._lock:
+            for (route, method, phase), histogram in sorted(self._histograms.items()):
+                labels = f'route="{_escape(route)}",method="{method}",phase="{phase}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS_S + (float('inf'),), histogram.buckets):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f"{METRIC_NAME}_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"{METRIC_NAME}_count{{{labels}}} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
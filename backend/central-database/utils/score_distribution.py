@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Auxeira SSE Score Distribution
+In-memory histogram of the latest SSE score of every startup, used for O(1) percentile ranking
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+# SSE scores are integers in [0, 100] (see sse_scores.total_score CHECK constraint)
+MIN_SCORE = 0
+MAX_SCORE = 100
+
+
+class ScoreDistribution:
+    """Exact score histogram with a cumulative index for constant-time percentile lookups
+
+    Each startup contributes its latest score exactly once. The histogram is updated
+    incrementally on every new score and rebuilt from the database periodically so that
+    processes that did not see every insert converge on the true distribution.
+    """
+
+    def __init__(self, rebuild_interval_seconds: float = 900):
+        self.rebuild_interval_seconds = rebuild_interval_seconds
+        self._counts = [0] * (MAX_SCORE + 1)
+        # _below[s] = number of startups whose latest score is strictly below s
+        self._below = [0] * (MAX_SCORE + 2)
+        self._total = 0
+        self._built_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def needs_rebuild(self) -> bool:
+        """Whether the histogram was never loaded or is older than the rebuild interval"""
+        return self._built_at is None or time.monotonic() - self._built_at > self.rebuild_interval_seconds
+
+    def rebuild(self, score_counts: Dict[int, int]) -> None:
+        """Replace the histogram with {score: number of startups} counts"""
+        counts = [0] * (MAX_SCORE + 1)
+        for score, count in score_counts.items():
+            counts[self._clamp(score)] += int(count)
+
+        with self._lock:
+            self._counts = counts
+            self._total = sum(counts)
+            self._reindex(MIN_SCORE)
+            self._built_at = time.monotonic()
+
+    def record(self, score: int, previous_score: Optional[int] = None) -> None:
+        """Apply a startup's new latest score, replacing its previous one if it had any"""
+        score = self._clamp(score)
+        with self._lock:
+            start = score
+            if previous_score is not None:
+                previous_score = self._clamp(previous_score)
+                if self._counts[previous_score] > 0:
+                    self._counts[previous_score] -= 1
+                    self._total -= 1
+                start = min(start, previous_score)
+
+            self._counts[score] += 1
+            self._total += 1
+            self._reindex(start)
+
+    def percentile(self, score: int, previous_score: Optional[int] = None, include_self: bool = False) -> int:
+        """Mid-rank percentile of score among all startups' latest scores
+
+        With include_self, the startup is counted as already holding score (replacing
+        previous_score), which is how a score is ranked before it has been recorded.
+        """
+        score = self._clamp(score)
+        below = self._below[score]
+        equal = self._counts[score]
+        total = self._total
+
+        if include_self:
+            if previous_score is not None:
+                previous_score = self._clamp(previous_score)
+                if previous_score < score:
+                    below -= 1
+                elif previous_score == score:
+                    equal -= 1
+                total -= 1
+            equal += 1
+            total += 1
+
+        if total <= 0:
+            return 50
+
+        rank = (below + 0.5 * equal) / total * 100
+        return max(0, min(100, int(round(rank))))
+
+    def _reindex(self, start: int) -> None:
+        """Recompute the cumulative counts from start upwards (at most 101 steps)"""
+        running = self._below[start]
+        for score in range(start, MAX_SCORE + 1):
+            self._below[score] = running
+            running += self._counts[score]
+        self._below[MAX_SCORE + 1] = running
+
+    @staticmethod
+    def _clamp(score: int) -> int:
+        return max(MIN_SCORE, min(MAX_SCORE, int(score)))
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Auxeira Synthetic Series Pool
+Pre-generated, count-independent synthetic series shapes per (user_type, trend, variance bucket),
+refilled in the background
+"""
+
+import logging
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from utils.ids import uuid7_batch_bytes
+from utils.synthetic_data_generator import SyntheticDataGenerator, SyntheticDataConfig, SyntheticSeries
+
+logger = logging.getLogger(__name__)
+
+# Points of a pooled shape over the whole series (progress 0 to 1). Requests of up to this many points
+# are resampled from a shape; longer series generate efficiently on their own and bypass the pool
+POOL_SHAPE_POINTS = 256
+
+# Shapes generated per refill of one key, in one vectorized pass
+POOL_BLOCK_SHAPES = 64
+
+# Requested variances are rounded to this step to share pooled shapes
+POOL_VARIANCE_STEP = 0.05
+
+# Keys held at once; the least recently used key is dropped beyond this
+POOL_MAX_KEYS = 64
+
+PoolKey = Tuple[str, str, float]
+
+
+def _compact(values: np.ndarray) -> np.ndarray:
+    """Integer columns as int32 when they fit (float columns keep their exact values)"""
+    if values.dtype == np.int64 and values.size and -2**31 <= values.min() and values.max() < 2**31:
+        return values.astype(np.int32)
+    return values
+
+
+class _PooledShape:
+    """Metric rows of one pooled series at POOL_SHAPE_POINTS points"""
+
+    __slots__ = ('algorithm', 'metrics')
+
+    def __init__(self, algorithm: str, metrics: Dict[str, np.ndarray]):
+        self.algorithm = algorithm
+        self.metrics = metrics
+
+
+class SeriesPool:
+    """Serves small unseeded series from pre-generated shapes
+
+    A shape is one series generated at POOL_SHAPE_POINTS points over the trend curve, with its
+    own base values. Taking one resamples it to the requested count (the rows nearest each point's
+    position on the curve), stamps timestamps ending now and fresh UUIDv7 ids, and uses it up.
+    Keys do not include count, so every request of a (user_type, trend, variance bucket) shares them.
+    A miss never waits for generation: the caller generates directly while a background thread
+    fills the key with SyntheticDataGenerator.generate_block.
+    """
+
+    def __init__(self,
+                 generator: SyntheticDataGenerator,
+                 shape_points: int = POOL_SHAPE_POINTS,
+                 block_shapes: int = POOL_BLOCK_SHAPES,
+                 variance_step: float = POOL_VARIANCE_STEP,
+                 max_keys: int = POOL_MAX_KEYS,
+                 background: bool = True):
+        self.generator = generator
+        self.shape_points = shape_points
+        self.block_shapes = block_shapes
+        self.variance_step = variance_step
+        self.max_keys = max_keys
+        self.background = background
+
+        self._pools: 'OrderedDict[PoolKey, Deque[_PooledShape]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[PoolKey, None] = {}
+        self._wakeup = threading.Condition(self._lock)
+        self._refiller: Optional[threading.Thread] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+
+    def key(self, config: SyntheticDataConfig) -> Optional[PoolKey]:
+        """Pool key of a config, or None if it must be generated directly
+
+        Seeded configs bypass the pool (their output must be reproducible), as do series longer
+        than a shape and unknown user types.
+        """
+        if config.seed is not None or not 0 < config.count <= self.shape_points:
+            return None
+        if config.user_type not in self.generator.series_builders:
+            return None
+        variance = round(round(config.variance / self.variance_step) * self.variance_step, 4)
+        return config.user_type, config.trend, variance
+
+    def generate_series(self, config: SyntheticDataConfig, ids: bool = True) -> SyntheticSeries:
+        """A series for config: from the pool when possible, else generated directly"""
+        series = self.take(config, ids)
+        return series if series is not None else self.generator.generate_series(config, ids=ids)
+
+    def take(self, config: SyntheticDataConfig, ids: bool = True) -> Optional[SyntheticSeries]:
+        """Take a pooled series for config, or None if the config is not poolable or its key is empty
+
+        An empty key is refilled in the background; the caller generates this request directly.
+        ids=False leaves the metric ids to the database (see SyntheticDataGenerator.generate_series).
+        """
+        key = self.key(config)
+        if key is None:
+            return None
+
+        with self._lock:
+            pool = self._pools.get(key)
+            shape = pool.popleft() if pool else None
+            if shape is not None:
+                self._pools.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            low = pool is None or len(pool) < self.block_shapes // 4
+
+        if low:
+            self._request_refill(key)
+
+        return self._stamp(config, shape, ids) if shape is not None else None
+
+    def _stamp(self, config: SyntheticDataConfig, shape: _PooledShape, ids: bool = True) -> SyntheticSeries:
+        """Resample a shape to config.count points, shift it to end now and give it fresh UUIDv7 ids
+
+        With count <= shape_points the nearest shape rows are distinct, so the served rows are
+        independent draws around the trend curve, as in a directly generated series.
+        """
+        count = config.count
+        rows = np.rint(self.generator.progress_array(count, 0, count) * (self.shape_points - 1)).astype(np.intp)
+        timestamps = self.generator.timestamp_array(count, config.time_range_days, end=datetime.now())
+        return SyntheticSeries(
+            dashboard_type=config.user_type,
+            synthetic_algorithm=shape.algorithm,
+            metric_ids=uuid7_batch_bytes(count) if ids else None,
+            timestamps=timestamps,
+            metrics={name: values[rows] for name, values in shape.metrics.items()}
+        )
+
+    def _refill(self, key: PoolKey) -> None:
+        """Generate one block of shapes for key and add it to the pool"""
+        user_type, trend, variance = key
+        config = SyntheticDataConfig(user_type, 'metrics', self.shape_points, 30, variance, trend)
+
+        algorithm, metrics = self.generator.generate_block(config, self.block_shapes)
+        metrics = {name: _compact(values) for name, values in metrics.items()}
+        block = [
+            _PooledShape(algorithm, {name: values[i] for name, values in metrics.items()})
+            for i in range(self.block_shapes)
+        ]
+
+        with self._lock:
+            self._pools.setdefault(key, deque()).extend(block)
+            self._pools.move_to_end(key)
+            while len(self._pools) > self.max_keys:
+                evicted, _ = self._pools.popitem(last=False)
+                logger.info(f"Series pool evicted {evicted}")
+            self.refills += 1
+
+    def _request_refill(self, key: PoolKey) -> None:
+        if not self.background:
+            self._refill(key)
+            return
+
+        with self._lock:
+            self._pending[key] = None
+            if self._refiller is None or not self._refiller.is_alive():
+                self._refiller = threading.Thread(target=self._refill_loop, name='series-pool-refill', daemon=True)
+                self._refiller.start()
+            self._wakeup.notify()
+
+    def _refill_loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._pending:
+                    self._wakeup.wait()
+                key = next(iter(self._pending))
+                del self._pending[key]
+            try:
+                self._refill(key)
+            except Exception as e:
+                logger.error(f"Series pool refill failed for {key}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'keys': len(self._pools),
+                'pooled_series': sum(len(pool) for pool in self._pools.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'refills': self.refills
+            }
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Auxeira SSE Scoring
+Weighted SSE score of a startup's assessment responses
+"""
+
+from typing import Dict, Tuple
+
+# SSE component weights (sum to 1)
+COMPONENT_WEIGHTS = {
+    'team': 0.25,
+    'market': 0.20,
+    'product': 0.20,
+    'business': 0.15,
+    'financial': 0.10,
+    'traction': 0.10
+}
+
+
+def score_responses(responses: Dict[str, Dict[str, float]]) -> Tuple[float, Dict[str, float]]:
+    """(unrounded total score, component scores rounded to 0.1) from per-component answers in [0, 1]
+
+    Each component scores the mean of its answers, scaled to 100 and weighted; components
+    missing from responses score nothing.
+    """
+    total_score = 0
+    component_scores = {}
+
+    for component, weight in COMPONENT_WEIGHTS.items():
+        if component in responses:
+            component_responses = responses[component]
+            component_score = sum(component_responses.values()) / len(component_responses) * 100 * weight
+            component_scores[component] = round(component_score, 1)
+            total_score += component_score
+
+    return total_score, component_scores
@@ -5,15 +5,34 @@ Generates realistic synthetic data for all 7 dashboard types with proper timesta
 """
 
 import json
-import random
-import uuid
+import multiprocessing
+import multiprocessing.connection
+import os
+import queue
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, TypeVar
+from dataclasses import dataclass, asdict, replace
 import numpy as np
 from faker import Faker
+import sys
 
-fake = Faker()
+# Add parent directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.exporters import export_batches
+from utils.ids import uuid7_batch_bytes, uuid_strings
+
+# Rows per chunk when streaming large series
+DEFAULT_CHUNK_SIZE = 50000
+
+# Rows per task when batch generation is spread over worker processes
+DEFAULT_BATCH_SLICE_SIZE = 250000
+
+# Task chunks sent to each worker per batch; a few per worker balance uneven chunks
+BATCH_CHUNKS_PER_WORKER = 4
+
+T = TypeVar('T')
 
 @dataclass
 class SyntheticDataConfig:
@@ -26,14 +45,272 @@ class SyntheticDataConfig:
     trend: str = "stable"  # "improving", "declining", "stable", "volatile"
     seed: Optional[int] = None
 
+@dataclass
+class SyntheticSeries:
+    """Columnar synthetic series for one dashboard type (one row per data point)"""
+    dashboard_type: str
+    synthetic_algorithm: str
+    metric_ids: Optional[np.ndarray]  # (n, 16) uint8 UUIDv7 bytes; None when the database assigns them
+    timestamps: np.ndarray  # datetime64[us]
+    metrics: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @staticmethod
+    def concat(parts: List['SyntheticSeries']) -> 'SyntheticSeries':
+        """Join consecutive slices of one series"""
+        if len(parts) == 1:
+            return parts[0]
+        return SyntheticSeries(
+            dashboard_type=parts[0].dashboard_type,
+            synthetic_algorithm=parts[0].synthetic_algorithm,
+            metric_ids=None if parts[0].metric_ids is None else np.concatenate([part.metric_ids for part in parts]),
+            timestamps=np.concatenate([part.timestamps for part in parts]),
+            metrics={name: np.concatenate([part.metrics[name] for part in parts]) for name in parts[0].metrics}
+        )
+
+    def metric_id_strings(self) -> List[str]:
+        """Format the UUID bytes as canonical UUID strings"""
+        if self.metric_ids is None:
+            return [None] * len(self)
+        return uuid_strings(self.metric_ids)
+
+    def metrics_json(self) -> List[str]:
+        """Serialize each row's metrics as a JSON object (same output as json.dumps of the dict)"""
+        names = list(self.metrics)
+        template = '{' + ', '.join(f'"{name}": %r' for name in names) + '}'
+        return [template % values for values in zip(*(self.metrics[name].tolist() for name in names))]
+
+    def timestamp_strings(self) -> List[str]:
+        return np.datetime_as_string(self.timestamps, unit='us').tolist()
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert the series into the record dicts consumed by the database and exporters"""
+        names = list(self.metrics)
+        columns = [self.metrics[name].tolist() for name in names]
+        timestamps = self.timestamp_strings()
+
+        return [
+            {
+                "metric_id": metric_id,
+                "dashboard_type": self.dashboard_type,
+                "metric_timestamp": timestamp,
+                "is_synthetic": True,
+                "synthetic_algorithm": self.synthetic_algorithm,
+                "metrics": dict(zip(names, values))
+            }
+            for metric_id, timestamp, values in zip(self.metric_id_strings(), timestamps, zip(*columns))
+        ]
+
+class _PrefetchError:
+    """Exception raised while producing chunks, re-raised in the consumer"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+_PREFETCH_DONE = object()
+
+def prefetch(chunks: Iterable[T], depth: int = 2) -> Iterator[T]:
+    """Produce chunks on a background thread, at most depth chunks ahead of the consumer
+
+    Overlaps generation with the consumer's I/O while keeping memory bounded.
+    """
+    if depth <= 0:
+        yield from chunks
+        return
+
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(_PREFETCH_DONE)
+        except BaseException as e:
+            put(_PrefetchError(e))
+
+    producer = threading.Thread(target=produce, name='synthetic-prefetch', daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.error
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
+
+def _batch_worker_main(connection) -> None:
+    """Worker loop of BatchWorkers: generate each (timestamp, tasks) request until None arrives"""
+    generator = SyntheticDataGenerator()
+    while True:
+        request = connection.recv()
+        if request is None:
+            return
+        timestamp, tasks = request
+        # Anchor timestamps to the parent generator so output does not depend on the worker
+        generator.timestamp = timestamp
+        try:
+            result = [
+                generator.generate_series(config, start, stop, seed_sequence, ids=ids)
+                for config, start, stop, seed_sequence, ids in tasks
+            ]
+        except Exception as e:
+            result = RuntimeError(f"Batch worker failed: {e}")
+        connection.send(result)
+
+class BatchWorkers:
+    """Persistent worker processes for generate_series_list
+
+    Workers are spawned once and talk to the parent over pipes only: ProcessPoolExecutor needs
+    semaphores in /dev/shm, which Lambda does not have. Keep one for the life of the process,
+    as spawning a worker costs far more than generating a shard.
+    """
+
+    def __init__(self, workers: int):
+        context = multiprocessing.get_context('spawn')
+        self.connections = []
+        self.processes = []
+        for _ in range(workers):
+            parent, child = context.Pipe()
+            # Spawned workers never inherit locks or threads of this process
+            process = context.Process(target=_batch_worker_main, args=(child,), name='synthetic-batch-worker', daemon=True)
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    @property
+    def size(self) -> int:
+        return len(self.processes)
+
+    @property
+    def closed(self) -> bool:
+        return not self.processes
+
+    def map(self, timestamp: datetime, chunks: List[List[tuple]]) -> List[List['SyntheticSeries']]:
+        """Generate each chunk of (config, start, stop, seed_sequence, ids) tasks on a free worker, in order"""
+        results: List[Optional[List[SyntheticSeries]]] = [None] * len(chunks)
+        pending = iter(range(len(chunks)))
+        busy: Dict[Any, int] = {}
+
+        try:
+            for connection in self.connections:
+                index = next(pending, None)
+                if index is None:
+                    break
+                connection.send((timestamp, chunks[index]))
+                busy[connection] = index
+
+            while busy:
+                for connection in multiprocessing.connection.wait(list(busy)):
+                    result = connection.recv()
+                    index = busy.pop(connection)
+                    if isinstance(result, Exception):
+                        # Let the other workers finish so their pipes stay in step
+                        for other in list(busy):
+                            other.recv()
+                        raise result
+                    results[index] = result
+                    following = next(pending, None)
+                    if following is not None:
+                        connection.send((timestamp, chunks[following]))
+                        busy[connection] = following
+        except (EOFError, OSError):
+            # A worker died; the others cannot be trusted to be in step either
+            self.close()
+            raise
+
+        return results
+
+    def close(self) -> None:
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except OSError:
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+        self.connections, self.processes = [], []
+
+    def __enter__(self) -> 'BatchWorkers':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+class _NoiseColumns:
+    """Hands out the columns of a per-row uniform noise matrix to a series builder
+
+    Every row owns the same number of draws, so any slice of a series is generated
+    from exactly the noise the full series would have used for those rows.
+    """
+
+    def __init__(self, noise: np.ndarray):
+        self.noise = noise
+        self.column = 0
+
+    def take(self) -> np.ndarray:
+        values = self.noise[:, self.column]
+        self.column += 1
+        return values
+
+    def uniform(self, low: float, high: float) -> np.ndarray:
+        return low + self.take() * (high - low)
+
+    def randint(self, low, high) -> np.ndarray:
+        """Integers in [low, high], inclusive like random.randint (high may be an array)"""
+        return (low + np.floor(self.take() * (np.asarray(high) - low + 1))).astype(np.int64)
+
+    def trend(self, base_value: float, progress: np.ndarray, trend: str, variance: float) -> np.ndarray:
+        return SyntheticDataGenerator.trend_array(base_value, progress, trend, variance, self.take(), self.take())
+
+class _SeriesBases:
+    """Base-value stream for a block of series built in one pass (see generate_block)
+
+    Each draw returns one value per series, repeated over that series' rows, so the
+    builders' per-series base values become per-row arrays.
+    """
+
+    def __init__(self, rng: np.random.Generator, series_count: int, rows: int):
+        self.rng = rng
+        self.series_count = series_count
+        self.rows = rows
+
+    def integers(self, low, high, endpoint: bool = False) -> np.ndarray:
+        return np.repeat(self.rng.integers(low, high, size=self.series_count, endpoint=endpoint), self.rows)
+
+    def uniform(self, low: float, high: float) -> np.ndarray:
+        return np.repeat(self.rng.uniform(low, high, size=self.series_count), self.rows)
+
 class SyntheticDataGenerator:
     """Main class for generating synthetic data across all dashboard types"""
     
     def __init__(self, seed: Optional[int] = None):
-        if seed:
-            random.seed(seed)
-            np.random.seed(seed)
-            fake.seed_instance(seed)
+        # Instance-local randomness only: each series draws from its own np.random.Generator
+        # spawned from this seed, so concurrent generators never share state
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._seed_lock = threading.Lock()
+        # Noise for the scalar apply_trend; generate_state leaves the spawn counter of series seeds untouched
+        self._scalar_rng = np.random.default_rng(self._seed_sequence.generate_state(4))
+        self.fake = Faker()
+        if seed is not None:
+            self.fake.seed_instance(seed)
         
         self.timestamp = datetime.now()
         
@@ -98,24 +375,53 @@ class SyntheticDataGenerator:
                 "impact_score": (70, 95)
             }
         }
+
+        # user_type -> (synthetic_algorithm, uniform draws per row, series builder)
+        self.series_builders = {
+            "startup_founder": ("trend_based_v1", 13, self._build_startup_founder),
+            "venture_capital": ("portfolio_simulation_v1", 12, self._build_venture_capital),
+            "angel_investor": ("angel_portfolio_v1", 10, self._build_angel_investor),
+            "corporate_partner": ("partnership_metrics_v1", 11, self._build_corporate_partner),
+            "government": ("ecosystem_metrics_v1", 11, self._build_government),
+            "esg_funder": ("esg_scoring_v1", 11, self._build_esg_funder),
+            "impact_investor": ("impact_measurement_v1", 11, self._build_impact_investor)
+        }
     
+    def timestamp_array(self, count: int, days: int, start: int = 0, stop: Optional[int] = None,
+                        end: Optional[datetime] = None) -> np.ndarray:
+        """Timestamps [start, stop) of a count-point series over the days before end (default: self.timestamp)
+
+        A timezone-aware end is converted to local time, like the naive datetime.now() of self.timestamp.
+        """
+        stop = count if stop is None else stop
+        end = end or self.timestamp
+        if end.tzinfo is not None:
+            end = end.astimezone().replace(tzinfo=None)
+        start_date = np.datetime64(end - timedelta(days=days), 'us')
+        # Create more realistic timestamp distribution (more recent data)
+        progress = self.progress_array(count, start, stop)
+        offsets = np.round(days * (progress ** 1.5) * 86400e6).astype('timedelta64[us]')
+        return start_date + offsets
+
     def generate_timestamp_series(self, count: int, days: int) -> List[datetime]:
         """Generate a series of timestamps over a given period"""
-        start_date = self.timestamp - timedelta(days=days)
-        timestamps = []
-        
-        for i in range(count):
-            # Create more realistic timestamp distribution (more recent data)
-            progress = i / (count - 1) if count > 1 else 0
-            # Bias towards more recent timestamps
-            time_offset = days * (progress ** 1.5)
-            timestamp = start_date + timedelta(days=time_offset)
-            timestamps.append(timestamp)
-        
-        return timestamps
-    
-    def apply_trend(self, base_value: float, progress: float, trend: str, variance: float) -> float:
-        """Apply trend and variance to a base value"""
+        return self.timestamp_array(count, days).tolist()
+
+    @staticmethod
+    def progress_array(count: int, start: int, stop: int) -> np.ndarray:
+        """Position of rows [start, stop) along a count-point series, from 0 to 1"""
+        if count <= 1:
+            return np.zeros(stop - start)
+        return np.arange(start, stop, dtype=np.float64) / (count - 1)
+
+    @staticmethod
+    def trend_array(base_value: float,
+                    progress: np.ndarray,
+                    trend: str,
+                    variance: float,
+                    trend_noise: np.ndarray,
+                    variance_noise: np.ndarray) -> np.ndarray:
+        """Apply trend and variance to a base value, given uniform [0, 1) noise per row"""
         # Apply trend
         if trend == "improving":
             trend_factor = 1 + (progress * 0.3)  # Up to 30% improvement
@@ -124,309 +430,476 @@ class SyntheticDataGenerator:
         elif trend == "volatile":
             trend_factor = 1 + np.sin(progress * 4 * np.pi) * 0.15  # Oscillating
         else:  # stable
-            trend_factor = 1 + (random.random() - 0.5) * 0.05  # Small random variation
-        
+            trend_factor = 1 + (trend_noise - 0.5) * 0.05  # Small random variation
+
         # Apply variance
-        variance_factor = 1 + (random.random() - 0.5) * variance * 2
-        
+        variance_factor = 1 + (variance_noise - 0.5) * variance * 2
+
         return base_value * trend_factor * variance_factor
-    
+
+    def apply_trend(self, base_value: float, progress: float, trend: str, variance: float) -> float:
+        """Apply trend and variance to a base value at one point of a series (scalar trend_array)"""
+        trend_noise, variance_noise = self._scalar_rng.random(2)
+        return float(self.trend_array(base_value, progress, trend, variance, trend_noise, variance_noise))
+
+    def series_seed(self, config: SyntheticDataConfig) -> np.random.SeedSequence:
+        """Seed for one series: config.seed if set, else the next child of the generator's seed"""
+        if config.seed is not None:
+            return np.random.SeedSequence(config.seed)
+        with self._seed_lock:
+            return self._seed_sequence.spawn(1)[0]
+
+    @staticmethod
+    def child_seed(seed_sequence: np.random.SeedSequence, index: int) -> np.random.SeedSequence:
+        """The index-th child of a seed, derived without spawning (same result on every call)"""
+        return np.random.SeedSequence(
+            seed_sequence.entropy,
+            spawn_key=tuple(seed_sequence.spawn_key) + (index,),
+            pool_size=seed_sequence.pool_size
+        )
+
+    @staticmethod
+    def _stream(seed_sequence: np.random.SeedSequence, index: int) -> np.random.Generator:
+        """Independent random stream of a series (0: base values, 1: noise)
+
+        Derived without spawning so every slice of a series sees the same streams.
+        """
+        return np.random.Generator(np.random.PCG64(SyntheticDataGenerator.child_seed(seed_sequence, index)))
+
+    def series_builder(self, config: SyntheticDataConfig, plan: Optional[Any] = None) -> Tuple[str, int, Any]:
+        """(synthetic_algorithm, uniform draws per row, builder) for a config, or for a compiled template plan"""
+        if plan is not None:
+            return plan.synthetic_algorithm, plan.noise_width, plan.build
+        if config.user_type not in self.series_builders:
+            raise ValueError(f"Unsupported user type: {config.user_type}")
+        return self.series_builders[config.user_type]
+
+    def generate_series(self,
+                        config: SyntheticDataConfig,
+                        start: int = 0,
+                        stop: Optional[int] = None,
+                        seed_sequence: Optional[np.random.SeedSequence] = None,
+                        plan: Optional[Any] = None,
+                        end: Optional[datetime] = None,
+                        ids: bool = True) -> SyntheticSeries:
+        """Generate rows [start, stop) of a dashboard type's series as NumPy arrays
+
+        Slices generated with the same seed_sequence (and end) concatenate to exactly the full series.
+        plan is a compiled template (utils.template_compiler.TemplatePlan) replacing the
+        built-in series of config.user_type. end anchors the time axis (default: self.timestamp),
+        so slices generated by different generator instances line up. Metric ids are UUIDv7s of
+        generation time, not of the rows' backdated timestamps, so inserted rows append to the
+        primary key index; they are not reproducible, and metric_timestamp orders the rows.
+        ids=False skips them, for loads where the database assigns them (the metrics are unchanged).
+        """
+        algorithm, noise_width, builder = self.series_builder(config, plan)
+        count = max(0, config.count)
+        stop = count if stop is None else min(stop, count)
+        start = min(max(0, start), stop)
+        rows = stop - start
+        seed_sequence = seed_sequence or self.series_seed(config)
+
+        # Row-major draws: skip the earlier rows' draws so slices line up with the full series
+        noise_rng = self._stream(seed_sequence, 1)
+        noise_rng.bit_generator.advance(start * noise_width)
+        noise = noise_rng.random((rows, noise_width))
+
+        timestamps = self.timestamp_array(count, config.time_range_days, start, stop, end)
+        metric_ids = uuid7_batch_bytes(rows) if ids else None
+
+        metrics = builder(
+            config,
+            self._stream(seed_sequence, 0),
+            self.progress_array(count, start, stop),
+            _NoiseColumns(noise)
+        )
+
+        return SyntheticSeries(
+            dashboard_type=config.user_type,
+            synthetic_algorithm=algorithm,
+            metric_ids=metric_ids,
+            timestamps=timestamps,
+            metrics=metrics
+        )
+
+    def _base_int(self, rng: np.random.Generator, user_type: str, metric: str) -> np.int64:
+        # Not converted to int: under _SeriesBases this is one base per row of a block
+        low, high = self.metric_ranges[user_type][metric]
+        return rng.integers(low, high, endpoint=True)
+
+    def _build_startup_founder(self, config: SyntheticDataConfig, rng: np.random.Generator,
+                               progress: np.ndarray, noise: _NoiseColumns) -> Dict[str, np.ndarray]:
+        """Startup founder dashboard series"""
+        # Base values for consistency
+        base_sse = self._base_int(rng, "startup_founder", "sse_score")
+        base_revenue = self._base_int(rng, "startup_founder", "revenue")
+        base_customers = self._base_int(rng, "startup_founder", "customers")
+
+        # Generate correlated metrics
+        sse_score = np.clip(noise.trend(base_sse, progress, config.trend, config.variance).astype(np.int64), 0, 100)
+        revenue = np.maximum(0, noise.trend(base_revenue, progress, config.trend, config.variance).astype(np.int64))
+        customers = np.maximum(0, noise.trend(base_customers, progress, config.trend, config.variance).astype(np.int64))
+
+        # Derived metrics
+        team_size = np.maximum(1, base_customers // 50 + noise.randint(1, 5))
+        burn_rate = np.maximum(1000, (revenue * 0.8 + noise.randint(5000, 20000)).astype(np.int64))
+        runway_months = np.maximum(1, ((revenue * 6) / burn_rate).astype(np.int64))
+
+        return {
+            "sse_score": sse_score,
+            "revenue": revenue,
+            "customers": customers,
+            "team_size": team_size,
+            "burn_rate": burn_rate,
+            "runway_months": runway_months,
+            "interviews_completed": noise.randint(0, 5),
+            "tokens_earned": noise.randint(50, 500),
+            "profile_completion": np.clip(sse_score + noise.randint(-10, 10), 60, 100),
+            "actions_this_week": noise.randint(0, 8),
+            "streak_days": noise.randint(0, 30)
+        }
+
+    def _build_venture_capital(self, config: SyntheticDataConfig, rng: np.random.Generator,
+                               progress: np.ndarray, noise: _NoiseColumns) -> Dict[str, np.ndarray]:
+        """Venture capital dashboard series"""
+        base_portfolio = self._base_int(rng, "venture_capital", "portfolio_size")
+        base_aum = self._base_int(rng, "venture_capital", "total_aum")
+
+        portfolio_size = np.maximum(1, noise.trend(base_portfolio, progress, "improving", 0.1).astype(np.int64))
+        total_aum = np.maximum(1000000, noise.trend(base_aum, progress, config.trend, config.variance).astype(np.int64))
+
+        return {
+            "portfolio_size": portfolio_size,
+            "total_aum": total_aum,
+            "active_deals": noise.randint(5, 20),
+            "deal_flow_monthly": noise.randint(20, 100),
+            "portfolio_valuation": (total_aum * noise.uniform(1.2, 3.0)).astype(np.int64),
+            "exits_ytd": noise.randint(0, 5),
+            "avg_sse_score": noise.randint(65, 85),
+            "high_performers": noise.randint(5, 15),
+            "at_risk_companies": noise.randint(1, 8),
+            "new_investments": noise.randint(2, 10)
+        }
+
+    def _build_angel_investor(self, config: SyntheticDataConfig, rng: np.random.Generator,
+                              progress: np.ndarray, noise: _NoiseColumns) -> Dict[str, np.ndarray]:
+        """Angel investor dashboard series"""
+        base_investments = self._base_int(rng, "angel_investor", "investments_count")
+        base_total_invested = self._base_int(rng, "angel_investor", "total_invested")
+
+        investments_count = np.maximum(1, noise.trend(base_investments, progress, "improving", 0.15).astype(np.int64))
+        total_invested = np.maximum(
+            10000, noise.trend(base_total_invested, progress, config.trend, config.variance).astype(np.int64)
+        )
+
+        return {
+            "investments_count": investments_count,
+            "total_invested": total_invested,
+            "active_investments": np.maximum(1, investments_count - noise.randint(0, 5)),
+            "exits": noise.randint(0, np.maximum(1, investments_count // 5)),
+            "portfolio_irr": np.round(noise.uniform(-0.1, 0.6), 3),
+            "check_size_avg": (total_invested / investments_count).astype(np.int64),
+            "due_diligence_active": noise.randint(1, 5),
+            "syndicate_deals": noise.randint(0, 8),
+            "follow_on_opportunities": noise.randint(2, 10)
+        }
+
+    def _build_corporate_partner(self, config: SyntheticDataConfig, rng: np.random.Generator,
+                                 progress: np.ndarray, noise: _NoiseColumns) -> Dict[str, np.ndarray]:
+        """Corporate partner dashboard series"""
+        base_partnerships = self._base_int(rng, "corporate_partner", "active_partnerships")
+        base_value = self._base_int(rng, "corporate_partner", "partnership_value")
+
+        active_partnerships = np.maximum(1, noise.trend(base_partnerships, progress, config.trend, 0.2).astype(np.int64))
+        partnership_value = np.maximum(
+            50000, noise.trend(base_value, progress, config.trend, config.variance).astype(np.int64)
+        )
+
+        return {
+            "active_partnerships": active_partnerships,
+            "partnership_value": partnership_value,
+            "startups_engaged": noise.randint(20, 200),
+            "benefits_redeemed": noise.randint(100, 1000),
+            "roi_partnerships": np.round(noise.uniform(1.5, 4.0), 2),
+            "pilot_programs": noise.randint(3, 15),
+            "innovation_projects": noise.randint(5, 25),
+            "cost_savings": noise.randint(100000, 2000000),
+            "new_applications": noise.randint(10, 50)
+        }
+
+    def _build_government(self, config: SyntheticDataConfig, rng: np.random.Generator,
+                          progress: np.ndarray, noise: _NoiseColumns) -> Dict[str, np.ndarray]:
+        """Government dashboard series"""
+        base_startups = self._base_int(rng, "government", "startups_monitored")
+        base_impact = self._base_int(rng, "government", "economic_impact")
+
+        startups_monitored = np.maximum(50, noise.trend(base_startups, progress, "improving", 0.1).astype(np.int64))
+        economic_impact = np.maximum(
+            500000, noise.trend(base_impact, progress, config.trend, config.variance).astype(np.int64)
+        )
+
+        return {
+            "startups_monitored": startups_monitored,
+            "grants_distributed": noise.randint(20, 200),
+            "jobs_created": noise.randint(1000, 20000),
+            "economic_impact": economic_impact,
+            "compliance_rate": np.round(noise.uniform(0.8, 0.95), 3),
+            "innovation_index": noise.randint(70, 90),
+            "regional_growth": np.round(noise.uniform(0.02, 0.08), 3),
+            "startup_survival_rate": np.round(noise.uniform(0.6, 0.8), 3),
+            "policy_effectiveness": np.round(noise.uniform(0.7, 0.9), 3)
+        }
+
+    def _build_esg_funder(self, config: SyntheticDataConfig, rng: np.random.Generator,
+                          progress: np.ndarray, noise: _NoiseColumns) -> Dict[str, np.ndarray]:
+        """ESG funder dashboard series"""
+        base_esg_score = self._base_int(rng, "esg_funder", "esg_score_avg")
+        base_investments = self._base_int(rng, "esg_funder", "sustainable_investments")
+
+        esg_score_avg = np.clip(noise.trend(base_esg_score, progress, "improving", 0.1).astype(np.int64), 50, 100)
+        sustainable_investments = np.maximum(
+            1, noise.trend(base_investments, progress, config.trend, 0.15).astype(np.int64)
+        )
+
+        return {
+            "esg_score_avg": esg_score_avg,
+            "carbon_reduction": np.round(noise.uniform(0.1, 0.4), 3),
+            "social_impact_score": noise.randint(60, 90),
+            "governance_score": noise.randint(70, 95),
+            "sustainable_investments": sustainable_investments,
+            "impact_measurement": np.round(noise.uniform(0.7, 0.95), 3),
+            "environmental_score": noise.randint(65, 90),
+            "certification_rate": np.round(noise.uniform(0.6, 0.85), 3),
+            "sustainability_trend": np.round(noise.uniform(0.05, 0.15), 3)
+        }
+
+    def _build_impact_investor(self, config: SyntheticDataConfig, rng: np.random.Generator,
+                               progress: np.ndarray, noise: _NoiseColumns) -> Dict[str, np.ndarray]:
+        """Impact investor dashboard series"""
+        low, high = self.metric_ranges["impact_investor"]["social_roi"]
+        base_social_roi = rng.uniform(low, high)
+        base_lives_impacted = self._base_int(rng, "impact_investor", "lives_impacted")
+
+        social_roi = np.maximum(1.0, noise.trend(base_social_roi, progress, config.trend, 0.2))
+        lives_impacted = np.maximum(100, noise.trend(base_lives_impacted, progress, "improving", 0.3).astype(np.int64))
+
+        return {
+            "social_roi": np.round(social_roi, 2),
+            "lives_impacted": lives_impacted,
+            "sdg_alignment": np.round(noise.uniform(0.75, 0.95), 3),
+            "impact_investments": noise.randint(15, 100),
+            "beneficiaries": noise.randint(1000, 100000),
+            "impact_score": noise.randint(75, 95),
+            "community_development": np.round(noise.uniform(0.6, 0.9), 3),
+            "social_progress": np.round(noise.uniform(0.05, 0.2), 3),
+            "outcome_achievement": np.round(noise.uniform(0.7, 0.9), 3)
+        }
+
+    def generate_block(self,
+                       config: SyntheticDataConfig,
+                       series_count: int,
+                       seed_sequence: Optional[np.random.SeedSequence] = None) -> Tuple[str, Dict[str, np.ndarray]]:
+        """Generate series_count independent series of config in one vectorized pass
+
+        Returns (synthetic_algorithm, metrics as (series_count, count) arrays). Timestamps and ids
+        are left to the caller (see utils.series_pool).
+        """
+        algorithm, noise_width, builder = self.series_builder(config)
+        count = max(0, config.count)
+        rows = series_count * count
+        seed_sequence = seed_sequence or self.series_seed(config)
+
+        noise = self._stream(seed_sequence, 1).random((rows, noise_width))
+
+        metrics = builder(
+            config,
+            _SeriesBases(self._stream(seed_sequence, 0), series_count, count),
+            np.tile(self.progress_array(count, 0, count), series_count),
+            _NoiseColumns(noise)
+        )
+
+        return algorithm, {name: np.asarray(values).reshape(series_count, count) for name, values in metrics.items()}
+
+    def generate_data(self, config: SyntheticDataConfig, plan: Optional[Any] = None) -> List[Dict[str, Any]]:
+        """Main method to generate synthetic data based on user type"""
+        return self.generate_series(config, plan=plan).to_records()
+
+    def _generate_type_data(self, user_type: str, config: SyntheticDataConfig) -> List[Dict[str, Any]]:
+        return self.generate_series(replace(config, user_type=user_type)).to_records()
+
     def generate_startup_founder_data(self, config: SyntheticDataConfig) -> List[Dict[str, Any]]:
         """Generate synthetic data for startup founder dashboard"""
-        data = []
-        timestamps = self.generate_timestamp_series(config.count, config.time_range_days)
-        ranges = self.metric_ranges["startup_founder"]
-        
-        # Base values for consistency
-        base_sse = random.randint(ranges["sse_score"][0], ranges["sse_score"][1])
-        base_revenue = random.randint(ranges["revenue"][0], ranges["revenue"][1])
-        base_customers = random.randint(ranges["customers"][0], ranges["customers"][1])
-        
-        for i, timestamp in enumerate(timestamps):
-            progress = i / (len(timestamps) - 1) if len(timestamps) > 1 else 0
-            
-            # Generate correlated metrics
-            sse_score = max(0, min(100, int(self.apply_trend(base_sse, progress, config.trend, config.variance))))
-            revenue = max(0, int(self.apply_trend(base_revenue, progress, config.trend, config.variance)))
-            customers = max(0, int(self.apply_trend(base_customers, progress, config.trend, config.variance)))
-            
-            # Derived metrics
-            team_size = max(1, int(base_customers / 50) + random.randint(1, 5))
-            burn_rate = max(1000, int(revenue * 0.8 + random.randint(5000, 20000)))
-            runway_months = max(1, int((revenue * 6) / burn_rate)) if burn_rate > 0 else 12
-            
-            data.append({
-                "metric_id": str(uuid.uuid4()),
-                "dashboard_type": "startup_founder",
-                "metric_timestamp": timestamp.isoformat(),
-                "is_synthetic": True,
-                "synthetic_algorithm": "trend_based_v1",
-                "metrics": {
-                    "sse_score": sse_score,
-                    "revenue": revenue,
-                    "customers": customers,
-                    "team_size": team_size,
-                    "burn_rate": burn_rate,
-                    "runway_months": runway_months,
-                    "interviews_completed": random.randint(0, 5),
-                    "tokens_earned": random.randint(50, 500),
-                    "profile_completion": min(100, max(60, sse_score + random.randint(-10, 10))),
-                    "actions_this_week": random.randint(0, 8),
-                    "streak_days": random.randint(0, 30)
-                }
-            })
-        
-        return data
-    
+        return self._generate_type_data("startup_founder", config)
+
     def generate_venture_capital_data(self, config: SyntheticDataConfig) -> List[Dict[str, Any]]:
         """Generate synthetic data for venture capital dashboard"""
-        data = []
-        timestamps = self.generate_timestamp_series(config.count, config.time_range_days)
-        ranges = self.metric_ranges["venture_capital"]
-        
-        base_portfolio = random.randint(ranges["portfolio_size"][0], ranges["portfolio_size"][1])
-        base_aum = random.randint(ranges["total_aum"][0], ranges["total_aum"][1])
-        
-        for i, timestamp in enumerate(timestamps):
-            progress = i / (len(timestamps) - 1) if len(timestamps) > 1 else 0
-            
-            portfolio_size = max(1, int(self.apply_trend(base_portfolio, progress, "improving", 0.1)))
-            total_aum = max(1000000, int(self.apply_trend(base_aum, progress, config.trend, config.variance)))
-            
-            data.append({
-                "metric_id": str(uuid.uuid4()),
-                "dashboard_type": "venture_capital",
-                "metric_timestamp": timestamp.isoformat(),
-                "is_synthetic": True,
-                "synthetic_algorithm": "portfolio_simulation_v1",
-                "metrics": {
-                    "portfolio_size": portfolio_size,
-                    "total_aum": total_aum,
-                    "active_deals": random.randint(5, 20),
-                    "deal_flow_monthly": random.randint(20, 100),
-                    "portfolio_valuation": int(total_aum * random.uniform(1.2, 3.0)),
-                    "exits_ytd": random.randint(0, 5),
-                    "avg_sse_score": random.randint(65, 85),
-                    "high_performers": random.randint(5, 15),
-                    "at_risk_companies": random.randint(1, 8),
-                    "new_investments": random.randint(2, 10)
-                }
-            })
-        
-        return data
-    
+        return self._generate_type_data("venture_capital", config)
+
     def generate_angel_investor_data(self, config: SyntheticDataConfig) -> List[Dict[str, Any]]:
         """Generate synthetic data for angel investor dashboard"""
-        data = []
-        timestamps = self.generate_timestamp_series(config.count, config.time_range_days)
-        ranges = self.metric_ranges["angel_investor"]
-        
-        base_investments = random.randint(ranges["investments_count"][0], ranges["investments_count"][1])
-        base_total_invested = random.randint(ranges["total_invested"][0], ranges["total_invested"][1])
-        
-        for i, timestamp in enumerate(timestamps):
-            progress = i / (len(timestamps) - 1) if len(timestamps) > 1 else 0
-            
-            investments_count = max(1, int(self.apply_trend(base_investments, progress, "improving", 0.15)))
-            total_invested = max(10000, int(self.apply_trend(base_total_invested, progress, config.trend, config.variance)))
-            
-            data.append({
-                "metric_id": str(uuid.uuid4()),
-                "dashboard_type": "angel_investor",
-                "metric_timestamp": timestamp.isoformat(),
-                "is_synthetic": True,
-                "synthetic_algorithm": "angel_portfolio_v1",
-                "metrics": {
-                    "investments_count": investments_count,
-                    "total_invested": total_invested,
-                    "active_investments": max(1, investments_count - random.randint(0, 5)),
-                    "exits": random.randint(0, max(1, investments_count // 5)),
-                    "portfolio_irr": round(random.uniform(-0.1, 0.6), 3),
-                    "check_size_avg": int(total_invested / investments_count) if investments_count > 0 else 25000,
-                    "due_diligence_active": random.randint(1, 5),
-                    "syndicate_deals": random.randint(0, 8),
-                    "follow_on_opportunities": random.randint(2, 10)
-                }
-            })
-        
-        return data
-    
+        return self._generate_type_data("angel_investor", config)
+
     def generate_corporate_partner_data(self, config: SyntheticDataConfig) -> List[Dict[str, Any]]:
         """Generate synthetic data for corporate partner dashboard"""
-        data = []
-        timestamps = self.generate_timestamp_series(config.count, config.time_range_days)
-        ranges = self.metric_ranges["corporate_partner"]
-        
-        base_partnerships = random.randint(ranges["active_partnerships"][0], ranges["active_partnerships"][1])
-        base_value = random.randint(ranges["partnership_value"][0], ranges["partnership_value"][1])
-        
-        for i, timestamp in enumerate(timestamps):
-            progress = i / (len(timestamps) - 1) if len(timestamps) > 1 else 0
-            
-            active_partnerships = max(1, int(self.apply_trend(base_partnerships, progress, config.trend, 0.2)))
-            partnership_value = max(50000, int(self.apply_trend(base_value, progress, config.trend, config.variance)))
-            
-            data.append({
-                "metric_id": str(uuid.uuid4()),
-                "dashboard_type": "corporate_partner",
-                "metric_timestamp": timestamp.isoformat(),
-                "is_synthetic": True,
-                "synthetic_algorithm": "partnership_metrics_v1",
-                "metrics": {
-                    "active_partnerships": active_partnerships,
-                    "partnership_value": partnership_value,
-                    "startups_engaged": random.randint(20, 200),
-                    "benefits_redeemed": random.randint(100, 1000),
-                    "roi_partnerships": round(random.uniform(1.5, 4.0), 2),
-                    "pilot_programs": random.randint(3, 15),
-                    "innovation_projects": random.randint(5, 25),
-                    "cost_savings": random.randint(100000, 2000000),
-                    "new_applications": random.randint(10, 50)
-                }
-            })
-        
-        return data
-    
+        return self._generate_type_data("corporate_partner", config)
+
     def generate_government_data(self, config: SyntheticDataConfig) -> List[Dict[str, Any]]:
         """Generate synthetic data for government dashboard"""
-        data = []
-        timestamps = self.generate_timestamp_series(config.count, config.time_range_days)
-        ranges = self.metric_ranges["government"]
-        
-        base_startups = random.randint(ranges["startups_monitored"][0], ranges["startups_monitored"][1])
-        base_impact = random.randint(ranges["economic_impact"][0], ranges["economic_impact"][1])
-        
-        for i, timestamp in enumerate(timestamps):
-            progress = i / (len(timestamps) - 1) if len(timestamps) > 1 else 0
-            
-            startups_monitored = max(50, int(self.apply_trend(base_startups, progress, "improving", 0.1)))
-            economic_impact = max(500000, int(self.apply_trend(base_impact, progress, config.trend, config.variance)))
-            
-            data.append({
-                "metric_id": str(uuid.uuid4()),
-                "dashboard_type": "government",
-                "metric_timestamp": timestamp.isoformat(),
-                "is_synthetic": True,
-                "synthetic_algorithm": "ecosystem_metrics_v1",
-                "metrics": {
-                    "startups_monitored": startups_monitored,
-                    "grants_distributed": random.randint(20, 200),
-                    "jobs_created": random.randint(1000, 20000),
-                    "economic_impact": economic_impact,
-                    "compliance_rate": round(random.uniform(0.8, 0.95), 3),
-                    "innovation_index": random.randint(70, 90),
-                    "regional_growth": round(random.uniform(0.02, 0.08), 3),
-                    "startup_survival_rate": round(random.uniform(0.6, 0.8), 3),
-                    "policy_effectiveness": round(random.uniform(0.7, 0.9), 3)
-                }
-            })
-        
-        return data
-    
+        return self._generate_type_data("government", config)
+
     def generate_esg_funder_data(self, config: SyntheticDataConfig) -> List[Dict[str, Any]]:
         """Generate synthetic data for ESG funder dashboard"""
-        data = []
-        timestamps = self.generate_timestamp_series(config.count, config.time_range_days)
-        ranges = self.metric_ranges["esg_funder"]
-        
-        base_esg_score = random.randint(ranges["esg_score_avg"][0], ranges["esg_score_avg"][1])
-        base_investments = random.randint(ranges["sustainable_investments"][0], ranges["sustainable_investments"][1])
-        
-        for i, timestamp in enumerate(timestamps):
-            progress = i / (len(timestamps) - 1) if len(timestamps) > 1 else 0
-            
-            esg_score_avg = max(50, min(100, int(self.apply_trend(base_esg_score, progress, "improving", 0.1))))
-            sustainable_investments = max(1, int(self.apply_trend(base_investments, progress, config.trend, 0.15)))
-            
-            data.append({
-                "metric_id": str(uuid.uuid4()),
-                "dashboard_type": "esg_funder",
-                "metric_timestamp": timestamp.isoformat(),
-                "is_synthetic": True,
-                "synthetic_algorithm": "esg_scoring_v1",
-                "metrics": {
-                    "esg_score_avg": esg_score_avg,
-                    "carbon_reduction": round(random.uniform(0.1, 0.4), 3),
-                    "social_impact_score": random.randint(60, 90),
-                    "governance_score": random.randint(70, 95),
-                    "sustainable_investments": sustainable_investments,
-                    "impact_measurement": round(random.uniform(0.7, 0.95), 3),
-                    "environmental_score": random.randint(65, 90),
-                    "certification_rate": round(random.uniform(0.6, 0.85), 3),
-                    "sustainability_trend": round(random.uniform(0.05, 0.15), 3)
-                }
-            })
-        
-        return data
-    
+        return self._generate_type_data("esg_funder", config)
+
     def generate_impact_investor_data(self, config: SyntheticDataConfig) -> List[Dict[str, Any]]:
         """Generate synthetic data for impact investor dashboard"""
-        data = []
-        timestamps = self.generate_timestamp_series(config.count, config.time_range_days)
-        ranges = self.metric_ranges["impact_investor"]
-        
-        base_social_roi = random.uniform(ranges["social_roi"][0], ranges["social_roi"][1])
-        base_lives_impacted = random.randint(ranges["lives_impacted"][0], ranges["lives_impacted"][1])
-        
-        for i, timestamp in enumerate(timestamps):
-            progress = i / (len(timestamps) - 1) if len(timestamps) > 1 else 0
-            
-            social_roi = max(1.0, self.apply_trend(base_social_roi, progress, config.trend, 0.2))
-            lives_impacted = max(100, int(self.apply_trend(base_lives_impacted, progress, "improving", 0.3)))
-            
-            data.append({
-                "metric_id": str(uuid.uuid4()),
-                "dashboard_type": "impact_investor",
-                "metric_timestamp": timestamp.isoformat(),
-                "is_synthetic": True,
-                "synthetic_algorithm": "impact_measurement_v1",
-                "metrics": {
-                    "social_roi": round(social_roi, 2),
-                    "lives_impacted": lives_impacted,
-                    "sdg_alignment": round(random.uniform(0.75, 0.95), 3),
-                    "impact_investments": random.randint(15, 100),
-                    "beneficiaries": random.randint(1000, 100000),
-                    "impact_score": random.randint(75, 95),
-                    "community_development": round(random.uniform(0.6, 0.9), 3),
-                    "social_progress": round(random.uniform(0.05, 0.2), 3),
-                    "outcome_achievement": round(random.uniform(0.7, 0.9), 3)
-                }
-            })
-        
-        return data
+        return self._generate_type_data("impact_investor", config)
+
+    def _series_chunks(self,
+                       config: SyntheticDataConfig,
+                       chunk_size: int,
+                       seed_sequence: Optional[np.random.SeedSequence],
+                       plan: Optional[Any] = None,
+                       start: int = 0,
+                       end: Optional[datetime] = None,
+                       ids: bool = True) -> Iterator[SyntheticSeries]:
+        self.series_builder(config, plan)
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        # Resolve the seed once so the chunks are slices of one series
+        seed_sequence = seed_sequence or self.series_seed(config)
+        count = max(0, config.count)
+        return (
+            self.generate_series(config, chunk_start, chunk_start + chunk_size, seed_sequence, plan, end, ids)
+            for chunk_start in range(max(0, start), count, chunk_size)
+        )
+
+    def iter_series(self,
+                    config: SyntheticDataConfig,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    prefetch_depth: int = 2,
+                    seed_sequence: Optional[np.random.SeedSequence] = None,
+                    plan: Optional[Any] = None,
+                    start: int = 0,
+                    end: Optional[datetime] = None,
+                    ids: bool = True) -> Iterator[SyntheticSeries]:
+        """Stream a series in columnar chunks of chunk_size rows, generated ahead on a background thread
+
+        start resumes a partially loaded series: chunks begin at that row. end anchors the time
+        axis and ids=False skips the metric ids (see generate_series).
+        """
+        return prefetch(self._series_chunks(config, chunk_size, seed_sequence, plan, start, end, ids), prefetch_depth)
+
+    def iter_data(self,
+                  config: SyntheticDataConfig,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  prefetch_depth: int = 2,
+                  seed_sequence: Optional[np.random.SeedSequence] = None,
+                  plan: Optional[Any] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream generate_data output in chunks of at most chunk_size records, in bounded memory"""
+        chunks = (series.to_records() for series in self._series_chunks(config, chunk_size, seed_sequence, plan))
+        return prefetch(chunks, prefetch_depth)
     
-    def generate_data(self, config: SyntheticDataConfig) -> List[Dict[str, Any]]:
-        """Main method to generate synthetic data based on user type"""
-        generators = {
-            "startup_founder": self.generate_startup_founder_data,
-            "venture_capital": self.generate_venture_capital_data,
-            "angel_investor": self.generate_angel_investor_data,
-            "corporate_partner": self.generate_corporate_partner_data,
-            "government": self.generate_government_data,
-            "esg_funder": self.generate_esg_funder_data,
-            "impact_investor": self.generate_impact_investor_data
+    def generate_series_list(self,
+                             configs: List[SyntheticDataConfig],
+                             workers: int = 1,
+                             seed: Optional[int] = None,
+                             slice_size: int = DEFAULT_BATCH_SLICE_SIZE,
+                             ids: bool = True,
+                             batch_workers: Optional[BatchWorkers] = None) -> List[SyntheticSeries]:
+        """Generate one series per configuration, in order, optionally across worker processes
+
+        Config i is seeded by config.seed if set, else by the i-th child of a batch seed
+        (seed if given, else spawned from the generator's seed). Large configs are split
+        into slices of slice_size rows, so the output (apart from the metric ids, which are
+        drawn at generation time) is identical for any worker count.
+        batch_workers reuses persistent workers; otherwise workers > 1 starts them for this
+        call only. ids=False skips the metric ids (see generate_series).
+        """
+        if seed is not None:
+            batch_seed = np.random.SeedSequence(seed)
+        else:
+            with self._seed_lock:
+                batch_seed = self._seed_sequence.spawn(1)[0]
+
+        tasks = []
+        for index, config in enumerate(configs):
+            if config.user_type not in self.series_builders:
+                raise ValueError(f"Unsupported user type: {config.user_type}")
+            seed_sequence = (
+                np.random.SeedSequence(config.seed) if config.seed is not None
+                else self.child_seed(batch_seed, index)
+            )
+            count = max(0, config.count)
+            for start in range(0, max(count, 1), slice_size):
+                tasks.append((index, (config, start, min(start + slice_size, count), seed_sequence, ids)))
+
+        if batch_workers is not None and len(tasks) > 1:
+            slices = self._map_batch(batch_workers, [task for _, task in tasks])
+        elif workers > 1 and len(tasks) > 1:
+            with BatchWorkers(min(workers, len(tasks))) as started:
+                slices = self._map_batch(started, [task for _, task in tasks])
+        else:
+            slices = [
+                self.generate_series(config, start, stop, seed_sequence, ids=ids)
+                for _, (config, start, stop, seed_sequence, ids) in tasks
+            ]
+
+        parts: Dict[int, List[SyntheticSeries]] = {}
+        for (index, _), series in zip(tasks, slices):
+            parts.setdefault(index, []).append(series)
+
+        return [SyntheticSeries.concat(parts[index]) for index in range(len(configs))]
+
+    def _map_batch(self, batch_workers: BatchWorkers, tasks: List[tuple]) -> List[SyntheticSeries]:
+        """Slices of tasks generated on batch_workers, sent in contiguous chunks of several tasks"""
+        chunk_size = -(-len(tasks) // (batch_workers.size * BATCH_CHUNKS_PER_WORKER))
+        chunks = [tasks[start:start + chunk_size] for start in range(0, len(tasks), chunk_size)]
+        return [series for chunk in batch_workers.map(self.timestamp, chunks) for series in chunk]
+
+    def generate_batch_series(self,
+                              configs: List[SyntheticDataConfig],
+                              workers: int = 1,
+                              seed: Optional[int] = None,
+                              slice_size: int = DEFAULT_BATCH_SLICE_SIZE) -> Dict[str, SyntheticSeries]:
+        """Generate series for multiple configurations keyed by '<user_type>_<data_type>'
+
+        See generate_series_list for seeding and workers.
+        """
+        series_list = self.generate_series_list(configs, workers=workers, seed=seed, slice_size=slice_size)
+        return {
+            f"{config.user_type}_{config.data_type}": series
+            for config, series in zip(configs, series_list)
+        }
+
+    def generate_batch_data(self,
+                            configs: List[SyntheticDataConfig],
+                            workers: int = 1,
+                            seed: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Generate data for multiple configurations (see generate_batch_series)"""
+        return {
+            key: series.to_records()
+            for key, series in self.generate_batch_series(configs, workers=workers, seed=seed).items()
         }
-        
-        if config.user_type not in generators:
-            raise ValueError(f"Unsupported user type: {config.user_type}")
-        
-        return generators[config.user_type](config)
-    
-    def generate_batch_data(self, configs: List[SyntheticDataConfig]) -> Dict[str, List[Dict[str, Any]]]:
-        """Generate data for multiple configurations"""
-        results = {}
-        
-        for config in configs:
-            key = f"{config.user_type}_{config.data_type}"
-            results[key] = self.generate_data(config)
-        
-        return results
     
     def export_to_json(self, data: Dict[str, List[Dict[str, Any]]], filename: str):
         """Export generated data to JSON file"""
         with open(filename, 'w') as f:
             json.dump(data, f, indent=2, default=str)
     
+    def export_series(self, chunks: Iterable[SyntheticSeries], filename: str,
+                      fmt: Optional[str] = None, compression: Optional[str] = None) -> int:
+        """Stream series chunks (see iter_series) to a COPY/CSV/NDJSON/Parquet/Arrow file
+
+        Format and gzip/zstd compression default to the file extension, e.g. metrics.csv.gz.
+        """
+        return export_batches(chunks, filename, fmt=fmt, compression=compression)
+
+    def export_to_ndjson(self, chunks: Iterable[SyntheticSeries], filename: str) -> int:
+        """Stream series chunks to a newline-delimited JSON file, one dashboard_metrics row per line"""
+        return self.export_series(chunks, filename, fmt='ndjson')
+    
     def export_to_sql_inserts(self, data: List[Dict[str, Any]], table_name: str = "dashboard_metrics") -> str:
         """Generate SQL INSERT statements for the data"""
         if not data:
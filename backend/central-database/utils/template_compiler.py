@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Auxeira Synthetic Template Compiler
+Compiles synthetic_data_templates generation rules into cached, vectorized generation plans
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+TRENDS = ('improving', 'declining', 'stable', 'volatile')
+
+# data_schema types and whether they generate integers
+SCHEMA_TYPES = {
+    'integer': True,
+    'int': True,
+    'decimal': False,
+    'number': False,
+    'float': False
+}
+
+RULE_KEYS = {'min', 'max', 'value', 'mode', 'trend', 'variance', 'growth_rate', 'bounds', 'round'}
+
+
+class MetricRule:
+    """One metric of a compiled template
+
+    mode 'trend' (default) draws a base value in [min, max] once per series and applies the
+    trend, variance and monthly growth_rate to it, so the series may leave [min, max]; mode
+    'uniform' draws every row independently from [min, max]. Values are clamped only to
+    bounds, when given; round sets the decimals of decimal metrics.
+    """
+
+    def __init__(self, name: str, is_integer: bool, low: float, high: float, mode: str = 'trend',
+                 trend: Optional[str] = None, variance: Optional[float] = None, growth_rate: float = 0.0,
+                 bounds: Optional[Tuple[float, float]] = None, decimals: int = 2):
+        self.name = name
+        self.is_integer = is_integer
+        self.low = low
+        self.high = high
+        self.mode = mode
+        self.trend = trend
+        self.variance = variance
+        self.growth_rate = growth_rate
+        self.bounds = bounds
+        self.decimals = decimals
+
+    @property
+    def noise_width(self) -> int:
+        return 1 if self.mode == 'uniform' else 2
+
+    def generate(self, config, rng: np.random.Generator, progress: np.ndarray, noise) -> np.ndarray:
+        if self.mode == 'uniform':
+            if self.is_integer:
+                values = noise.randint(int(self.low), int(self.high))
+            else:
+                values = noise.uniform(self.low, self.high)
+        else:
+            if self.is_integer:
+                base = float(rng.integers(int(self.low), int(self.high), endpoint=True))
+            else:
+                base = float(rng.uniform(self.low, self.high))
+            variance = config.variance if self.variance is None else self.variance
+            values = noise.trend(base, progress, self.trend or config.trend, variance)
+            if self.growth_rate:
+                months = progress * config.time_range_days / 30
+                values = values * (1 + self.growth_rate) ** months
+
+        if self.bounds is not None:
+            values = np.clip(values, *self.bounds)
+
+        if self.is_integer:
+            return np.asarray(values).astype(np.int64)
+        return np.round(values, self.decimals)
+
+
+class TemplatePlan:
+    """Vectorized generation plan of a template, usable wherever SyntheticDataGenerator takes a plan"""
+
+    def __init__(self, template_id: str, user_type: str, rules: List[MetricRule],
+                 default_parameters: Optional[Dict[str, Any]] = None):
+        self.template_id = template_id
+        self.user_type = user_type
+        self.rules = rules
+        self.default_parameters = default_parameters or {}
+        self.synthetic_algorithm = f"template:{template_id}"
+        self.noise_width = sum(rule.noise_width for rule in rules)
+
+    def build(self, config, rng: np.random.Generator, progress: np.ndarray, noise) -> Dict[str, np.ndarray]:
+        """Series builder: one array per metric, in schema order"""
+        return {rule.name: rule.generate(config, rng, progress, noise) for rule in self.rules}
+
+
+class TemplateCompiler:
+    """Compiles templates once per (template_id, updated_at) and caches the plans"""
+
+    def __init__(self, metric_ranges: Dict[str, Dict[str, Tuple[float, float]]],
+                 ttl_seconds: float = 3600, max_entries: int = 256):
+        # Built-in ranges fill in metrics whose rules give no min/max
+        self.metric_ranges = metric_ranges
+        self._plans = TTLCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+
+    def get_plan(self, template: Dict[str, Any]) -> TemplatePlan:
+        """Cached plan of a synthetic_data_templates row; an update recompiles it"""
+        key = (str(template['template_id']), str(template.get('updated_at')))
+        return self._plans.get_or_load(key, lambda: self.compile(template))
+
+    def compile(self, template: Dict[str, Any]) -> TemplatePlan:
+        """Compile a template row; raises ValueError for rules that cannot be generated"""
+        template_id = str(template['template_id'])
+        user_type = str(template['user_type'])
+        schema = template.get('data_schema') or {}
+        rules = template.get('generation_rules') or {}
+
+        if not isinstance(schema, dict) or not isinstance(rules, dict):
+            raise ValueError("data_schema and generation_rules must be JSON objects")
+
+        compiled = []
+        for name in list(schema) + [name for name in rules if name not in schema]:
+            compiled.append(self._compile_metric(user_type, name, schema.get(name), rules.get(name) or {}))
+
+        if not compiled:
+            raise ValueError("Template defines no metrics")
+
+        logger.info(f"Compiled synthetic template {template_id}: {len(compiled)} metrics")
+        return TemplatePlan(template_id, user_type, compiled, template.get('default_parameters'))
+
+    def _compile_metric(self, user_type: str, name: str, schema_type: Optional[str], rule: Dict[str, Any]) -> MetricRule:
+        if not isinstance(rule, dict):
+            raise ValueError(f"Rule for {name} must be an object")
+
+        unknown = set(rule) - RULE_KEYS
+        if unknown:
+            raise ValueError(f"Unknown rule keys for {name}: {', '.join(sorted(unknown))}")
+
+        if 'value' in rule:
+            low = high = rule['value']
+        elif 'min' in rule and 'max' in rule:
+            low, high = rule['min'], rule['max']
+        elif name in self.metric_ranges.get(user_type, {}):
+            low, high = self.metric_ranges[user_type][name]
+        else:
+            raise ValueError(f"Rule for {name} needs min and max (no built-in range)")
+
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (low, high)) or low > high:
+            raise ValueError(f"Invalid range for {name}: {low}..{high}")
+
+        if schema_type is None:
+            is_integer = isinstance(low, int) and isinstance(high, int)
+        elif str(schema_type).lower() in SCHEMA_TYPES:
+            is_integer = SCHEMA_TYPES[str(schema_type).lower()]
+        else:
+            raise ValueError(f"Unsupported type for {name}: {schema_type}")
+
+        mode = rule.get('mode', 'trend')
+        if mode not in ('trend', 'uniform'):
+            raise ValueError(f"Unsupported mode for {name}: {mode}")
+
+        trend = rule.get('trend')
+        if trend is not None and trend not in TRENDS:
+            raise ValueError(f"Unsupported trend for {name}: {trend}")
+
+        bounds = rule.get('bounds')
+        if bounds is not None:
+            if not isinstance(bounds, list) or len(bounds) != 2:
+                raise ValueError(f"bounds for {name} must be [low, high]")
+            bounds = (float(bounds[0]), float(bounds[1]))
+            if bounds[0] > bounds[1]:
+                raise ValueError(f"Invalid bounds for {name}: {bounds[0]}..{bounds[1]}")
+
+        growth_rate = rule.get('growth_rate', 0.0)
+        if isinstance(growth_rate, bool) or not isinstance(growth_rate, (int, float)) or not -1 < growth_rate < float('inf'):
+            raise ValueError(f"growth_rate for {name} must be a number above -1")
+
+        try:
+            return MetricRule(
+                name=name,
+                is_integer=is_integer,
+                low=float(low),
+                high=float(high),
+                mode=mode,
+                trend=trend,
+                variance=None if rule.get('variance') is None else float(rule['variance']),
+                growth_rate=float(growth_rate),
+                bounds=bounds,
+                decimals=int(rule.get('round', 2))
+            )
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid rule for {name}")
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Auxeira Unit of Work
+One pooled connection and transaction shared by every DatabaseManager call of an API request,
+with per-route counts of connection uses and pool checkouts
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional
+
+from psycopg2.extensions import TRANSACTION_STATUS_INERROR
+
+from utils.request_timing import _escape
+
+logger = logging.getLogger(__name__)
+
+SAVEPOINT = 'unit_of_work'
+
+USES_METRIC_NAME = 'auxeira_db_connection_uses_per_request'
+CHECKOUTS_METRIC_NAME = 'auxeira_db_pool_checkouts_per_request'
+
+
+class RollbackTransaction(Exception):
+    """Raised inside DatabaseManager.transaction() to roll it back; transaction() re-raises it afterwards"""
+
+
+class _SavepointConnection:
+    """Connection handed to DatabaseManager code inside a unit of work
+
+    commit() and rollback() act on the savepoint taken when the code got the connection, so a
+    failed call undoes only its own statements; the transaction itself ends with the unit of work.
+    Everything else is the pooled connection's.
+    """
+
+    def __init__(self, unit: 'UnitOfWork', nested: bool):
+        self._unit = unit
+        self._nested = nested
+
+    def commit(self) -> None:
+        self._unit._mark(self._nested)
+
+    def rollback(self) -> None:
+        self._unit._rollback_to_mark(self._nested)
+
+    def __getattr__(self, name):
+        return getattr(self._unit.conn, name)
+
+
+class UnitOfWork:
+    """Connection checked out lazily on first use and shared until finish() commits or rolls back
+
+    With shared=False every use checks out its own connection as before, and the unit only counts them.
+    """
+
+    def __init__(self, pool, checkout: Callable, shared: bool = True):
+        self.pool = pool
+        self.shared = shared
+        self.conn = None
+        self.uses = 0
+        self.checkouts = 0
+        self.committed = False
+        self._checkout = checkout
+        self._depth = 0
+        # Whether a savepoint exists, and whether the transaction has changed since the newest one
+        self._has_savepoint = False
+        self._marked = True
+        self._after_commit: List[Callable[[], None]] = []
+
+    def _execute(self, statement: str) -> None:
+        with self.conn.cursor() as cursor:
+            cursor.execute(statement)
+
+    def _mark(self, nested: bool) -> None:
+        """Move the savepoint to the current state of the transaction (a commit of the work so far)"""
+        if self._has_savepoint or nested:
+            self._execute(f"RELEASE SAVEPOINT {SAVEPOINT}; SAVEPOINT {SAVEPOINT}")
+        else:
+            self._execute(f"SAVEPOINT {SAVEPOINT}")
+            self._has_savepoint = True
+        self._marked = True
+
+    def _rollback_to_mark(self, nested: bool) -> None:
+        if self._has_savepoint or nested:
+            self._execute(f"ROLLBACK TO SAVEPOINT {SAVEPOINT}")
+        else:
+            # Nothing preceded this use in the transaction, so undoing it all is undoing the use
+            self.conn.rollback()
+        self._marked = True
+
+    @contextmanager
+    def connection(self) -> Iterator[_SavepointConnection]:
+        """The shared connection, with a savepoint marking the state before this use"""
+        if self.conn is None:
+            self.conn = self._checkout()
+            self.checkouts += 1
+        self.uses += 1
+
+        nested = self._depth > 0
+        if nested:
+            # A use inside another use (e.g. while iterating a query) gets a savepoint of its own
+            self._execute(f"SAVEPOINT {SAVEPOINT}")
+        elif not self._marked:
+            self._mark(nested)
+        self._marked = False
+
+        self._depth += 1
+        try:
+            yield _SavepointConnection(self, nested)
+            if self.conn.info.transaction_status == TRANSACTION_STATUS_INERROR:
+                # A statement failed and the caller swallowed the error without rolling back
+                self._rollback_to_mark(nested)
+        except Exception as e:
+            if not self.conn.closed:
+                self._rollback_to_mark(nested)
+            logger.error(f"Database operation failed: {e}")
+            raise
+        finally:
+            self._depth -= 1
+            if nested and not self.conn.closed:
+                self._execute(f"RELEASE SAVEPOINT {SAVEPOINT}")
+                self._marked = False
+
+    def count_checkout(self) -> None:
+        """Count a use that checked out its own connection (shared=False)"""
+        self.uses += 1
+        self.checkouts += 1
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run callback once the transaction commits (e.g. to update in-process caches); dropped on rollback"""
+        self._after_commit.append(callback)
+
+    def finish(self, commit: bool) -> None:
+        """Commit (or roll back) the transaction and return the connection to the pool"""
+        if self.conn is None:
+            return
+        conn, self.conn = self.conn, None
+        try:
+            if commit and conn.info.transaction_status != TRANSACTION_STATUS_INERROR:
+                conn.commit()
+                self.committed = True
+            else:
+                conn.rollback()
+        finally:
+            self.pool.putconn(conn)
+
+        if self.committed:
+            for callback in self._after_commit:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.warning(f"After-commit callback failed: {e}")
+        self._after_commit.clear()
+
+
+_current: ContextVar[Optional[UnitOfWork]] = ContextVar('unit_of_work', default=None)
+
+
+def start_unit_of_work(unit: UnitOfWork) -> UnitOfWork:
+    _current.set(unit)
+    return unit
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    return _current.get()
+
+
+def end_unit_of_work() -> Optional[UnitOfWork]:
+    unit = _current.get()
+    _current.set(None)
+    return unit
+
+
+class _Usage:
+    __slots__ = ('requests', 'uses', 'checkouts', 'max_uses', 'rollbacks')
+
+    def __init__(self):
+        self.requests = 0
+        self.uses = 0
+        self.checkouts = 0
+        self.max_uses = 0
+        self.rollbacks = 0
+
+
+class ConnectionUsage:
+    """Connection uses and pool checkouts per request, by route and method, thread safe"""
+
+    def __init__(self):
+        self._usage: Dict[tuple, _Usage] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, route: str, method: str, unit: UnitOfWork) -> None:
+        with self._lock:
+            usage = self._usage.get((route, method))
+            if usage is None:
+                usage = self._usage[(route, method)] = _Usage()
+            usage.requests += 1
+            usage.uses += unit.uses
+            usage.checkouts += unit.checkouts
+            usage.max_uses = max(usage.max_uses, unit.uses)
+            if unit.checkouts and unit.shared and not unit.committed:
+                usage.rollbacks += 1
+
+    def summary(self) -> List[Dict[str, object]]:
+        """Mean connection uses and pool checkouts per request, by route and method"""
+        with self._lock:
+            return [
+                {
+                    'route': route,
+                    'method': method,
+                    'requests': usage.requests,
+                    'mean_uses': round(usage.uses / usage.requests, 3),
+                    'max_uses': usage.max_uses,
+                    'mean_checkouts': round(usage.checkouts / usage.requests, 3),
+                    'rollbacks': usage.rollbacks
+                }
+                for (route, method), usage in sorted(self._usage.items())
+            ]
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition: per-request uses and checkouts as summaries (sum and count)"""
+        lines = []
+        for name, field, help_text in (
+            (USES_METRIC_NAME, 'uses', 'DatabaseManager connection uses per API request'),
+            (CHECKOUTS_METRIC_NAME, 'checkouts', 'Connection pool checkouts per API request')
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} summary")
+            with self._lock:
+                for (route, method), usage in sorted(self._usage.items()):
+                    labels = f'route="{_escape(route)}",method="{method}"'
+                    lines.append(f"{name}_sum{{{labels}}} {getattr(usage, field)}")
+                    lines.append(f"{name}_count{{{labels}}} {usage.requests}")
+        return '\n'.join(lines) + '\n'